@@ -5,22 +5,65 @@ Demonstrates how to use the provider and strategy abstraction layers.
 """
 
 import asyncio
+import json
 import logging
+import logging.handlers
 
-from src.providers import create_provider
-from src.strategies import create_strategy, MultiStrategyBot
-from src.config import load_settings, get_provider_config
+from src.infrastructure.eventloop import install_uvloop
 
-# Setup logging
+# Setup logging: records are buffered and written to stderr in batches of 100,
+# or immediately for WARNING and above. logging.shutdown() flushes the
+# remainder at exit.
+_console = logging.StreamHandler()
+_console.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    handlers=[
+        logging.handlers.MemoryHandler(
+            capacity=100,
+            flushLevel=logging.WARNING,
+            target=_console
+        )
+    ]
 )
 logger = logging.getLogger(__name__)
 
 
+# (provider name, canonical JSON config) -> connected provider
+_providers = {}
+
+
+def get_connected_provider(provider_name: str, config: dict):
+    """Create and connect a provider, reusing it across examples with the same config."""
+    from src.providers import create_provider
+
+    # Canonical JSON is hashable and also covers nested dict/list values
+    key = (provider_name, json.dumps(config, sort_keys=True))
+    provider = _providers.get(key)
+    if provider is None:
+        provider = create_provider(provider_name, config)
+        provider.connect()
+        _providers[key] = provider
+    return provider
+
+
+def disconnect_providers():
+    """Disconnect every provider created by get_connected_provider()."""
+    while _providers:
+        _, provider = _providers.popitem()
+        try:
+            provider.disconnect()
+        except Exception as e:
+            logger.warning(f"Error disconnecting provider: {e}")
+
+
 async def example_single_strategy():
     """Example: Single strategy with single provider."""
+    from src.strategies import create_strategy
+    from src.config import load_settings, get_provider_config
+
     logger.info("=" * 70)
     logger.info("EXAMPLE 1: Single Strategy (Binary Arbitrage on Polymarket)")
     logger.info("=" * 70)
@@ -30,8 +73,7 @@ async def example_single_strategy():
 
     # Create Polymarket provider
     provider_config = get_provider_config(settings)
-    provider = create_provider("polymarket", provider_config)
-    provider.connect()
+    provider = get_connected_provider("polymarket", provider_config)
 
     # Create binary arbitrage strategy
     strategy_config = {
@@ -56,6 +98,9 @@ async def example_single_strategy():
 
 async def example_multi_strategy():
     """Example: Multiple strategies on same provider."""
+    from src.strategies import create_strategy, MultiStrategyBot
+    from src.config import load_settings, get_provider_config
+
     logger.info("=" * 70)
     logger.info("EXAMPLE 2: Multi-Strategy Bot (Multiple strategies on Polymarket)")
     logger.info("=" * 70)
@@ -65,8 +110,7 @@ async def example_multi_strategy():
 
     # Create Polymarket provider
     provider_config = get_provider_config(settings)
-    provider = create_provider("polymarket", provider_config)
-    provider.connect()
+    provider = get_connected_provider("polymarket", provider_config)
 
     # Create multiple strategies
     strategies = []
@@ -112,6 +156,9 @@ async def example_multi_strategy():
 
 async def example_cross_provider():
     """Example: Different strategies on different providers."""
+    from src.strategies import create_strategy, MultiStrategyBot
+    from src.config import load_settings
+
     logger.info("=" * 70)
     logger.info("EXAMPLE 3: Cross-Provider Strategies")
     logger.info("=" * 70)
@@ -127,8 +174,7 @@ async def example_cross_provider():
         "yes_token_id": settings.yes_token_id,
         "no_token_id": settings.no_token_id,
     }
-    poly_provider = create_provider("polymarket", poly_config)
-    poly_provider.connect()
+    poly_provider = get_connected_provider("polymarket", poly_config)
 
     # Create Luno provider
     luno_config = {
@@ -136,8 +182,7 @@ async def example_cross_provider():
         "api_key_secret": settings.luno_api_key_secret,
         "default_pair": "XBTZAR",
     }
-    luno_provider = create_provider("luno", luno_config)
-    luno_provider.connect()
+    luno_provider = get_connected_provider("luno", luno_config)
 
     # Strategy on Polymarket: Binary arbitrage
     poly_strategy = create_strategy("binary_arbitrage", poly_provider, {
@@ -169,11 +214,17 @@ if __name__ == "__main__":
     logger.info("MULTI-PROVIDER MULTI-STRATEGY BOT EXAMPLES")
     logger.info("=" * 70 + "\n")
 
-    # Choose which example to run
-    asyncio.run(example_single_strategy())
+    # Use uvloop when available (falls back to the default loop)
+    install_uvloop()
+
+    try:
+        # Choose which example to run
+        asyncio.run(example_single_strategy())
 
-    # Or run multi-strategy example:
-    # asyncio.run(example_multi_strategy())
+        # Or run multi-strategy example:
+        # asyncio.run(example_multi_strategy())
 
-    # Or run cross-provider example:
-    # asyncio.run(example_cross_provider())
+        # Or run cross-provider example:
+        # asyncio.run(example_cross_provider())
+    finally:
+        disconnect_providers()
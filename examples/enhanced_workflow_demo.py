@@ -13,7 +13,10 @@ Run with:
 """
 
 import asyncio
+from collections import Counter, deque
+
 from src.infrastructure.factory import create_infrastructure
+from src.infrastructure.eventloop import install_uvloop
 from src.workflow.enhanced_executor import EnhancedWorkflowExecutor
 from src.infrastructure.logging import get_logger
 
@@ -77,6 +80,12 @@ DEMO_WORKFLOW = {
     ]
 }
 
+# Upper bound on events kept in memory by the capture handlers
+MAX_CAPTURED_EVENTS = 10_000
+
+# Parsed once and shared by every executor below
+COMPILED_DEMO_WORKFLOW = EnhancedWorkflowExecutor.compile(DEMO_WORKFLOW)
+
 
 async def demo_basic_execution():
     """Demonstrate basic enhanced workflow execution."""
@@ -85,28 +94,29 @@ async def demo_basic_execution():
     # Create infrastructure
     infra = await create_infrastructure("development")
 
-    # Subscribe to events
-    events_received = []
+    # Create enhanced executor and start initializing it right away
+    executor = EnhancedWorkflowExecutor(
+        workflow=COMPILED_DEMO_WORKFLOW,
+        infra=infra,
+        workflow_id="demo_workflow_001",
+        bot_id="bot_demo",
+        strategy_id="demo_strategy"
+    )
+    init_task = asyncio.create_task(executor.initialize())
+
+    # Subscribe to events (keep only the event types we report on, bounded)
+    event_types: deque[str] = deque(maxlen=MAX_CAPTURED_EVENTS)
 
     async def capture_event(event):
-        events_received.append(event)
         event_type = event.get('type')
         node_id = event.get('node_id', 'N/A')
+        event_types.append(event_type)
         print(f"  Event: {event_type:25s} | Node: {node_id}")
 
     await infra.events.subscribe("workflow_events", capture_event)
 
-    # Create enhanced executor
-    executor = EnhancedWorkflowExecutor(
-        workflow=DEMO_WORKFLOW,
-        infra=infra,
-        workflow_id="demo_workflow_001",
-        bot_id="bot_demo",
-        strategy_id="demo_strategy"
-    )
-
-    # Initialize and execute
-    await executor.initialize()
+    # Initialization must finish before the first execution
+    await init_task
 
     print("Executing workflow...\n")
     result = await executor.execute()
@@ -115,16 +125,11 @@ async def demo_basic_execution():
     print(f"  Status: {result['status']}")
     print(f"  Duration: {result['duration']:.2f}ms")
     print(f"  Nodes executed: {len(result['results'])}")
-    print(f"  Events emitted: {len(events_received)}")
+    print(f"  Events emitted: {len(event_types)}")
 
     # Show event types
-    event_types = {}
-    for event in events_received:
-        event_type = event['type']
-        event_types[event_type] = event_types.get(event_type, 0) + 1
-
     print(f"\n  Event breakdown:")
-    for event_type, count in event_types.items():
+    for event_type, count in Counter(event_types).items():
         print(f"    {event_type}: {count}")
 
     await infra.close()
@@ -141,7 +146,7 @@ async def demo_emergency_halt():
 
     # Create executor
     executor = EnhancedWorkflowExecutor(
-        workflow=DEMO_WORKFLOW,
+        workflow=COMPILED_DEMO_WORKFLOW,
         infra=infra,
         workflow_id="demo_workflow_002",
         bot_id="bot_demo"
@@ -185,7 +190,7 @@ async def demo_state_persistence():
 
     # Create and execute workflow
     executor = EnhancedWorkflowExecutor(
-        workflow=DEMO_WORKFLOW,
+        workflow=COMPILED_DEMO_WORKFLOW,
         infra=infra,
         workflow_id="demo_workflow_003",
         bot_id="bot_demo"
@@ -232,7 +237,7 @@ async def demo_correlation_id_tracking():
 
     # Create executor
     executor = EnhancedWorkflowExecutor(
-        workflow=DEMO_WORKFLOW,
+        workflow=COMPILED_DEMO_WORKFLOW,
         infra=infra,
         workflow_id="demo_workflow_004",
         bot_id="bot_demo"
@@ -262,39 +267,45 @@ async def demo_concurrent_workflows():
     # Create infrastructure
     infra = await create_infrastructure("development")
 
-    async def run_workflow(workflow_id: str, delay: float):
-        """Run a workflow with a delay."""
+    async def prepare_workflow(workflow_id: str) -> EnhancedWorkflowExecutor:
+        """Create and initialize a workflow executor."""
         executor = EnhancedWorkflowExecutor(
-            workflow=DEMO_WORKFLOW,
+            workflow=COMPILED_DEMO_WORKFLOW,
             infra=infra,
             workflow_id=workflow_id,
             bot_id="bot_demo"
         )
-
         await executor.initialize()
+        return executor
+
+    async def run_workflow(executor: EnhancedWorkflowExecutor, delay: float):
+        """Run a prepared workflow after a delay."""
         await asyncio.sleep(delay)
 
         result = await executor.execute()
 
-        print(f"  Workflow {workflow_id}: {result['status']}")
+        print(f"  Workflow {executor.workflow_id}: {result['status']}")
 
         return executor.execution_id
 
+    workflow_ids = ["concurrent_001", "concurrent_002", "concurrent_003"]
+    delays = [0.1, 0.15, 0.12]
+
+    # Initialize all workflows together before any of them runs
+    executors = await asyncio.gather(
+        *(prepare_workflow(wf_id) for wf_id in workflow_ids)
+    )
+
     print("Running 3 workflows concurrently...\n")
 
     # Run workflows concurrently
     execution_ids = await asyncio.gather(
-        run_workflow("concurrent_001", 0.1),
-        run_workflow("concurrent_002", 0.15),
-        run_workflow("concurrent_003", 0.12)
+        *(run_workflow(executor, delay) for executor, delay in zip(executors, delays))
     )
 
     print(f"\nAll workflows completed!")
     print(f"Each workflow has its own correlation ID:")
-    for wf_id, exec_id in zip(
-        ["concurrent_001", "concurrent_002", "concurrent_003"],
-        execution_ids
-    ):
+    for wf_id, exec_id in zip(workflow_ids, execution_ids):
         print(f"  {wf_id}: {exec_id}")
 
     await infra.close()
@@ -320,4 +331,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
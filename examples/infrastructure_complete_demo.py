@@ -14,6 +14,7 @@ Run with:
 import asyncio
 import random
 from src.infrastructure.factory import create_infrastructure
+from src.infrastructure.eventloop import install_uvloop
 from src.infrastructure.logging import get_logger, set_correlation_id
 
 logger = get_logger(__name__)
@@ -35,40 +36,48 @@ async def demo_infrastructure_creation():
     print("\n✓ Development infrastructure created\n")
 
 
-async def demo_state_and_events():
+async def demo_state_and_events(infra):
     """Demonstrate state and events working together"""
     print("\n=== State & Events Integration Demo ===\n")
 
-    infra = await create_infrastructure("development")
+    # Store state and publish events
+    symbols = ["BTC-USDT", "ETH-USDT", "SOL-USDT"]
 
     # Subscribe to events
     events_received = []
+    all_received = asyncio.Event()
 
     async def price_handler(event):
-        logger.info("price_event_received", event=event)
+        logger.info("price_event_received", payload=event)
         events_received.append(event)
+        if len(events_received) >= len(symbols):
+            all_received.set()
 
     await infra.events.subscribe("prices", price_handler)
 
-    # Store state and publish events
-    symbols = ["BTC-USDT", "ETH-USDT", "SOL-USDT"]
-
-    for symbol in symbols:
-        price = random.uniform(1000, 60000)
+    # Generate all demo prices up front, before fanning out
+    prices = {symbol: random.uniform(1000, 60000) for symbol in symbols}
 
+    async def store_and_publish(symbol: str, price: float):
         # Store in state
         await infra.state.set(f"price:{symbol}", price)
         logger.info("price_stored", symbol=symbol, price=price)
 
-        # Publish event
+        # Publish event (after the state write for this symbol)
         await infra.events.publish("prices", {
             "symbol": symbol,
             "price": price,
             "timestamp": "2024-01-24T10:00:00Z"
         })
 
-    # Wait for events
-    await asyncio.sleep(0.1)
+    # All symbols are processed concurrently
+    await asyncio.gather(*(store_and_publish(symbol, price) for symbol, price in prices.items()))
+
+    # Wait until every published event has been handled
+    try:
+        await asyncio.wait_for(all_received.wait(), timeout=1.0)
+    except asyncio.TimeoutError:
+        logger.warning("price_events_missing", received=len(events_received))
 
     # Retrieve from state
     btc_price = await infra.state.get("price:BTC-USDT")
@@ -77,15 +86,11 @@ async def demo_state_and_events():
 
     print("\n✓ State and events working together\n")
 
-    await infra.close()
 
-
-async def demo_emergency_controls():
+async def demo_emergency_controls(infra):
     """Demonstrate emergency controls and risk limits"""
     print("\n=== Emergency Controls Demo ===\n")
 
-    infra = await create_infrastructure("development")
-
     # Subscribe to emergency events
     async def on_emergency_event(event):
         logger.critical(
@@ -139,19 +144,20 @@ async def demo_emergency_controls():
     print(f"  Can trade: {status['can_trade']}")
     print(f"  Risk limits tracked: {len(status['risk_limits'])}")
 
-    print("\n✓ Emergency controls working\n")
+    # Leave the shared controller in NORMAL state for the demos that follow
+    await infra.emergency.resume("Emergency demo complete")
 
-    await infra.close()
+    print("\n✓ Emergency controls working\n")
 
 
-async def demo_circuit_breakers():
+async def demo_circuit_breakers(infra):
     """Demonstrate circuit breakers protecting services"""
     print("\n=== Circuit Breaker Demo ===\n")
 
-    infra = await create_infrastructure("development")
+    loop = asyncio.get_running_loop()
 
-    # Create circuit breaker for external API
-    api_breaker = infra.create_circuit_breaker("exchange_api")
+    # Create circuit breaker for external API (timed on the loop clock)
+    api_breaker = infra.create_circuit_breaker("exchange_api", clock=loop.time)
 
     call_count = 0
 
@@ -182,14 +188,12 @@ async def demo_circuit_breakers():
     print(f"\nCircuit breaker state: {api_breaker.state.value}")
     print("✓ Circuit breaker protected against cascading failures\n")
 
-    await infra.close()
 
-
-async def demo_realistic_trading_flow():
+async def demo_realistic_trading_flow(infra):
     """Demonstrate realistic trading bot flow"""
     print("\n=== Realistic Trading Flow Demo ===\n")
 
-    infra = await create_infrastructure("development")
+    loop = asyncio.get_running_loop()
 
     # Set correlation ID for request tracing
     execution_id = "exec_abc123"
@@ -224,7 +228,8 @@ async def demo_realistic_trading_flow():
     print("\n3. Creating circuit breaker for exchange API...")
     api_breaker = infra.create_circuit_breaker(
         "exchange_api",
-        failure_threshold=3
+        failure_threshold=3,
+        clock=loop.time
     )
     print("   ✓ Circuit breaker ready")
 
@@ -277,15 +282,11 @@ async def demo_realistic_trading_flow():
 
     print("\n✓ Complete trading flow executed successfully\n")
 
-    await infra.close()
-
 
-async def demo_health_check():
+async def demo_health_check(infra):
     """Demonstrate infrastructure health check"""
     print("\n=== Health Check Demo ===\n")
 
-    infra = await create_infrastructure("development")
-
     # Perform health check
     health = await infra.health_check()
 
@@ -301,8 +302,6 @@ async def demo_health_check():
 
     print("\n✓ Health check complete\n")
 
-    await infra.close()
-
 
 async def demo_state_persistence():
     """Demonstrate emergency state persistence"""
@@ -347,11 +346,19 @@ async def main():
     print("="*60)
 
     await demo_infrastructure_creation()
-    await demo_state_and_events()
-    await demo_emergency_controls()
-    await demo_circuit_breakers()
-    await demo_realistic_trading_flow()
-    await demo_health_check()
+
+    # One infrastructure instance shared by the integration demos
+    infra = await create_infrastructure("development")
+    try:
+        await demo_state_and_events(infra)
+        await demo_emergency_controls(infra)
+        await demo_circuit_breakers(infra)
+        await demo_realistic_trading_flow(infra)
+        await demo_health_check(infra)
+    finally:
+        await infra.close()
+
+    # Needs its own instances to simulate a restart
     await demo_state_persistence()
 
     print("="*60)
@@ -360,4 +367,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
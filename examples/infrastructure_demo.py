@@ -16,6 +16,7 @@ Run with:
 import asyncio
 import argparse
 from datetime import timedelta
+from src.infrastructure.eventloop import install_uvloop
 from src.infrastructure.state import create_state_store
 
 
@@ -143,59 +144,65 @@ async def demo_realistic_use_case(store):
     bot_id = "bot_001"
     strategy_id = "arb_btc"
 
-    # 1. Store bot configuration
-    print("\n1. Store Bot Configuration:")
-    await store.set(f"bot:{bot_id}:config", {
-        "name": "BTC Arbitrage Bot",
-        "enabled": True,
-        "capital": 10000.0,
-        "max_position_size": 1000.0
-    })
-    print("   Bot config stored")
+    # Build keys once and reuse them for every operation on this bot
+    config_key = f"bot:{bot_id}:config"
+    metrics_key = f"strategy:{strategy_id}:metrics"
+    trade_count_key = f"strategy:{strategy_id}:trade_count"
+    daily_loss_key = f"risk:{bot_id}:daily_loss"
 
-    # 2. Track strategy metrics
+    # 1-2. Store bot configuration and strategy metrics in one batch write
+    print("\n1. Store Bot Configuration:")
     print("\n2. Track Strategy Metrics:")
-    await store.set(f"strategy:{strategy_id}:metrics", {
-        "total_trades": 42,
-        "successful_trades": 35,
-        "total_pnl": 234.56,
-        "win_rate": 0.833
+    await store.set_many({
+        config_key: {
+            "name": "BTC Arbitrage Bot",
+            "enabled": True,
+            "capital": 10000.0,
+            "max_position_size": 1000.0
+        },
+        metrics_key: {
+            "total_trades": 42,
+            "successful_trades": 35,
+            "total_pnl": 234.56,
+            "win_rate": 0.833
+        }
     })
-    print("   Strategy metrics stored")
+    print("   Bot config and strategy metrics stored")
+
+    # 3-5. Independent operations, issued concurrently
+    execution_id = "exec_abc123"
+    trades, _, daily_loss = await asyncio.gather(
+        # 3. Increment trade counter
+        store.increment(trade_count_key),
+        # 4. Store execution state (with TTL for cleanup)
+        store.set(
+            f"execution:{execution_id}",
+            {
+                "bot_id": bot_id,
+                "strategy_id": strategy_id,
+                "started_at": "2024-01-24T10:00:00Z",
+                "status": "running",
+                "nodes_completed": ["price_check", "spread_calc"]
+            },
+            ttl=timedelta(hours=1)  # Auto-cleanup old executions
+        ),
+        # 5. Check daily loss limit
+        store.get_or_default(daily_loss_key, 0.0)
+    )
 
-    # 3. Increment trade counter
     print("\n3. Execute Trade (increment counter):")
-    trades = await store.increment(f"strategy:{strategy_id}:trade_count")
     print(f"   Total trades: {trades}")
 
-    # 4. Store execution state (with TTL for cleanup)
     print("\n4. Store Execution State:")
-    execution_id = "exec_abc123"
-    await store.set(
-        f"execution:{execution_id}",
-        {
-            "bot_id": bot_id,
-            "strategy_id": strategy_id,
-            "started_at": "2024-01-24T10:00:00Z",
-            "status": "running",
-            "nodes_completed": ["price_check", "spread_calc"]
-        },
-        ttl=timedelta(hours=1)  # Auto-cleanup old executions
-    )
     print(f"   Execution state stored (TTL: 1 hour)")
 
-    # 5. Check daily loss limit
     print("\n5. Risk Management (daily loss tracking):")
-    daily_loss = await store.get_or_default(
-        f"risk:{bot_id}:daily_loss",
-        0.0
-    )
     print(f"   Daily loss: ${daily_loss}")
 
     # Simulate a losing trade
     new_loss = -50.0
     await store.set(
-        f"risk:{bot_id}:daily_loss",
+        daily_loss_key,
         daily_loss + new_loss,
         ttl=timedelta(days=1)  # Reset at midnight
     )
@@ -204,13 +211,13 @@ async def demo_realistic_use_case(store):
     # 6. Retrieve all bot state
     print("\n6. Retrieve Complete Bot State:")
     state = await store.get_many([
-        f"bot:{bot_id}:config",
-        f"strategy:{strategy_id}:metrics",
-        f"risk:{bot_id}:daily_loss"
+        config_key,
+        metrics_key,
+        daily_loss_key
     ])
-    print(f"   Bot enabled: {state[f'bot:{bot_id}:config']['enabled']}")
-    print(f"   Win rate: {state[f'strategy:{strategy_id}:metrics']['win_rate']:.1%}")
-    print(f"   Daily loss: ${state[f'risk:{bot_id}:daily_loss']}")
+    print(f"   Bot enabled: {state[config_key]['enabled']}")
+    print(f"   Win rate: {state[metrics_key]['win_rate']:.1%}")
+    print(f"   Daily loss: ${state[daily_loss_key]}")
 
 
 async def main():
@@ -267,4 +274,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
@@ -20,6 +20,7 @@ from src.infrastructure.resilience import (
     TimeoutContext,
     wait_for_any
 )
+from src.infrastructure.eventloop import install_uvloop
 from src.infrastructure.logging import configure_logging, get_logger
 
 logger = get_logger(__name__)
@@ -29,7 +30,7 @@ logger = get_logger(__name__)
 # Retry Demos
 # ============================================================================
 
-def demo_basic_retry():
+async def demo_basic_retry():
     """Demonstrate basic retry with exponential backoff"""
     print("\n=== Basic Retry Demo ===\n")
 
@@ -47,18 +48,15 @@ def demo_basic_retry():
 
         return {"price": 50234.56}
 
-    async def run():
-        try:
-            result = await flaky_api_call()
-            logger.info("api_call_succeeded", result=result, total_attempts=call_count)
-        except RetryExhausted as e:
-            logger.error("api_call_failed", error=str(e))
-
-    asyncio.run(run())
+    try:
+        result = await flaky_api_call()
+        logger.info("api_call_succeeded", result=result, total_attempts=call_count)
+    except RetryExhausted as e:
+        logger.error("api_call_failed", error=str(e))
     print(f"\n  ✓ API call succeeded after {call_count} attempts\n")
 
 
-def demo_retry_config():
+async def demo_retry_config():
     """Demonstrate retry with shared configuration"""
     print("\n=== Retry Config Demo ===\n")
 
@@ -83,18 +81,15 @@ def demo_retry_config():
             raise ConnectionError("Network error")
         return {symbol: random.uniform(1000, 60000)}
 
-    async def run():
-        try:
-            result = await fetch_price("BTC-USDT")
-            logger.info("price_fetched", result=result)
-        except RetryExhausted as e:
-            logger.error("price_fetch_failed", error=str(e))
-
-    asyncio.run(run())
+    try:
+        result = await fetch_price("BTC-USDT")
+        logger.info("price_fetched", result=result)
+    except RetryExhausted as e:
+        logger.error("price_fetch_failed", error=str(e))
     print("  ✓ Price fetch completed (may have retried)\n")
 
 
-def demo_selective_retry():
+async def demo_selective_retry():
     """Demonstrate retrying only specific exceptions"""
     print("\n=== Selective Retry Demo ===\n")
 
@@ -116,16 +111,13 @@ def demo_selective_retry():
 
         return {"status": "success"}
 
-    async def run():
-        try:
-            result = await validate_and_fetch()
-            logger.info("operation_succeeded", result=result)
-        except ValueError as e:
-            logger.error("validation_failed", error=str(e))
-        except RetryExhausted as e:
-            logger.error("operation_failed_after_retries", error=str(e))
-
-    asyncio.run(run())
+    try:
+        result = await validate_and_fetch()
+        logger.info("operation_succeeded", result=result)
+    except ValueError as e:
+        logger.error("validation_failed", error=str(e))
+    except RetryExhausted as e:
+        logger.error("operation_failed_after_retries", error=str(e))
     print("  ✓ Selective retry completed\n")
 
 
@@ -133,7 +125,7 @@ def demo_selective_retry():
 # Circuit Breaker Demos
 # ============================================================================
 
-def demo_circuit_breaker_basic():
+async def demo_circuit_breaker_basic():
     """Demonstrate circuit breaker preventing cascading failures"""
     print("\n=== Circuit Breaker Demo ===\n")
 
@@ -154,30 +146,27 @@ def demo_circuit_breaker_basic():
             raise ConnectionError("API is down")
         return {"status": "ok"}
 
-    async def run():
-        # First 3 calls will fail and open circuit
-        for i in range(3):
-            try:
-                await breaker.call(unreliable_api)
-            except ConnectionError:
-                logger.warning("api_call_failed", attempt=i+1)
-
-        logger.info("circuit_breaker_state", state=breaker.state.value)
-
-        # Next calls will fail fast (circuit is open)
+    # First 3 calls will fail and open circuit
+    for i in range(3):
         try:
             await breaker.call(unreliable_api)
-        except CircuitBreakerOpen as e:
-            logger.warning("circuit_breaker_open", message=str(e))
+        except ConnectionError:
+            logger.warning("api_call_failed", attempt=i+1)
 
-        print(f"\n  Circuit State: {breaker.state.value.upper()}")
-        print(f"  Failures: {breaker._failure_count}")
-        print("  ✓ Circuit breaker prevented additional failed attempts\n")
+    logger.info("circuit_breaker_state", state=breaker.state.value)
 
-    asyncio.run(run())
+    # Next calls will fail fast (circuit is open)
+    try:
+        await breaker.call(unreliable_api)
+    except CircuitBreakerOpen as e:
+        logger.warning("circuit_breaker_open", message=str(e))
 
+    print(f"\n  Circuit State: {breaker.state.value.upper()}")
+    print(f"  Failures: {breaker._failure_count}")
+    print("  ✓ Circuit breaker prevented additional failed attempts\n")
 
-def demo_circuit_breaker_recovery():
+
+async def demo_circuit_breaker_recovery():
     """Demonstrate circuit breaker recovery"""
     print("\n=== Circuit Breaker Recovery Demo ===\n")
 
@@ -199,41 +188,38 @@ def demo_circuit_breaker_recovery():
             raise ConnectionError("Service unavailable")
         return {"status": "ok", "call": call_count}
 
-    async def run():
-        # Open circuit (2 failures)
-        for i in range(2):
-            try:
-                await breaker.call(recovering_api)
-            except ConnectionError:
-                logger.warning("api_failure", attempt=i+1)
-
-        print(f"\n  Circuit opened after {call_count} failures")
-        logger.info("circuit_state", state=breaker.state.value)
+    # Open circuit (2 failures)
+    for i in range(2):
+        try:
+            await breaker.call(recovering_api)
+        except ConnectionError:
+            logger.warning("api_failure", attempt=i+1)
 
-        # Wait for timeout (circuit goes half-open)
-        await asyncio.sleep(1.5)
-        print("  Waiting for timeout...")
+    print(f"\n  Circuit opened after {call_count} failures")
+    logger.info("circuit_state", state=breaker.state.value)
 
-        # Try again (should succeed and start closing)
-        try:
-            result = await breaker.call(recovering_api)
-            logger.info("api_recovery_attempt_1", result=result)
-            print("  First recovery attempt succeeded (half-open)")
+    # Wait for timeout (circuit goes half-open)
+    await asyncio.sleep(1.5)
+    print("  Waiting for timeout...")
 
-            result = await breaker.call(recovering_api)
-            logger.info("api_recovery_attempt_2", result=result)
-            print("  Second recovery attempt succeeded")
+    # Try again (should succeed and start closing)
+    try:
+        result = await breaker.call(recovering_api)
+        logger.info("api_recovery_attempt_1", result=result)
+        print("  First recovery attempt succeeded (half-open)")
 
-        except CircuitBreakerOpen as e:
-            logger.error("still_open", error=str(e))
+        result = await breaker.call(recovering_api)
+        logger.info("api_recovery_attempt_2", result=result)
+        print("  Second recovery attempt succeeded")
 
-        print(f"  Circuit State: {breaker.state.value.upper()}")
-        print("  ✓ Circuit breaker recovered\n")
+    except CircuitBreakerOpen as e:
+        logger.error("still_open", error=str(e))
 
-    asyncio.run(run())
+    print(f"  Circuit State: {breaker.state.value.upper()}")
+    print("  ✓ Circuit breaker recovered\n")
 
 
-def demo_circuit_breaker_stats():
+async def demo_circuit_breaker_stats():
     """Demonstrate circuit breaker statistics"""
     print("\n=== Circuit Breaker Stats Demo ===\n")
 
@@ -244,35 +230,32 @@ def demo_circuit_breaker_stats():
             raise ConnectionError("Random failure")
         return {"data": "some data"}
 
-    async def run():
-        # Make some calls
-        for i in range(10):
-            try:
-                await breaker.call(api_call)
-                logger.info("call_succeeded", attempt=i+1)
-            except ConnectionError:
-                logger.warning("call_failed", attempt=i+1)
-            except CircuitBreakerOpen:
-                logger.warning("circuit_open", attempt=i+1)
-                break
-
-        # Get stats
-        stats = breaker.get_stats()
-        print(f"\n  Circuit Breaker: {stats['name']}")
-        print(f"  State: {stats['state']}")
-        print(f"  Total Failures: {stats['failure_count']}")
-        print(f"  Recent Failures: {stats['recent_failures']}")
-        print(f"  Threshold: {stats['config']['failure_threshold']}")
-        print("  ✓ Stats retrieved\n")
-
-    asyncio.run(run())
+    # Make some calls
+    for i in range(10):
+        try:
+            await breaker.call(api_call)
+            logger.info("call_succeeded", attempt=i+1)
+        except ConnectionError:
+            logger.warning("call_failed", attempt=i+1)
+        except CircuitBreakerOpen:
+            logger.warning("circuit_open", attempt=i+1)
+            break
+
+    # Get stats
+    stats = breaker.get_stats()
+    print(f"\n  Circuit Breaker: {stats['name']}")
+    print(f"  State: {stats['state']}")
+    print(f"  Total Failures: {stats['failure_count']}")
+    print(f"  Recent Failures: {stats['recent_failures']}")
+    print(f"  Threshold: {stats['config']['failure_threshold']}")
+    print("  ✓ Stats retrieved\n")
 
 
 # ============================================================================
 # Timeout Demos
 # ============================================================================
 
-def demo_basic_timeout():
+async def demo_basic_timeout():
     """Demonstrate basic timeout"""
     print("\n=== Basic Timeout Demo ===\n")
 
@@ -284,19 +267,16 @@ def demo_basic_timeout():
         logger.info("fetch_completed")
         return {"price": 50234.56}
 
-    async def run():
-        try:
-            result = await fetch_with_timeout()
-            logger.info("operation_succeeded", result=result)
-            print("  ✓ Operation completed within timeout\n")
-        except TimeoutError as e:
-            logger.error("operation_timeout", error=str(e))
-            print(f"  ✗ Operation timed out: {e}\n")
-
-    asyncio.run(run())
+    try:
+        result = await fetch_with_timeout()
+        logger.info("operation_succeeded", result=result)
+        print("  ✓ Operation completed within timeout\n")
+    except TimeoutError as e:
+        logger.error("operation_timeout", error=str(e))
+        print(f"  ✗ Operation timed out: {e}\n")
 
 
-def demo_timeout_exceeded():
+async def demo_timeout_exceeded():
     """Demonstrate timeout being exceeded"""
     print("\n=== Timeout Exceeded Demo ===\n")
 
@@ -306,47 +286,41 @@ def demo_timeout_exceeded():
         await asyncio.sleep(2.0)  # Will timeout
         return {"status": "synced"}
 
-    async def run():
-        try:
-            result = await slow_operation()
-            logger.info("sync_completed", result=result)
-        except TimeoutError as e:
-            logger.warning("sync_timeout", error=str(e), timeout=e.seconds)
-            print(f"  ✗ Operation timed out after {e.seconds}s")
-            print("  ✓ Timeout detected and handled\n")
-
-    asyncio.run(run())
+    try:
+        result = await slow_operation()
+        logger.info("sync_completed", result=result)
+    except TimeoutError as e:
+        logger.warning("sync_timeout", error=str(e), timeout=e.seconds)
+        print(f"  ✗ Operation timed out after {e.seconds}s")
+        print("  ✓ Timeout detected and handled\n")
 
 
-def demo_timeout_context():
+async def demo_timeout_context():
     """Demonstrate timeout context for multiple operations"""
     print("\n=== Timeout Context Demo ===\n")
 
-    async def run():
-        try:
-            async with TimeoutContext(2.0, "multi_price_fetch"):
-                logger.info("fetching_multiple_prices")
-
-                # All operations must complete within 2 seconds total
-                await asyncio.sleep(0.3)  # BTC
-                logger.info("price_fetched", symbol="BTC")
+    try:
+        async with TimeoutContext(2.0, "multi_price_fetch"):
+            logger.info("fetching_multiple_prices")
 
-                await asyncio.sleep(0.3)  # ETH
-                logger.info("price_fetched", symbol="ETH")
+            # All operations must complete within 2 seconds total
+            await asyncio.sleep(0.3)  # BTC
+            logger.info("price_fetched", symbol="BTC")
 
-                await asyncio.sleep(0.3)  # SOL
-                logger.info("price_fetched", symbol="SOL")
+            await asyncio.sleep(0.3)  # ETH
+            logger.info("price_fetched", symbol="ETH")
 
-                print("  ✓ All prices fetched within timeout\n")
+            await asyncio.sleep(0.3)  # SOL
+            logger.info("price_fetched", symbol="SOL")
 
-        except TimeoutError as e:
-            logger.error("batch_fetch_timeout", error=str(e))
-            print(f"  ✗ Batch operation timed out\n")
+            print("  ✓ All prices fetched within timeout\n")
 
-    asyncio.run(run())
+    except TimeoutError as e:
+        logger.error("batch_fetch_timeout", error=str(e))
+        print(f"  ✗ Batch operation timed out\n")
 
 
-def demo_race_condition():
+async def demo_race_condition():
     """Demonstrate racing multiple API calls"""
     print("\n=== Race Condition Demo (wait_for_any) ===\n")
 
@@ -362,35 +336,32 @@ def demo_race_condition():
         await asyncio.sleep(random.uniform(0.5, 1.5))
         return {"exchange": "kraken", "price": 50221.34}
 
-    async def run():
-        logger.info("starting_race", exchanges=3)
+    logger.info("starting_race", exchanges=3)
 
-        tasks = [
-            asyncio.create_task(fetch_from_binance()),
-            asyncio.create_task(fetch_from_coinbase()),
-            asyncio.create_task(fetch_from_kraken())
-        ]
+    tasks = [
+        asyncio.create_task(fetch_from_binance()),
+        asyncio.create_task(fetch_from_coinbase()),
+        asyncio.create_task(fetch_from_kraken())
+    ]
 
-        # Use whichever responds first
-        result, remaining = await wait_for_any(tasks, timeout_seconds=3.0)
+    # Use whichever responds first
+    result, remaining = await wait_for_any(tasks, timeout_seconds=3.0)
 
-        logger.info("race_winner", result=result)
-        print(f"\n  Winner: {result['exchange']}")
-        print(f"  Price: ${result['price']:,.2f}")
-        print("  ✓ Used fastest API response\n")
+    logger.info("race_winner", result=result)
+    print(f"\n  Winner: {result['exchange']}")
+    print(f"  Price: ${result['price']:,.2f}")
+    print("  ✓ Used fastest API response\n")
 
-        # Cancel remaining
-        for task in remaining:
-            task.cancel()
-
-    asyncio.run(run())
+    # Cancel remaining
+    for task in remaining:
+        task.cancel()
 
 
 # ============================================================================
 # Integration Demos
 # ============================================================================
 
-def demo_full_resilience_stack():
+async def demo_full_resilience_stack():
     """Demonstrate combining retry, circuit breaker, and timeout"""
     print("\n=== Full Resilience Stack Demo ===\n")
 
@@ -420,25 +391,22 @@ def demo_full_resilience_stack():
 
         return {"status": "success", "data": "important data"}
 
-    async def run():
-        try:
-            result = await breaker.call(fully_protected_api_call)
-            logger.info("api_call_succeeded", result=result, total_attempts=call_count)
-
-            print("\n  Resilience Stack Applied:")
-            print(f"    ✓ Retry: {call_count} attempts")
-            print(f"    ✓ Timeout: Operation completed in time")
-            print(f"    ✓ Circuit Breaker: {breaker.state.value}")
-            print("\n  ✓ Full resilience stack working\n")
+    try:
+        result = await breaker.call(fully_protected_api_call)
+        logger.info("api_call_succeeded", result=result, total_attempts=call_count)
 
-        except Exception as e:
-            logger.error("api_call_failed", error=str(e))
-            print(f"\n  ✗ Operation failed: {e}\n")
+        print("\n  Resilience Stack Applied:")
+        print(f"    ✓ Retry: {call_count} attempts")
+        print(f"    ✓ Timeout: Operation completed in time")
+        print(f"    ✓ Circuit Breaker: {breaker.state.value}")
+        print("\n  ✓ Full resilience stack working\n")
 
-    asyncio.run(run())
+    except Exception as e:
+        logger.error("api_call_failed", error=str(e))
+        print(f"\n  ✗ Operation failed: {e}\n")
 
 
-def demo_realistic_trading_scenario():
+async def demo_realistic_trading_scenario():
     """Demonstrate realistic trading bot scenario"""
     print("\n=== Realistic Trading Scenario ===\n")
 
@@ -491,25 +459,22 @@ def demo_realistic_trading_scenario():
             logger.error("retry_exhausted", error=str(e))
             return None
 
-    async def run():
-        result = await execute_trade()
-
-        if result:
-            print("\n  ✓ Trade executed successfully")
-            print(f"    Price: ${result['price']:,.2f}")
-            print(f"    Order: {result['order']['order_id']}")
-        else:
-            print("\n  ✗ Trade failed (handled gracefully)")
+    result = await execute_trade()
 
-        print(f"\n  Circuit Breaker States:")
-        print(f"    Price API: {price_breaker.state.value}")
-        print(f"    Order API: {order_breaker.state.value}\n")
+    if result:
+        print("\n  ✓ Trade executed successfully")
+        print(f"    Price: ${result['price']:,.2f}")
+        print(f"    Order: {result['order']['order_id']}")
+    else:
+        print("\n  ✗ Trade failed (handled gracefully)")
 
-    asyncio.run(run())
+    print(f"\n  Circuit Breaker States:")
+    print(f"    Price API: {price_breaker.state.value}")
+    print(f"    Order API: {order_breaker.state.value}\n")
 
 
-def main():
-    """Run all demos"""
+async def main():
+    """Run all demos on a single event loop"""
     print("\n" + "="*60)
     print("Resilience Infrastructure Demo")
     print("="*60)
@@ -518,24 +483,24 @@ def main():
     configure_logging(level="INFO", format="console")
 
     # Retry demos
-    demo_basic_retry()
-    demo_retry_config()
-    demo_selective_retry()
+    await demo_basic_retry()
+    await demo_retry_config()
+    await demo_selective_retry()
 
     # Circuit breaker demos
-    demo_circuit_breaker_basic()
-    demo_circuit_breaker_recovery()
-    demo_circuit_breaker_stats()
+    await demo_circuit_breaker_basic()
+    await demo_circuit_breaker_recovery()
+    await demo_circuit_breaker_stats()
 
     # Timeout demos
-    demo_basic_timeout()
-    demo_timeout_exceeded()
-    demo_timeout_context()
-    demo_race_condition()
+    await demo_basic_timeout()
+    await demo_timeout_exceeded()
+    await demo_timeout_context()
+    await demo_race_condition()
 
     # Integration demos
-    demo_full_resilience_stack()
-    demo_realistic_trading_scenario()
+    await demo_full_resilience_stack()
+    await demo_realistic_trading_scenario()
 
     print("="*60)
     print("Demo Complete!")
@@ -543,4 +508,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    install_uvloop()
+    asyncio.run(main())
@@ -14,6 +14,7 @@ Run with:
 import asyncio
 import httpx
 import socketio
+from src.infrastructure.eventloop import install_uvloop
 from src.infrastructure.factory import create_infrastructure
 from src.web.websocket_server import WorkflowWebSocketServer
 from src.infrastructure.logging import get_logger
@@ -81,21 +82,14 @@ async def test_metrics_tracking():
 
     # Simulate client connection
     print("\nSimulating client connections...")
-    server.client_subscriptions["test_sid_1"] = {
-        'workflow_ids': {'workflow_001', 'workflow_002'},
-        'bot_ids': {'bot_001'},
-        'strategy_ids': set(),
-        'authenticated': True,
-        'connected_at': 123456789.0
-    }
+    server.register_client("test_sid_1")
+    server.add_subscription("test_sid_1", 'workflow_id', 'workflow_001')
+    server.add_subscription("test_sid_1", 'workflow_id', 'workflow_002')
+    server.add_subscription("test_sid_1", 'bot_id', 'bot_001')
 
-    server.client_subscriptions["test_sid_2"] = {
-        'workflow_ids': {'workflow_003'},
-        'bot_ids': set(),
-        'strategy_ids': {'strategy_001'},
-        'authenticated': True,
-        'connected_at': 123456790.0
-    }
+    server.register_client("test_sid_2")
+    server.add_subscription("test_sid_2", 'workflow_id', 'workflow_003')
+    server.add_subscription("test_sid_2", 'strategy_id', 'strategy_001')
 
     # Simulate event
     test_event = {
@@ -136,21 +130,11 @@ async def test_event_broadcasting():
     await server.setup()
 
     # Simulate clients
-    server.client_subscriptions["client_1"] = {
-        'workflow_ids': {'workflow_001'},
-        'bot_ids': set(),
-        'strategy_ids': set(),
-        'authenticated': True,
-        'connected_at': 123456789.0
-    }
+    server.register_client("client_1")
+    server.add_subscription("client_1", 'workflow_id', 'workflow_001')
 
-    server.client_subscriptions["client_2"] = {
-        'workflow_ids': {'workflow_002'},
-        'bot_ids': set(),
-        'strategy_ids': set(),
-        'authenticated': True,
-        'connected_at': 123456790.0
-    }
+    server.register_client("client_2")
+    server.add_subscription("client_2", 'workflow_id', 'workflow_002')
 
     # Publish event through infrastructure
     test_event = {
@@ -191,7 +175,7 @@ async def test_recent_events_replay():
             'node_id': f'node_{i}',
             'execution_id': 'exec_test_001'
         }
-        server.recent_events.append(event)
+        await server.handle_workflow_event(event)
 
     print(f"  Recent events buffer: {len(server.recent_events)} events")
 
@@ -199,19 +183,11 @@ async def test_recent_events_replay():
     print("\nTesting event filtering by workflow_id...")
 
     # Create test client
-    server.client_subscriptions["test_client"] = {
-        'workflow_ids': {'workflow_001'},
-        'bot_ids': set(),
-        'strategy_ids': set(),
-        'authenticated': True,
-        'connected_at': 123456789.0
-    }
+    server.register_client("test_client")
+    server.add_subscription("test_client", 'workflow_id', 'workflow_001')
 
     # Test would normally send via socket, but we can verify filtering logic
-    filtered_events = []
-    for event in server.recent_events:
-        if event.get('workflow_id') == 'workflow_001':
-            filtered_events.append(event)
+    filtered_events = server.get_recent_events(workflow_id='workflow_001')
 
     print(f"  Filtered events for workflow_001: {len(filtered_events)}")
 
@@ -244,4 +220,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
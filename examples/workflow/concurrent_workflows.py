@@ -5,7 +5,7 @@ Demonstrates running multiple workflows concurrently with shared infrastructure:
 - Multiple bot instances running simultaneously
 - Shared event bus for all workflow events
 - Shared emergency controller
-- Concurrent execution with asyncio.gather
+- Bounded concurrent execution, reporting results as they complete
 - Event tracking across all workflows
 - Performance metrics
 
@@ -15,17 +15,59 @@ across different strategies and market pairs.
 
 import asyncio
 import sys
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime
+from typing import Dict, Optional
+from unittest.mock import patch
 import time
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from src.infrastructure.eventloop import install_uvloop
 from src.infrastructure.factory import Infrastructure
+from src.workflow.executor import WorkflowExecutor
 from src.workflow.enhanced_executor import EnhancedWorkflowExecutor
 
 
+# Maximum workflows executing at once in the concurrent demo
+MAX_CONCURRENT_WORKFLOWS = 3
+
+# Simulated prices returned by the mocked provider nodes
+PRICE_MAP = {
+    "BTC/USD": 50234.56,
+    "ETH/USD": 3456.78,
+    "SOL/USD": 123.45,
+    "MATIC/USD": 0.89,
+    "AVAX/USD": 45.67
+}
+
+# Simulated per-pair feed latency (seconds), computed once
+PRICE_FEED_LATENCY = {pair: 0.05 + (hash(pair) % 10) / 100 for pair in PRICE_MAP}
+
+
+async def mock_price_feed(node: dict, inputs: dict):
+    """Stand-in for provider node execution, keyed by the node's pair"""
+    pair = node["config"]["pair"]
+    await asyncio.sleep(PRICE_FEED_LATENCY.get(pair, 0.05))  # Variable latency
+    return {"price": PRICE_MAP.get(pair, 1.0)}
+
+
+def mock_provider_nodes():
+    """
+    Patch provider node execution for every workflow in the demos.
+
+    Installed once around all runs: concurrent per-workflow patch.object
+    calls on the same class attribute would undo each other on exit.
+    """
+    return patch.object(
+        WorkflowExecutor,
+        '_execute_provider_node',
+        side_effect=mock_price_feed
+    )
+
+
 # Simple workflow template
 def create_workflow(pair: str):
     """Create a workflow for a given trading pair"""
@@ -72,34 +114,54 @@ def create_workflow(pair: str):
     }
 
 
+@dataclass
+class WorkflowStats:
+    """Per-workflow event tally, updated as events arrive"""
+    events: int = 0
+    started: Optional[dict] = None
+    completed: Optional[dict] = None
+
+
 class ConcurrencyMonitor:
     """Monitor multiple concurrent workflows"""
 
+    __slots__ = ("stats_by_workflow", "total_events")
+
     def __init__(self):
-        self.events_by_workflow = {}
-        self.start_time = time.time()
+        self.stats_by_workflow: Dict[str, WorkflowStats] = {}
+        self.total_events = 0
 
     async def handle_event(self, event: dict):
         """Handle workflow event"""
         workflow_id = event.get("workflow_id")
-        if workflow_id not in self.events_by_workflow:
-            self.events_by_workflow[workflow_id] = []
-        self.events_by_workflow[workflow_id].append(event)
+        stats = self.stats_by_workflow.get(workflow_id)
+        if stats is None:
+            stats = self.stats_by_workflow[workflow_id] = WorkflowStats()
+
+        stats.events += 1
+        self.total_events += 1
+
+        # Keep the first start and completion events so the summary needn't scan
+        event_type = event.get("type")
+        if event_type == "execution_started" and stats.started is None:
+            stats.started = event
+        elif event_type == "execution_completed" and stats.completed is None:
+            stats.completed = event
 
     def get_summary(self):
         """Get summary of all workflows"""
         summary = {
-            "total_workflows": len(self.events_by_workflow),
-            "total_events": sum(len(events) for events in self.events_by_workflow.values()),
+            "total_workflows": len(self.stats_by_workflow),
+            "total_events": self.total_events,
             "workflows": {}
         }
 
-        for workflow_id, events in self.events_by_workflow.items():
-            started = next((e for e in events if e["type"] == "execution_started"), None)
-            completed = next((e for e in events if e["type"] == "execution_completed"), None)
+        for workflow_id, stats in self.stats_by_workflow.items():
+            started = stats.started
+            completed = stats.completed
 
             summary["workflows"][workflow_id] = {
-                "events": len(events),
+                "events": stats.events,
                 "status": completed.get("status") if completed else "running",
                 "duration_ms": completed.get("duration_ms") if completed else None,
                 "bot_id": started.get("bot_id") if started else None,
@@ -137,28 +199,8 @@ async def execute_workflow(
     # Initialize
     await executor.initialize()
 
-    # Mock provider data
-    from unittest.mock import patch
-
-    price_map = {
-        "BTC/USD": 50234.56,
-        "ETH/USD": 3456.78,
-        "SOL/USD": 123.45,
-        "MATIC/USD": 0.89,
-        "AVAX/USD": 45.67
-    }
-
-    async def mock_price_feed(*args, **kwargs):
-        await asyncio.sleep(0.05 + (hash(pair) % 10) / 100)  # Variable latency
-        return {"price": price_map.get(pair, 1.0)}
-
-    # Execute with mocked data
-    with patch.object(
-        executor.__class__.__bases__[0],
-        '_execute_provider_node',
-        side_effect=mock_price_feed
-    ):
-        result = await executor.execute()
+    # Execute (provider nodes are mocked by mock_provider_nodes())
+    result = await executor.execute()
 
     return {
         "workflow_id": workflow_id,
@@ -200,23 +242,18 @@ async def demo_concurrent_execution():
         print(f"  - {pair} (delay: {delay}s)")
     print()
 
-    # Execute all workflows concurrently
-    start_time = time.time()
-
-    tasks = [
-        execute_workflow(infra, wf_id, bot_id, strategy_id, pair, delay)
-        for wf_id, bot_id, strategy_id, pair, delay in workflows
-    ]
-
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    # Execute workflows concurrently (bounded), reporting each as it finishes
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_WORKFLOWS)
 
-    end_time = time.time()
-    total_duration = end_time - start_time
+    async def run_bounded(wf_id, bot_id, strategy_id, pair, delay):
+        async with semaphore:
+            try:
+                return await execute_workflow(infra, wf_id, bot_id, strategy_id, pair, delay)
+            except Exception as e:
+                return {"workflow_id": wf_id, "pair": pair, "error": e}
 
-    # Wait for events to be processed
-    await asyncio.sleep(0.5)
+    start_time = time.monotonic()
 
-    # Display results
     print("\n" + "="*70)
     print("📊 EXECUTION RESULTS")
     print("="*70 + "\n")
@@ -224,9 +261,12 @@ async def demo_concurrent_execution():
     successful = 0
     failed = 0
 
-    for i, result in enumerate(results):
-        if isinstance(result, Exception):
-            print(f"❌ Workflow {i+1}: FAILED - {result}")
+    for next_result in asyncio.as_completed([
+        run_bounded(*workflow) for workflow in workflows
+    ]):
+        result = await next_result
+        if "error" in result:
+            print(f"❌ {result['pair']}: FAILED - {result['error']}")
             failed += 1
         else:
             status = result["result"]["status"]
@@ -234,12 +274,18 @@ async def demo_concurrent_execution():
             print(f"✅ {result['pair']}: {status} ({duration:.2f}ms)")
             successful += 1
 
+    end_time = time.monotonic()
+    total_duration = end_time - start_time
+
+    # Wait for events to be processed
+    await asyncio.sleep(0.5)
+
     print(f"\nSummary:")
-    print(f"  Total: {len(results)}")
+    print(f"  Total: {len(workflows)}")
     print(f"  Successful: {successful}")
     print(f"  Failed: {failed}")
     print(f"  Total Time: {total_duration:.2f}s")
-    print(f"  Avg Time per Workflow: {total_duration/len(results):.2f}s")
+    print(f"  Avg Time per Workflow: {total_duration/len(workflows):.2f}s")
     print()
 
     # Display event summary
@@ -293,9 +339,10 @@ async def demo_shared_emergency_control():
             return {"workflow_id": wf_id, "error": str(e)}
 
     # Start workflows
-    task1 = asyncio.create_task(run_with_emergency_check(*workflows_to_run[0]))
-    task2 = asyncio.create_task(run_with_emergency_check(*workflows_to_run[1]))
-    task3 = asyncio.create_task(run_with_emergency_check(*workflows_to_run[2]))
+    tasks = [
+        asyncio.create_task(run_with_emergency_check(*workflow))
+        for workflow in workflows_to_run
+    ]
 
     # Let them start
     await asyncio.sleep(0.2)
@@ -307,7 +354,7 @@ async def demo_shared_emergency_control():
     # Wait for completion
     await asyncio.sleep(0.5)
 
-    results = await asyncio.gather(task1, task2, task3, return_exceptions=True)
+    results = await asyncio.gather(*tasks, return_exceptions=True)
 
     # Check results
     print("="*70)
@@ -335,11 +382,12 @@ async def main():
     print("="*70)
 
     try:
-        # Demo 1: Concurrent execution
-        await demo_concurrent_execution()
+        with mock_provider_nodes():
+            # Demo 1: Concurrent execution
+            await demo_concurrent_execution()
 
-        # Demo 2: Shared emergency control
-        await demo_shared_emergency_control()
+            # Demo 2: Shared emergency control
+            await demo_shared_emergency_control()
 
         print("\n" + "="*70)
         print("✅ All Demonstrations Completed Successfully")
@@ -352,6 +400,7 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -19,7 +19,9 @@ from datetime import datetime
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from src.infrastructure.eventloop import install_uvloop
 from src.infrastructure.factory import Infrastructure
+from src.workflow.executor import WorkflowExecutor
 from src.workflow.enhanced_executor import EnhancedWorkflowExecutor
 from src.infrastructure.emergency import EmergencyHalted, RiskLimitExceeded, EmergencyEvent
 
@@ -55,14 +57,12 @@ TRADING_WORKFLOW = {
 }
 
 
-async def demo_daily_loss_limit():
+async def demo_daily_loss_limit(infra: Infrastructure):
     """Demonstrate daily loss limit exceeded - auto-halt"""
     print("\n" + "="*70)
     print("DEMO 1: Daily Loss Limit Exceeded")
     print("="*70 + "\n")
 
-    infra = await Infrastructure.create("development")
-
     # Get default daily loss limit from config
     daily_loss_limit = infra.config.emergency.daily_loss_limit
     print(f"💰 Daily Loss Limit: ${abs(daily_loss_limit):.2f}\n")
@@ -141,14 +141,12 @@ async def demo_daily_loss_limit():
     print("="*70 + "\n")
 
 
-async def demo_manual_halt_resume():
+async def demo_manual_halt_resume(infra: Infrastructure):
     """Demonstrate manual emergency halt and resume"""
     print("\n" + "="*70)
     print("DEMO 2: Manual Emergency Halt and Resume")
     print("="*70 + "\n")
 
-    infra = await Infrastructure.create("development")
-
     # Subscribe to emergency events
     emergency_events = []
 
@@ -210,7 +208,7 @@ async def demo_manual_halt_resume():
         return {"price": 50000.0}
 
     with patch.object(
-        executor.__class__.__bases__[0],
+        WorkflowExecutor,
         '_execute_provider_node',
         side_effect=mock_market_data
     ):
@@ -232,15 +230,15 @@ async def demo_manual_halt_resume():
         print(f"    Reason: {event.reason}")
     print("="*70 + "\n")
 
+    await infra.emergency.unsubscribe(on_emergency_event)
+
 
-async def demo_alert_state():
+async def demo_alert_state(infra: Infrastructure):
     """Demonstrate alert state (trading continues with caution)"""
     print("\n" + "="*70)
     print("DEMO 3: Alert State (Cautious Trading)")
     print("="*70 + "\n")
 
-    infra = await Infrastructure.create("development")
-
     print(f"Initial State: {infra.emergency.state.value}")
     print(f"Can Trade: {infra.emergency.can_trade()}\n")
 
@@ -278,7 +276,7 @@ async def demo_alert_state():
         return {"price": 50000.0}
 
     with patch.object(
-        executor.__class__.__bases__[0],
+        WorkflowExecutor,
         '_execute_provider_node',
         side_effect=mock_market_data
     ):
@@ -309,15 +307,21 @@ async def main():
     print("Emergency Halt & Risk Limit Demonstrations")
     print("="*70)
 
+    # One infrastructure for all demos; the emergency controller is reset
+    # between them so each demo starts from NORMAL.
+    infra = await Infrastructure.create("development")
+
     try:
         # Demo 1: Daily loss limit
-        await demo_daily_loss_limit()
+        await demo_daily_loss_limit(infra)
+        await infra.emergency.reset()
 
         # Demo 2: Manual halt and resume
-        await demo_manual_halt_resume()
+        await demo_manual_halt_resume(infra)
+        await infra.emergency.reset()
 
         # Demo 3: Alert state
-        await demo_alert_state()
+        await demo_alert_state(infra)
 
         print("\n" + "="*70)
         print("✅ All Demonstrations Completed Successfully")
@@ -328,8 +332,12 @@ async def main():
         import traceback
         traceback.print_exc()
 
+    finally:
+        await infra.close()
+
 
 if __name__ == "__main__":
+    install_uvloop()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
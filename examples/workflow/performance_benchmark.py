@@ -8,19 +8,26 @@ Measures performance characteristics of the Enhanced Workflow Executor:
 - Circuit breaker overhead
 - Memory usage
 
-Provides baseline performance metrics for production deployment.
+Provides baseline performance metrics for production deployment. Results are
+also saved to bench_<sha8>.json (keyed by git commit) for regression tracking.
 """
 
 import asyncio
+import json
+import subprocess
 import sys
 from pathlib import Path
 import time
 import statistics
+from array import array
+from unittest.mock import patch
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from src.infrastructure.eventloop import install_uvloop
 from src.infrastructure.factory import Infrastructure
+from src.workflow.executor import WorkflowExecutor
 from src.workflow.enhanced_executor import EnhancedWorkflowExecutor
 
 
@@ -41,84 +48,150 @@ MINIMAL_WORKFLOW = {
     ]
 }
 
+# Parsed once and shared read-only by every executor (executors never mutate
+# the definition). The cold-start benchmark passes the raw dict instead so
+# that it still pays for parsing.
+MINIMAL_COMPILED = WorkflowExecutor.compile(MINIMAL_WORKFLOW)
+
+
+async def mock_provider(*args, **kwargs):
+    """Stand-in for WorkflowExecutor._execute_provider_node"""
+    return {"result": 42}
+
+
+async def mock_slow_provider(*args, **kwargs):
+    """Provider stand-in with simulated network latency"""
+    await asyncio.sleep(0.01)  # Simulate 10ms latency
+    return {"result": 42}
+
+
+def latency_stats(durations):
+    """
+    Summarize per-iteration durations (integer ns), reported in ms.
+
+    Min, max and median are read straight from the sorted list; p95/p99
+    come from a single quantiles() call.
+    """
+    ordered = [duration / 1e6 for duration in sorted(durations)]
+    percentiles = statistics.quantiles(ordered, n=100)
+
+    middle = len(ordered) // 2
+    if len(ordered) % 2:
+        median = ordered[middle]
+    else:
+        median = (ordered[middle - 1] + ordered[middle]) / 2
+
+    return {
+        "iterations": len(ordered),
+        "mean": statistics.fmean(ordered),
+        "median": median,
+        "stdev": statistics.stdev(ordered),
+        "min": ordered[0],
+        "max": ordered[-1],
+        "p95": percentiles[94],
+        "p99": percentiles[98],
+    }
+
+
+def print_latency_stats(durations):
+    """Print summary statistics for per-iteration durations (integer ns)"""
+    stats = latency_stats(durations)
+
+    print("Results:")
+    print(f"  Iterations: {stats['iterations']}")
+    print(f"  Mean: {stats['mean']:.2f}ms")
+    print(f"  Median: {stats['median']:.2f}ms")
+    print(f"  Std Dev: {stats['stdev']:.2f}ms")
+    print(f"  Min: {stats['min']:.2f}ms")
+    print(f"  Max: {stats['max']:.2f}ms")
+    print(f"  P95: {stats['p95']:.2f}ms")
+    print(f"  P99: {stats['p99']:.2f}ms")
+    print()
+
+    return stats
+
 
 async def benchmark_single_execution():
-    """Benchmark single workflow execution"""
+    """Benchmark steady-state execution of one reused executor"""
     print("\n" + "="*70)
-    print("BENCHMARK: Single Workflow Execution")
+    print("BENCHMARK: Single Workflow Execution (steady state)")
     print("="*70 + "\n")
 
     infra = await Infrastructure.create("development")
 
-    # Warmup
-    print("🔥 Warming up...")
-    for _ in range(5):
-        executor = EnhancedWorkflowExecutor(
-            workflow=MINIMAL_WORKFLOW,
-            infra=infra,
-            workflow_id=f"warmup",
-            bot_id="bench_bot",
-            strategy_id="bench_strategy"
-        )
-        await executor.initialize()
+    # One executor, patched once, so iterations time execute() rather than
+    # executor construction, initialization and patch setup
+    executor = EnhancedWorkflowExecutor(
+        workflow=MINIMAL_COMPILED,
+        infra=infra,
+        workflow_id="bench_single",
+        bot_id="bench_bot",
+        strategy_id="bench_strategy"
+    )
+    await executor.initialize()
 
-        from unittest.mock import patch
-        async def mock_provider(*args, **kwargs):
-            return {"result": 42}
-
-        with patch.object(
-            executor.__class__.__bases__[0],
-            '_execute_provider_node',
-            side_effect=mock_provider
-        ):
+    iterations = 100
+    durations = array('q')  # ns
+
+    with patch.object(
+        WorkflowExecutor,
+        '_execute_provider_node',
+        side_effect=mock_provider
+    ):
+        # Warmup
+        print("🔥 Warming up...")
+        for _ in range(5):
             await executor.execute()
 
-    print("✅ Warmup complete\n")
+        print("✅ Warmup complete\n")
 
-    # Benchmark
-    iterations = 100
-    print(f"📊 Running {iterations} iterations...\n")
+        # Benchmark
+        print(f"📊 Running {iterations} iterations...\n")
+
+        for _ in range(iterations):
+            start = time.perf_counter_ns()
+            await executor.execute()
+            end = time.perf_counter_ns()
+            durations.append(end - start)
 
-    durations = []
+    return print_latency_stats(durations)
 
-    for i in range(iterations):
-        executor = EnhancedWorkflowExecutor(
-            workflow=MINIMAL_WORKFLOW,
-            infra=infra,
-            workflow_id=f"bench_{i}",
-            bot_id="bench_bot",
-            strategy_id="bench_strategy"
-        )
 
-        await executor.initialize()
+async def benchmark_cold_start_execution():
+    """Benchmark executor construction + initialize() + first execute()"""
+    print("\n" + "="*70)
+    print("BENCHMARK: Single Workflow Execution (cold start)")
+    print("="*70 + "\n")
 
-        from unittest.mock import patch
-        async def mock_provider(*args, **kwargs):
-            return {"result": 42}
+    infra = await Infrastructure.create("development")
 
-        start = time.perf_counter()
+    iterations = 100
+    print(f"📊 Running {iterations} iterations...\n")
 
-        with patch.object(
-            executor.__class__.__bases__[0],
-            '_execute_provider_node',
-            side_effect=mock_provider
-        ):
-            result = await executor.execute()
+    durations = array('q')  # ns
+
+    with patch.object(
+        WorkflowExecutor,
+        '_execute_provider_node',
+        side_effect=mock_provider
+    ):
+        for i in range(iterations):
+            start = time.perf_counter_ns()
+
+            executor = EnhancedWorkflowExecutor(
+                workflow=MINIMAL_WORKFLOW,
+                infra=infra,
+                workflow_id=f"bench_cold_{i}",
+                bot_id="bench_bot",
+                strategy_id="bench_strategy"
+            )
+            await executor.initialize()
+            await executor.execute()
 
-        end = time.perf_counter()
-        durations.append((end - start) * 1000)  # ms
+            end = time.perf_counter_ns()
+            durations.append(end - start)
 
-    # Results
-    print("Results:")
-    print(f"  Iterations: {len(durations)}")
-    print(f"  Mean: {statistics.mean(durations):.2f}ms")
-    print(f"  Median: {statistics.median(durations):.2f}ms")
-    print(f"  Std Dev: {statistics.stdev(durations):.2f}ms")
-    print(f"  Min: {min(durations):.2f}ms")
-    print(f"  Max: {max(durations):.2f}ms")
-    print(f"  P95: {statistics.quantiles(durations, n=20)[18]:.2f}ms")
-    print(f"  P99: {statistics.quantiles(durations, n=100)[98]:.2f}ms")
-    print()
+    return print_latency_stats(durations)
 
 
 async def benchmark_event_emission():
@@ -141,43 +214,58 @@ async def benchmark_event_emission():
     iterations = 50
     print(f"📊 Running {iterations} iterations with event monitoring...\n")
 
-    durations_with_events = []
-
-    for i in range(iterations):
-        executor = EnhancedWorkflowExecutor(
-            workflow=MINIMAL_WORKFLOW,
-            infra=infra,
-            workflow_id=f"bench_events_{i}",
-            bot_id="bench_bot",
-            strategy_id="bench_strategy"
-        )
-
-        await executor.initialize()
-
-        from unittest.mock import patch
-        async def mock_provider(*args, **kwargs):
-            return {"result": 42}
-
-        start = time.perf_counter()
-
-        with patch.object(
-            executor.__class__.__bases__[0],
-            '_execute_provider_node',
-            side_effect=mock_provider
-        ):
+    durations_with_events = array('q')  # ns
+
+    with patch.object(
+        WorkflowExecutor,
+        '_execute_provider_node',
+        side_effect=mock_provider
+    ):
+        for i in range(iterations):
+            executor = EnhancedWorkflowExecutor(
+                workflow=MINIMAL_COMPILED,
+                infra=infra,
+                workflow_id=f"bench_events_{i}",
+                bot_id="bench_bot",
+                strategy_id="bench_strategy"
+            )
+
+            await executor.initialize()
+
+            start = time.perf_counter_ns()
             await executor.execute()
-
-        end = time.perf_counter()
-        durations_with_events.append((end - start) * 1000)
+            end = time.perf_counter_ns()
+            durations_with_events.append(end - start)
 
     await asyncio.sleep(0.2)  # Let events process
 
     print(f"Results:")
+    mean_ms = statistics.fmean(durations_with_events) / 1e6
+
     print(f"  Total Events Emitted: {event_count}")
     print(f"  Events per Workflow: {event_count / iterations:.1f}")
-    print(f"  Mean Execution Time: {statistics.mean(durations_with_events):.2f}ms")
+    print(f"  Mean Execution Time: {mean_ms:.2f}ms")
     print()
 
+    return {
+        "events_per_workflow": event_count / iterations,
+        "mean": mean_ms,
+    }
+
+
+def event_loop_name(loop: asyncio.AbstractEventLoop) -> str:
+    """Short name of an event loop implementation, e.g. 'uvloop.Loop'"""
+    return f"{type(loop).__module__.split('.')[0]}.{type(loop).__name__}"
+
+
+def run_on_stock_loop(coro_fn):
+    """Run coro_fn() to completion on a fresh default asyncio loop"""
+    loop = asyncio.SelectorEventLoop()
+    try:
+        return loop.run_until_complete(coro_fn())
+    finally:
+        loop.close()
+
 
 async def benchmark_concurrent_throughput():
     """Benchmark concurrent workflow throughput"""
@@ -185,54 +273,84 @@ async def benchmark_concurrent_throughput():
     print("BENCHMARK: Concurrent Workflow Throughput")
     print("="*70 + "\n")
 
+    loop = asyncio.get_running_loop()
+    print(f"Event loop: {event_loop_name(loop)}\n")
+    results = {event_loop_name(loop): await run_concurrency_sweep()}
+
+    # Under uvloop, repeat the sweep on the stock loop (in a worker thread,
+    # since this thread's loop is busy) so both are reported side by side
+    if type(loop).__module__.startswith("uvloop"):
+        print("Event loop: asyncio.SelectorEventLoop (for comparison)\n")
+        results["asyncio.SelectorEventLoop"] = await asyncio.to_thread(
+            run_on_stock_loop, run_concurrency_sweep
+        )
+
+    return results
+
+
+async def run_concurrency_sweep():
+    """Run the concurrency levels on the current event loop, keyed by level"""
     infra = await Infrastructure.create("development")
 
-    from unittest.mock import patch
-    async def mock_provider(*args, **kwargs):
-        await asyncio.sleep(0.01)  # Simulate 10ms latency
-        return {"result": 42}
+    # Test different concurrency levels
+    concurrency_levels = [1, 5, 10, 20, 50]
 
-    async def execute_one(wf_id):
-        executor = EnhancedWorkflowExecutor(
-            workflow=MINIMAL_WORKFLOW,
+    # One initialized executor per concurrent slot, built before timing starts
+    # so the sweep measures execute() rather than executor setup. A level of
+    # N runs the first N; no executor is ever shared by two running tasks.
+    pool = [
+        EnhancedWorkflowExecutor(
+            workflow=MINIMAL_COMPILED,
             infra=infra,
-            workflow_id=wf_id,
+            workflow_id=f"bench_concurrent_{i}",
             bot_id="bench_bot",
             strategy_id="bench_strategy"
         )
+        for i in range(max(concurrency_levels))
+    ]
+    await asyncio.gather(*(executor.initialize() for executor in pool))
 
-        await executor.initialize()
+    results = {}
 
-        with patch.object(
-            executor.__class__.__bases__[0],
-            '_execute_provider_node',
-            side_effect=mock_provider
-        ):
-            result = await executor.execute()
+    # Patched once for all levels: overlapping per-task patches would also
+    # restore the original method in whatever order the tasks finish
+    with patch.object(
+        WorkflowExecutor,
+        '_execute_provider_node',
+        side_effect=mock_slow_provider
+    ):
+        for concurrency in concurrency_levels:
+            print(f"Testing concurrency level: {concurrency}")
 
-        return result
+            start = time.perf_counter_ns()
+            cpu_start = time.thread_time_ns()
 
-    # Test different concurrency levels
-    concurrency_levels = [1, 5, 10, 20, 50]
+            tasks = [executor.execute() for executor in pool[:concurrency]]
+            outcomes = await asyncio.gather(*tasks, return_exceptions=True)
 
-    for concurrency in concurrency_levels:
-        print(f"Testing concurrency level: {concurrency}")
+            cpu_end = time.thread_time_ns()
+            end = time.perf_counter_ns()
+            total_time = (end - start) / 1e9  # s
 
-        start = time.perf_counter()
+            successful = sum(1 for r in outcomes if not isinstance(r, Exception))
+            throughput = successful / total_time
 
-        tasks = [execute_one(f"bench_concurrent_{i}") for i in range(concurrency)]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+            # Share of wall time the loop thread spent on the CPU: near 100%
+            # means Python-bound, low means mostly waiting on (mock) I/O
+            cpu_busy = (cpu_end - cpu_start) / (end - start)
 
-        end = time.perf_counter()
-        total_time = end - start
+            print(f"  Total Time: {total_time:.2f}s")
+            print(f"  Successful: {successful}/{concurrency}")
+            print(f"  Throughput: {throughput:.2f} workflows/sec")
+            print(f"  Loop CPU Busy: {cpu_busy * 100:.1f}%")
+            print()
 
-        successful = sum(1 for r in results if not isinstance(r, Exception))
-        throughput = successful / total_time
+            results[concurrency] = {
+                "throughput": throughput,
+                "cpu_busy": cpu_busy,
+            }
 
-        print(f"  Total Time: {total_time:.2f}s")
-        print(f"  Successful: {successful}/{concurrency}")
-        print(f"  Throughput: {throughput:.2f} workflows/sec")
-        print()
+    return results
 
 
 async def benchmark_state_persistence():
@@ -247,40 +365,36 @@ async def benchmark_state_persistence():
     print(f"📊 Running {iterations} iterations with state persistence...\n")
 
     # Measure execution time (includes state persistence)
-    durations = []
-
-    for i in range(iterations):
-        executor = EnhancedWorkflowExecutor(
-            workflow=MINIMAL_WORKFLOW,
-            infra=infra,
-            workflow_id=f"bench_state_{i}",
-            bot_id="bench_bot",
-            strategy_id="bench_strategy"
-        )
-
-        await executor.initialize()
-
-        from unittest.mock import patch
-        async def mock_provider(*args, **kwargs):
-            return {"result": 42}
-
-        start = time.perf_counter()
-
-        with patch.object(
-            executor.__class__.__bases__[0],
-            '_execute_provider_node',
-            side_effect=mock_provider
-        ):
+    durations = array('q')  # ns
+
+    with patch.object(
+        WorkflowExecutor,
+        '_execute_provider_node',
+        side_effect=mock_provider
+    ):
+        for i in range(iterations):
+            executor = EnhancedWorkflowExecutor(
+                workflow=MINIMAL_COMPILED,
+                infra=infra,
+                workflow_id=f"bench_state_{i}",
+                bot_id="bench_bot",
+                strategy_id="bench_strategy"
+            )
+
+            await executor.initialize()
+
+            # State is persisted during execute()
+            start = time.perf_counter_ns()
             await executor.execute()
+            end = time.perf_counter_ns()
+            durations.append(end - start)
 
-        # State is persisted during execute()
-        end = time.perf_counter()
-        durations.append((end - start) * 1000)
+    stats = latency_stats(durations)
 
     print(f"Results (with state persistence):")
-    print(f"  Mean: {statistics.mean(durations):.2f}ms")
-    print(f"  Median: {statistics.median(durations):.2f}ms")
-    print(f"  P95: {statistics.quantiles(durations, n=20)[18]:.2f}ms")
+    print(f"  Mean: {stats['mean']:.2f}ms")
+    print(f"  Median: {stats['median']:.2f}ms")
+    print(f"  P95: {stats['p95']:.2f}ms")
     print()
 
     # Verify state was persisted
@@ -292,6 +406,38 @@ async def benchmark_state_persistence():
         print(f"❌ State persistence failed")
     print()
 
+    return stats
+
+
+def git_revision() -> str:
+    """Current git commit SHA, or 'unknown' outside a git checkout"""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"],
+            cwd=Path(__file__).parent,
+            stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def write_results(results: dict) -> Path:
+    """
+    Save benchmark results as JSON keyed by git revision.
+
+    One file per commit (bench_<sha8>.json in the working directory), so
+    runs on different commits can be diffed for regressions.
+    """
+    sha = git_revision()
+    path = Path(f"bench_{sha[:8]}.json")
+    path.write_text(json.dumps({
+        "sha": sha,
+        "timestamp": time.time(),
+        "python": sys.version,
+        "results": results,
+    }, indent=2))
+    return path
+
 
 async def main():
     """Run all benchmarks"""
@@ -299,18 +445,21 @@ async def main():
     print("Performance Benchmarking Suite")
     print("="*70)
 
+    results = {}
+
     try:
-        # Benchmark 1: Single execution
-        await benchmark_single_execution()
+        # Benchmark 1: Single execution (steady state and cold start)
+        results["single_execution"] = await benchmark_single_execution()
+        results["cold_start_execution"] = await benchmark_cold_start_execution()
 
         # Benchmark 2: Event emission
-        await benchmark_event_emission()
+        results["event_emission"] = await benchmark_event_emission()
 
         # Benchmark 3: Concurrent throughput
-        await benchmark_concurrent_throughput()
+        results["concurrent_throughput"] = await benchmark_concurrent_throughput()
 
         # Benchmark 4: State persistence
-        await benchmark_state_persistence()
+        results["state_persistence"] = await benchmark_state_persistence()
 
         print("\n" + "="*70)
         print("✅ All Benchmarks Completed Successfully")
@@ -325,6 +474,8 @@ async def main():
         print("Production performance will vary based on configuration and infrastructure.")
         print()
 
+        print(f"📁 Results written to {write_results(results)}\n")
+
     except Exception as e:
         print(f"\n❌ Benchmark failed: {e}\n")
         import traceback
@@ -332,6 +483,7 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -16,11 +16,14 @@ This example simulates a BTC arbitrage trading workflow between two exchanges.
 import asyncio
 import sys
 from pathlib import Path
+from typing import List, Optional
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.infrastructure.factory import Infrastructure
+from src.infrastructure.eventloop import install_uvloop
+from src.workflow.executor import WorkflowExecutor
 from src.workflow.enhanced_executor import EnhancedWorkflowExecutor
 from datetime import datetime
 
@@ -110,73 +113,148 @@ ARBITRAGE_WORKFLOW = {
 }
 
 
+# Separator rows for the monitor's event banners, built once
+_SEPARATOR = "=" * 70
+_BANNER_TOP = "\n" + _SEPARATOR
+_BANNER_BOTTOM = _SEPARATOR + "\n"
+
+
 class WorkflowEventMonitor:
     """Monitor and display workflow events in real-time"""
 
     def __init__(self):
         self.events = []
         self.start_time = datetime.utcnow()
+        # Events waiting to be printed by the pump task
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._pump_task: Optional[asyncio.Task] = None
 
     async def handle_event(self, event: dict):
-        """Handle incoming workflow event"""
+        """
+        Handle incoming workflow event.
+
+        Only records and queues the event; printing happens in the pump task
+        so the event bus isn't held up by terminal output.
+        """
         self.events.append(event)
-        event_type = event.get("type")
+
+        # Event types with nothing to display never reach the pump
+        if event.get("type") not in self._FORMATTERS:
+            return
+
+        self._queue.put_nowait(event)
+
+        if self._pump_task is None:
+            self._pump_task = asyncio.create_task(self._pump())
+
+    async def _pump(self):
+        """Print queued events, a batch (everything queued so far) at a time"""
+        while True:
+            batch = [await self._queue.get()]
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            try:
+                sys.stdout.write("".join(self._safe_format(event) for event in batch))
+                sys.stdout.flush()
+            finally:
+                # Always release the batch so flush() can't wait forever
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _safe_format(self, event: dict) -> str:
+        """Format an event, reporting malformed ones instead of killing the pump"""
+        try:
+            return self.format_event(event)
+        except Exception as e:
+            return f"⚠️  Could not display {event.get('type')} event: {e}\n"
+
+    async def flush(self):
+        """Wait until every queued event has been printed"""
+        await self._queue.join()
+
+    async def close(self):
+        """Print remaining events and stop the pump task"""
+        await self.flush()
+        if self._pump_task is not None:
+            self._pump_task.cancel()
+            try:
+                await self._pump_task
+            except asyncio.CancelledError:
+                pass
+            self._pump_task = None
+
+    def format_event(self, event: dict) -> str:
+        """Format an event for display (empty string for unknown types)"""
+        formatter = self._FORMATTERS.get(event.get("type"))
+        if formatter is None:
+            return ""
+
+        return "".join(line + "\n" for line in formatter(self, event))
+
+    def _elapsed(self, event: dict) -> float:
+        """Seconds between monitor start and the event's timestamp"""
         timestamp = datetime.fromisoformat(event.get("timestamp", datetime.utcnow().isoformat()))
-        elapsed = (timestamp - self.start_time).total_seconds()
-
-        # Format event for display
-        if event_type == "execution_started":
-            print(f"\n{'='*70}")
-            print(f"🚀 EXECUTION STARTED")
-            print(f"{'='*70}")
-            print(f"Workflow ID: {event.get('workflow_id')}")
-            print(f"Execution ID: {event.get('execution_id')}")
-            print(f"Bot ID: {event.get('bot_id')}")
-            print(f"Strategy ID: {event.get('strategy_id')}")
-            print(f"Nodes: {event.get('node_count')}")
-            print(f"{'='*70}\n")
-
-        elif event_type == "node_started":
-            print(f"[{elapsed:6.2f}s] ▶️  Starting: {event.get('node_name')} ({event.get('node_id')})")
-
-        elif event_type == "node_completed":
-            duration_ms = event.get('duration_ms', 0)
-            outputs = event.get('outputs', {})
-            print(f"[{elapsed:6.2f}s] ✅ Completed: {event.get('node_name')} ({duration_ms:.0f}ms)")
-            if outputs:
-                print(f"           Outputs: {outputs}")
-
-        elif event_type == "node_failed":
-            error = event.get('error', 'Unknown error')
-            error_type = event.get('error_type', 'Error')
-            print(f"[{elapsed:6.2f}s] ❌ Failed: {event.get('node_name')}")
-            print(f"           Error: {error_type}: {error}")
-
-        elif event_type == "execution_completed":
-            duration_ms = event.get('duration_ms', 0)
-            status = event.get('status', 'unknown')
-            print(f"\n{'='*70}")
-            print(f"🏁 EXECUTION COMPLETED")
-            print(f"{'='*70}")
-            print(f"Status: {status}")
-            print(f"Duration: {duration_ms:.2f}ms ({duration_ms/1000:.2f}s)")
-            print(f"{'='*70}\n")
-
-        elif event_type == "execution_failed":
-            error = event.get('error', 'Unknown error')
-            print(f"\n{'='*70}")
-            print(f"💥 EXECUTION FAILED")
-            print(f"{'='*70}")
-            print(f"Error: {error}")
-            print(f"{'='*70}\n")
-
-        elif event_type == "execution_halted":
-            reason = event.get('reason', 'Unknown reason')
-            print(f"\n{'='*70}")
-            print(f"🛑 EXECUTION HALTED")
-            print(f"{'='*70}")
-            print(f"Reason: {reason}")
-            print(f"{'='*70}\n")
+        return (timestamp - self.start_time).total_seconds()
+
+    @staticmethod
+    def _banner(title: str, *lines: str) -> List[str]:
+        """Title and lines framed by separator rows"""
+        return [_BANNER_TOP, title, _SEPARATOR, *lines, _BANNER_BOTTOM]
+
+    def _format_execution_started(self, event: dict) -> List[str]:
+        return self._banner(
+            "🚀 EXECUTION STARTED",
+            f"Workflow ID: {event.get('workflow_id')}",
+            f"Execution ID: {event.get('execution_id')}",
+            f"Bot ID: {event.get('bot_id')}",
+            f"Strategy ID: {event.get('strategy_id')}",
+            f"Nodes: {event.get('node_count')}"
+        )
+
+    def _format_node_started(self, event: dict) -> List[str]:
+        return [f"[{self._elapsed(event):6.2f}s] ▶️  Starting: {event.get('node_name')} ({event.get('node_id')})"]
+
+    def _format_node_completed(self, event: dict) -> List[str]:
+        duration_ms = event.get('duration_ms', 0)
+        outputs = event.get('outputs', {})
+        lines = [f"[{self._elapsed(event):6.2f}s] ✅ Completed: {event.get('node_name')} ({duration_ms:.0f}ms)"]
+        if outputs:
+            lines.append(f"           Outputs: {outputs}")
+        return lines
+
+    def _format_node_failed(self, event: dict) -> List[str]:
+        error = event.get('error', 'Unknown error')
+        error_type = event.get('error_type', 'Error')
+        return [
+            f"[{self._elapsed(event):6.2f}s] ❌ Failed: {event.get('node_name')}",
+            f"           Error: {error_type}: {error}"
+        ]
+
+    def _format_execution_completed(self, event: dict) -> List[str]:
+        duration_ms = event.get('duration_ms', 0)
+        return self._banner(
+            "🏁 EXECUTION COMPLETED",
+            f"Status: {event.get('status', 'unknown')}",
+            f"Duration: {duration_ms:.2f}ms ({duration_ms/1000:.2f}s)"
+        )
+
+    def _format_execution_failed(self, event: dict) -> List[str]:
+        return self._banner("💥 EXECUTION FAILED", f"Error: {event.get('error', 'Unknown error')}")
+
+    def _format_execution_halted(self, event: dict) -> List[str]:
+        return self._banner("🛑 EXECUTION HALTED", f"Reason: {event.get('reason', 'Unknown reason')}")
+
+    # Event type -> formatter, looked up once per event
+    _FORMATTERS = {
+        "execution_started": _format_execution_started,
+        "node_started": _format_node_started,
+        "node_completed": _format_node_completed,
+        "node_failed": _format_node_failed,
+        "execution_completed": _format_execution_completed,
+        "execution_failed": _format_execution_failed,
+        "execution_halted": _format_execution_halted,
+    }
 
     def get_summary(self):
         """Get summary of all events"""
@@ -258,15 +336,15 @@ async def main():
         return {}
 
     with patch.object(
-        executor.__class__.__bases__[0],
+        WorkflowExecutor,
         '_execute_provider_node',
         side_effect=mock_provider
     ):
         try:
             result = await executor.execute()
 
-            # Wait for events to be processed
-            await asyncio.sleep(0.5)
+            # Wait for queued events to be printed
+            await monitor.flush()
 
             # Display results
             print("\n" + "="*70)
@@ -297,6 +375,8 @@ async def main():
             import traceback
             traceback.print_exc()
 
+    await monitor.close()
+
     # Display event summary
     summary = monitor.get_summary()
     print("="*70)
@@ -322,6 +402,7 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -1,93 +1,108 @@
 import os
 import logging
-from dataclasses import dataclass
-from typing import Dict, Set, Optional
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Set, Optional
 
 from dotenv import load_dotenv, dotenv_values
 
+from .profiles import (
+    auto_select_profile,
+    get_profile_by_name,
+    validate_capital_for_profile,
+    calculate_position_size,
+)
+
 logger = logging.getLogger(__name__)
 
-# Load .env file values without applying them
-dotenv_vars = dotenv_values()
+# Load .env file values without applying them, and keep only the ones the
+# system environment overrides (name -> .env value)
+_dotenv_overridden: Dict[str, Optional[str]] = {
+    name: value
+    for name, value in dotenv_values().items()
+    if name in os.environ and os.environ[name] != value
+}
 
 # Load .env file from project root if present.
 # Do NOT override existing environment variables (so CI/terminal env wins over .env).
 load_dotenv(override=False)
 
+# Environment as seen after .env is applied. Settings defaults are bound once
+# at import, so later lookups read this snapshot rather than os.environ.
+_env_snapshot: Dict[str, str] = dict(os.environ)
+
 # Track which variables were overridden
 _env_overrides: Set[str] = set()
 
 def _check_env_override(var_name: str) -> None:
     """Check if environment variable was overridden and log warning."""
-    if var_name in dotenv_vars and var_name in os.environ:
-        dotenv_value = dotenv_vars[var_name]
-        actual_value = os.environ[var_name]
-        if dotenv_value != actual_value:
-            _env_overrides.add(var_name)
-            # Don't log sensitive values
-            if 'KEY' in var_name or 'SECRET' in var_name or 'PASSPHRASE' in var_name:
-                logger.warning(f"⚠️ Environment variable '{var_name}' overridden (system env value used)")
-            else:
-                logger.warning(f"⚠️ Environment variable '{var_name}' overridden: .env={dotenv_value} -> actual={actual_value}")
-
-
-@dataclass
+    if var_name in _dotenv_overridden:
+        dotenv_value = _dotenv_overridden[var_name]
+        actual_value = _env_snapshot.get(var_name)
+        _env_overrides.add(var_name)
+        # Don't log sensitive values
+        if 'KEY' in var_name or 'SECRET' in var_name or 'PASSPHRASE' in var_name:
+            logger.warning(f"⚠️ Environment variable '{var_name}' overridden (system env value used)")
+        else:
+            logger.warning(f"⚠️ Environment variable '{var_name}' overridden: .env={dotenv_value} -> actual={actual_value}")
+
+
+@dataclass(frozen=True)
 class Settings:
     # Provider selection
     # Set PROVIDER to "polymarket" or "luno"
-    provider: str = os.getenv("PROVIDER", "polymarket")
+    provider: str = _env_snapshot.get("PROVIDER", "polymarket")
 
     # Strategy selection
     # Set STRATEGY to "binary_arbitrage", "copy_trading", "cross_exchange", etc.
-    strategy: str = os.getenv("STRATEGY", "binary_arbitrage")
+    strategy: str = _env_snapshot.get("STRATEGY", "binary_arbitrage")
 
     # Polymarket-specific settings
-    api_key: str = os.getenv("POLYMARKET_API_KEY", "")
-    api_secret: str = os.getenv("POLYMARKET_API_SECRET", "")
-    api_passphrase: str = os.getenv("POLYMARKET_API_PASSPHRASE", "")
-    private_key: str = os.getenv("POLYMARKET_PRIVATE_KEY", "")
-    signature_type: int = int(os.getenv("POLYMARKET_SIGNATURE_TYPE", "1"))
-    funder: str = os.getenv("POLYMARKET_FUNDER", "")
-    market_slug: str = os.getenv("POLYMARKET_MARKET_SLUG", "")
-    market_id: str = os.getenv("POLYMARKET_MARKET_ID", "")
-    yes_token_id: str = os.getenv("POLYMARKET_YES_TOKEN_ID", "")
-    no_token_id: str = os.getenv("POLYMARKET_NO_TOKEN_ID", "")
-    ws_url: str = os.getenv("POLYMARKET_WS_URL", "wss://ws-subscriptions-clob.polymarket.com")
-    use_wss: bool = os.getenv("USE_WSS", "false").lower() == "true"
+    api_key: str = _env_snapshot.get("POLYMARKET_API_KEY", "")
+    api_secret: str = _env_snapshot.get("POLYMARKET_API_SECRET", "")
+    api_passphrase: str = _env_snapshot.get("POLYMARKET_API_PASSPHRASE", "")
+    private_key: str = _env_snapshot.get("POLYMARKET_PRIVATE_KEY", "")
+    signature_type: int = int(_env_snapshot.get("POLYMARKET_SIGNATURE_TYPE", "1"))
+    funder: str = _env_snapshot.get("POLYMARKET_FUNDER", "")
+    market_slug: str = _env_snapshot.get("POLYMARKET_MARKET_SLUG", "")
+    market_id: str = _env_snapshot.get("POLYMARKET_MARKET_ID", "")
+    yes_token_id: str = _env_snapshot.get("POLYMARKET_YES_TOKEN_ID", "")
+    no_token_id: str = _env_snapshot.get("POLYMARKET_NO_TOKEN_ID", "")
+    ws_url: str = _env_snapshot.get("POLYMARKET_WS_URL", "wss://ws-subscriptions-clob.polymarket.com")
+    use_wss: bool = _env_snapshot.get("USE_WSS", "false").lower() == "true"
 
     # Luno-specific settings
-    luno_api_key_id: str = os.getenv("LUNO_API_KEY_ID", "")
-    luno_api_key_secret: str = os.getenv("LUNO_API_KEY_SECRET", "")
-    luno_default_pair: str = os.getenv("LUNO_DEFAULT_PAIR", "XBTZAR")
+    luno_api_key_id: str = _env_snapshot.get("LUNO_API_KEY_ID", "")
+    luno_api_key_secret: str = _env_snapshot.get("LUNO_API_KEY_SECRET", "")
+    luno_default_pair: str = _env_snapshot.get("LUNO_DEFAULT_PAIR", "XBTZAR")
 
     # Trading profile configuration
     # Set TRADING_PROFILE to one of: learning, testing, scaling, advanced, professional
     # Or set to "auto" to auto-select based on balance
-    trading_profile: str = os.getenv("TRADING_PROFILE", "auto")
+    trading_profile: str = _env_snapshot.get("TRADING_PROFILE", "auto")
 
     # Core trading parameters (can be overridden by profile)
-    target_pair_cost: float = float(os.getenv("TARGET_PAIR_COST", "0.99"))
-    balance_slack: float = float(os.getenv("BALANCE_SLACK", "0.15"))
-    order_size: float = float(os.getenv("ORDER_SIZE", "50"))
-    order_type: str = os.getenv("ORDER_TYPE", "FOK").upper()
-    yes_buy_threshold: float = float(os.getenv("YES_BUY_THRESHOLD", "0.45"))
-    no_buy_threshold: float = float(os.getenv("NO_BUY_THRESHOLD", "0.45"))
-    verbose: bool = os.getenv("VERBOSE", "false").lower() == "true"
-    dry_run: bool = os.getenv("DRY_RUN", "false").lower() == "true"
-    cooldown_seconds: float = float(os.getenv("COOLDOWN_SECONDS", "10"))
-    sim_balance: float = float(os.getenv("SIM_BALANCE", "0"))
+    target_pair_cost: float = float(_env_snapshot.get("TARGET_PAIR_COST", "0.99"))
+    balance_slack: float = float(_env_snapshot.get("BALANCE_SLACK", "0.15"))
+    order_size: float = float(_env_snapshot.get("ORDER_SIZE", "50"))
+    order_type: str = _env_snapshot.get("ORDER_TYPE", "FOK").upper()
+    yes_buy_threshold: float = float(_env_snapshot.get("YES_BUY_THRESHOLD", "0.45"))
+    no_buy_threshold: float = float(_env_snapshot.get("NO_BUY_THRESHOLD", "0.45"))
+    verbose: bool = _env_snapshot.get("VERBOSE", "false").lower() == "true"
+    dry_run: bool = _env_snapshot.get("DRY_RUN", "false").lower() == "true"
+    cooldown_seconds: float = float(_env_snapshot.get("COOLDOWN_SECONDS", "10"))
+    sim_balance: float = float(_env_snapshot.get("SIM_BALANCE", "0"))
 
     # Risk management settings (can be overridden by profile)
-    max_daily_loss: float = float(os.getenv("MAX_DAILY_LOSS", "0"))  # 0 = disabled
-    max_position_size: float = float(os.getenv("MAX_POSITION_SIZE", "0"))  # 0 = disabled
-    max_trades_per_day: int = int(os.getenv("MAX_TRADES_PER_DAY", "0"))  # 0 = disabled
-    min_balance_required: float = float(os.getenv("MIN_BALANCE_REQUIRED", "10.0"))
-    max_balance_utilization: float = float(os.getenv("MAX_BALANCE_UTILIZATION", "0.8"))
+    max_daily_loss: float = float(_env_snapshot.get("MAX_DAILY_LOSS", "0"))  # 0 = disabled
+    max_position_size: float = float(_env_snapshot.get("MAX_POSITION_SIZE", "0"))  # 0 = disabled
+    max_trades_per_day: int = int(_env_snapshot.get("MAX_TRADES_PER_DAY", "0"))  # 0 = disabled
+    min_balance_required: float = float(_env_snapshot.get("MIN_BALANCE_REQUIRED", "10.0"))
+    max_balance_utilization: float = float(_env_snapshot.get("MAX_BALANCE_UTILIZATION", "0.8"))
 
     # Statistics and logging
-    enable_stats: bool = os.getenv("ENABLE_STATS", "true").lower() == "true"
-    trade_log_file: str = os.getenv("TRADE_LOG_FILE", "trades.json")
-    use_rich_output: bool = os.getenv("USE_RICH_OUTPUT", "true").lower() == "true"
+    enable_stats: bool = _env_snapshot.get("ENABLE_STATS", "true").lower() == "true"
+    trade_log_file: str = _env_snapshot.get("TRADE_LOG_FILE", "trades.json")
+    use_rich_output: bool = _env_snapshot.get("USE_RICH_OUTPUT", "true").lower() == "true"
 
 
 def load_settings() -> Settings:
@@ -119,8 +134,8 @@ def apply_profile_to_settings(
     """
     Apply capital-based profile settings to override default configuration.
 
-    This function modifies settings based on the selected trading profile,
-    optimizing parameters for the available capital.
+    Settings are immutable, so this returns a copy with parameters adjusted
+    for the selected trading profile and the available capital.
 
     Args:
         settings: Base settings loaded from environment
@@ -135,20 +150,13 @@ def apply_profile_to_settings(
         >>> settings = apply_profile_to_settings(settings, balance=750.0)
         # Settings now optimized for $750 capital (Scaling profile)
     """
-    from .profiles import (
-        auto_select_profile,
-        get_profile_by_name,
-        validate_capital_for_profile,
-        calculate_position_size,
-    )
-
     # Determine which profile to use
     profile_name = force_profile or settings.trading_profile
 
     if profile_name == "auto":
         # Auto-select based on balance
         profile = auto_select_profile(balance)
-        logger.info(f"🤖 Auto-selected trading profile: {profile.name} (balance: ${balance:.2f})")
+        logger.info("🤖 Auto-selected trading profile: %s (balance: $%.2f)", profile.name, balance)
     else:
         # Use explicitly specified profile
         profile = get_profile_by_name(profile_name)
@@ -156,61 +164,62 @@ def apply_profile_to_settings(
             logger.warning(f"⚠️ Unknown trading profile '{profile_name}', using auto-selection")
             profile = auto_select_profile(balance)
         else:
-            logger.info(f"📋 Using trading profile: {profile.name}")
+            logger.info("📋 Using trading profile: %s", profile.name)
 
     # Validate capital for this profile
     is_valid, msg = validate_capital_for_profile(balance, profile)
     logger.info(msg)
 
     # Display profile info
-    logger.info(f"   Spread requirement: {profile.spread_requirement:.1f}%")
-    logger.info(f"   Max daily trades: {profile.max_trades_per_day}")
-    logger.info(f"   Position size: {profile.order_size:.0f} shares")
-    logger.info(f"   Max daily loss: {profile.max_daily_loss * 100:.1f}%")
+    logger.info("   Spread requirement: %.1f%%", profile.spread_requirement)
+    logger.info("   Max daily trades: %s", profile.max_trades_per_day)
+    logger.info("   Position size: %.0f shares", profile.order_size)
+    logger.info("   Max daily loss: %.1f%%", profile.max_daily_loss * 100)
 
     # Apply profile settings (only if not explicitly set in environment)
     # Priority: ENV var > Profile defaults > Original settings
+    overrides: Dict[str, Any] = {}
 
     # Profit threshold (most important for strategy)
-    if os.getenv("TARGET_PAIR_COST") is None:
-        settings.target_pair_cost = profile.profit_threshold
-        logger.info(f"   ✓ Applied profit threshold: {profile.profit_threshold} ({profile.spread_requirement:.1f}% spread)")
+    if "TARGET_PAIR_COST" not in _env_snapshot:
+        overrides["target_pair_cost"] = profile.profit_threshold
+        logger.info("   ✓ Applied profit threshold: %s (%.1f%% spread)", profile.profit_threshold, profile.spread_requirement)
 
     # Position sizing
-    if os.getenv("ORDER_SIZE") is None:
+    if "ORDER_SIZE" not in _env_snapshot:
         manual_override = None
     else:
         manual_override = settings.order_size
 
     calculated_size = calculate_position_size(balance, profile, manual_override)
-    settings.order_size = calculated_size
+    overrides["order_size"] = calculated_size
 
     # Risk management
-    if os.getenv("MAX_POSITION_SIZE") is None or settings.max_position_size == 0:
-        settings.max_position_size = profile.max_position_size
-        logger.info(f"   ✓ Applied max position size: {profile.max_position_size:.0f} shares")
+    if "MAX_POSITION_SIZE" not in _env_snapshot or settings.max_position_size == 0:
+        overrides["max_position_size"] = profile.max_position_size
+        logger.info("   ✓ Applied max position size: %.0f shares", profile.max_position_size)
 
-    if os.getenv("MAX_TRADES_PER_DAY") is None or settings.max_trades_per_day == 0:
-        settings.max_trades_per_day = profile.max_trades_per_day
-        logger.info(f"   ✓ Applied max trades per day: {profile.max_trades_per_day}")
+    if "MAX_TRADES_PER_DAY" not in _env_snapshot or settings.max_trades_per_day == 0:
+        overrides["max_trades_per_day"] = profile.max_trades_per_day
+        logger.info("   ✓ Applied max trades per day: %s", profile.max_trades_per_day)
 
-    if os.getenv("MAX_DAILY_LOSS") is None or settings.max_daily_loss == 0:
-        settings.max_daily_loss = balance * profile.max_daily_loss
-        logger.info(f"   ✓ Applied max daily loss: ${settings.max_daily_loss:.2f} ({profile.max_daily_loss * 100:.1f}%)")
+    if "MAX_DAILY_LOSS" not in _env_snapshot or settings.max_daily_loss == 0:
+        overrides["max_daily_loss"] = balance * profile.max_daily_loss
+        logger.info("   ✓ Applied max daily loss: $%.2f (%.1f%%)", overrides["max_daily_loss"], profile.max_daily_loss * 100)
 
-    if os.getenv("MAX_BALANCE_UTILIZATION") is None:
-        settings.max_balance_utilization = profile.balance_utilization
-        logger.info(f"   ✓ Applied balance utilization: {profile.balance_utilization * 100:.0f}%")
+    if "MAX_BALANCE_UTILIZATION" not in _env_snapshot:
+        overrides["max_balance_utilization"] = profile.balance_utilization
+        logger.info("   ✓ Applied balance utilization: %.0f%%", profile.balance_utilization * 100)
 
-    if os.getenv("COOLDOWN_SECONDS") is None:
-        settings.cooldown_seconds = profile.cooldown_seconds
-        logger.info(f"   ✓ Applied cooldown: {profile.cooldown_seconds:.0f}s")
+    if "COOLDOWN_SECONDS" not in _env_snapshot:
+        overrides["cooldown_seconds"] = profile.cooldown_seconds
+        logger.info("   ✓ Applied cooldown: %.0fs", profile.cooldown_seconds)
 
     # DRY_RUN recommendation
     if profile.recommended_dry_run and not settings.dry_run:
         logger.warning(f"⚠️ {profile.name} profile recommends DRY_RUN mode for learning. Set DRY_RUN=true in .env")
 
-    return settings
+    return replace(settings, **overrides)
 
 
 def get_env_overrides() -> Set[str]:
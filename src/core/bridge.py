@@ -12,7 +12,9 @@ and the new generic abstraction layer. It allows:
 
 from typing import Dict, Any, Optional, List
 import asyncio
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
 
 from ..providers.base import BaseProvider, Order, OrderSide, OrderType
 from ..strategies.base import (
@@ -36,40 +38,197 @@ from .strategy import (
 from .adapters.trading import TradingVenueAdapter, FinancialAssetAdapter
 
 
+LEGACY_STRATEGY_VERSION = "1.0.0"
+
+# Legacy strategies tag their opportunities with metadata["_opp_type"]
+_OPP_TYPE_MAP = MappingProxyType({
+    opp_type.value: opp_type for opp_type in OpportunityType
+})
+
+# Legacy millisecond timestamps <-> naive UTC datetimes, using exact integer
+# timedelta arithmetic so conversions round-trip without loss
+_EPOCH = datetime(1970, 1, 1)
+_ONE_MS = timedelta(milliseconds=1)
+
+
+def _legacy_detected_at(timestamp_ms: int) -> datetime:
+    """Naive UTC datetime for a legacy millisecond timestamp"""
+    return _EPOCH + timestamp_ms * _ONE_MS
+
+
+def _legacy_timestamp_ms(opportunity: Opportunity) -> int:
+    """Legacy millisecond timestamp for a generic Opportunity (naive = UTC)"""
+    detected_at = opportunity.detected_at
+    if detected_at.tzinfo is not None:
+        detected_at = detected_at.astimezone(timezone.utc).replace(tzinfo=None)
+    return (detected_at - _EPOCH) // _ONE_MS
+
+
+class _LegacyOpportunityView:
+    """
+    Read-only legacy Opportunity view of a generic Opportunity.
+
+    Handed to legacy strategies on execution instead of copying the generic
+    opportunity into a new LegacyOpportunity. Legacy strategies only read
+    these fields.
+    """
+
+    __slots__ = ("_opportunity",)
+
+    def __init__(self, opportunity: Opportunity):
+        self._opportunity = opportunity
+
+    @property
+    def strategy_name(self) -> str:
+        return self._opportunity.strategy_name
+
+    @property
+    def timestamp(self) -> int:
+        return _legacy_timestamp_ms(self._opportunity)
+
+    @property
+    def confidence(self) -> float:
+        return self._opportunity.confidence
+
+    @property
+    def expected_profit(self) -> float:
+        return self._opportunity.expected_profit
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        return self._opportunity.metadata
+
+    __str__ = LegacyOpportunity.__str__
+
+
 class LegacyProviderWrapper:
     """
     Wraps a new generic Venue to look like a legacy BaseProvider.
 
     This allows new Venue implementations to be used with existing strategies.
+
+    Code already running under asyncio should await the ``a*`` methods
+    (aplace_order, aget_orderbook, ...). The plain methods are blocking
+    shims for sync callers: they run the same coroutines on one long-lived
+    event loop in a daemon thread. Call close() when the wrapper is no
+    longer needed.
+
+    The sync shims and the ``a*`` methods therefore run on different event
+    loops. Venue state bound to a loop (client sessions, locks, futures)
+    must not be shared between the two; use one style per wrapper.
     """
 
     def __init__(self, venue: TradingVenueAdapter):
         self.venue = venue
         self._connected = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+        self._asset_cache: Dict[str, Asset] = {}
+
+    def _run(self, coro):
+        """Run a venue coroutine on the wrapper's loop and wait for its result"""
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError(
+                "Synchronous LegacyProviderWrapper methods cannot be called from "
+                "the wrapper's own event loop; await the a* methods instead"
+            )
+
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="legacy-provider-loop",
+                    daemon=True
+                )
+                self._thread.start()
+            loop = self._loop
+
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    async def _get_asset(self, pair: str) -> Asset:
+        """Look up the venue asset for a pair, caching the result"""
+        asset = self._asset_cache.get(pair)
+        if asset is None:
+            asset = await self.venue.get_asset(pair)
+            self._asset_cache[pair] = asset
+        return asset
+
+    def invalidate_asset(self, pair: str):
+        """Drop a cached asset so the next call fetches it again"""
+        self._asset_cache.pop(pair, None)
+
+    def close(self):
+        """
+        Stop the background event loop.
+
+        Venue calls still in flight are cancelled (their callers get
+        CancelledError) and allowed to clean up before the loop closes.
+        """
+        with self._loop_lock:
+            loop, thread = self._loop, self._thread
+            if loop is None:
+                return
+            if threading.current_thread() is thread:
+                raise RuntimeError("close() cannot be called from the wrapper's own event loop")
+            self._loop = None
+            self._thread = None
+
+        # Clean up on the loop's own thread, so close() also works from
+        # threads that are running an event loop of their own
+        asyncio.run_coroutine_threadsafe(self._shutdown_loop(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    @staticmethod
+    async def _shutdown_loop():
+        """Cancel and drain outstanding venue calls, then close async generators"""
+        current = asyncio.current_task()
+        pending = [task for task in asyncio.all_tasks() if task is not current]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        await asyncio.get_running_loop().shutdown_asyncgens()
+
+    async def aconnect(self):
+        """Connect to venue"""
+        await self.venue.connect()
+        self._connected = True
 
     def connect(self):
         """Connect to venue (synchronous wrapper)"""
-        asyncio.run(self.venue.connect())
-        self._connected = True
+        self._run(self.aconnect())
 
-    def disconnect(self):
+    async def adisconnect(self):
         """Disconnect from venue"""
-        asyncio.run(self.venue.disconnect())
+        await self.venue.disconnect()
         self._connected = False
+        self._asset_cache.clear()
+
+    def disconnect(self):
+        """Disconnect from venue (synchronous wrapper)"""
+        self._run(self.adisconnect())
+
+    async def aget_balance(self, asset: Optional[str] = None) -> Dict[str, Any]:
+        """Get balance (the provider call blocks, so it runs in a worker thread)"""
+        return await asyncio.to_thread(self.venue.provider.get_balance, asset)
 
     def get_balance(self, asset: Optional[str] = None) -> Dict[str, Any]:
-        """Get balance (synchronous wrapper)"""
-        # This would need async handling in real implementation
-        # For now, return empty dict as placeholder
-        return {}
+        """Get balance straight from the venue's underlying provider"""
+        return self.venue.provider.get_balance(asset)
+
+    async def aget_orderbook(self, pair: str, depth: int = 100):
+        """Get orderbook"""
+        return await self.venue.get_orderbook(asset=await self._get_asset(pair))
 
     def get_orderbook(self, pair: str, depth: int = 100):
         """Get orderbook (synchronous wrapper)"""
-        return asyncio.run(self.venue.get_orderbook(
-            asset=asyncio.run(self.venue.get_asset(pair))
-        ))
+        return self._run(self.aget_orderbook(pair, depth))
 
-    def place_order(
+    async def aplace_order(
         self,
         pair: str,
         side: OrderSide,
@@ -78,9 +237,9 @@ class LegacyProviderWrapper:
         price: Optional[float] = None,
         **kwargs
     ) -> Order:
-        """Place order (synchronous wrapper)"""
+        """Place order"""
         # Create action request
-        asset = asyncio.run(self.venue.get_asset(pair))
+        asset = await self._get_asset(pair)
 
         request = ActionRequest(
             action_type=ActionType.PLACE_ORDER,
@@ -91,7 +250,7 @@ class LegacyProviderWrapper:
             order_type=order_type.value.lower()
         )
 
-        result = asyncio.run(self.venue.execute_action(request))
+        result = await self.venue.execute_action(request)
 
         # Convert ActionResult to Order
         from ..providers.base import Order, OrderStatus
@@ -109,9 +268,21 @@ class LegacyProviderWrapper:
             updated_at=int((result.completed_at or result.submitted_at).timestamp() * 1000)
         )
 
-    def get_order(self, order_id: str) -> Order:
+    def place_order(
+        self,
+        pair: str,
+        side: OrderSide,
+        order_type: OrderType,
+        size: float,
+        price: Optional[float] = None,
+        **kwargs
+    ) -> Order:
+        """Place order (synchronous wrapper)"""
+        return self._run(self.aplace_order(pair, side, order_type, size, price, **kwargs))
+
+    async def aget_order(self, order_id: str) -> Order:
         """Get order status"""
-        result = asyncio.run(self.venue.query_action_status(order_id))
+        result = await self.venue.query_action_status(order_id)
 
         from ..providers.base import Order, OrderStatus
 
@@ -131,7 +302,11 @@ class LegacyProviderWrapper:
             updated_at=0
         )
 
-    def cancel_order(self, order_id: str) -> bool:
+    def get_order(self, order_id: str) -> Order:
+        """Get order status (synchronous wrapper)"""
+        return self._run(self.aget_order(order_id))
+
+    async def acancel_order(self, order_id: str) -> bool:
         """Cancel order"""
         request = ActionRequest(
             action_type=ActionType.CANCEL_ORDER,
@@ -140,14 +315,22 @@ class LegacyProviderWrapper:
             metadata={"order_id": order_id}
         )
 
-        result = asyncio.run(self.venue.execute_action(request))
+        result = await self.venue.execute_action(request)
         return result.success
 
-    def get_markets(self) -> List[str]:
+    def cancel_order(self, order_id: str) -> bool:
+        """Cancel order (synchronous wrapper)"""
+        return self._run(self.acancel_order(order_id))
+
+    async def aget_markets(self) -> List[str]:
         """Get available markets"""
-        assets = asyncio.run(self.venue.list_assets())
+        assets = await self.venue.list_assets()
         return [asset.symbol for asset in assets]
 
+    def get_markets(self) -> List[str]:
+        """Get available markets (synchronous wrapper)"""
+        return self._run(self.aget_markets())
+
 
 class StrategyBridge(Strategy):
     """
@@ -210,18 +393,53 @@ class StrategyBridge(Strategy):
         generic_opp = self._convert_legacy_opportunity(legacy_opp)
         return [generic_opp]
 
+    @classmethod
+    async def find_opportunities_across(
+        cls,
+        bridges: List["StrategyBridge"]
+    ) -> List[Opportunity]:
+        """
+        Scan several legacy strategies concurrently.
+
+        A strategy that raises is logged and skipped so it cannot hide
+        opportunities found by the others.
+
+        Args:
+            bridges: StrategyBridge instances to scan
+
+        Returns:
+            Generic opportunities, in the same order as ``bridges``
+        """
+        results = await asyncio.gather(
+            *(bridge.legacy_strategy.find_opportunity() for bridge in bridges),
+            return_exceptions=True
+        )
+
+        opportunities = []
+        for bridge, legacy_opp in zip(bridges, results):
+            if isinstance(legacy_opp, Exception):
+                bridge.legacy_strategy.logger.error(
+                    f"Error finding opportunity: {legacy_opp}"
+                )
+            elif legacy_opp is not None:
+                opportunities.append(bridge._convert_legacy_opportunity(legacy_opp))
+        return opportunities
+
     def _convert_legacy_opportunity(self, legacy_opp: LegacyOpportunity) -> Opportunity:
         """Convert legacy Opportunity to generic Opportunity"""
         return Opportunity(
             opportunity_id=f"{legacy_opp.strategy_name}_{legacy_opp.timestamp}",
-            opportunity_type=OpportunityType.ARBITRAGE,  # Default assumption
+            opportunity_type=_OPP_TYPE_MAP.get(
+                legacy_opp.metadata.get("_opp_type"),
+                OpportunityType.ARBITRAGE  # Default assumption
+            ),
             strategy_name=legacy_opp.strategy_name,
-            strategy_version="1.0.0",
+            strategy_version=LEGACY_STRATEGY_VERSION,
             confidence=legacy_opp.confidence,
             expected_profit=legacy_opp.expected_profit,
             expected_cost=0.0,  # Not available in legacy
             expected_roi=0.0,  # Would need to calculate
-            detected_at=datetime.fromtimestamp(legacy_opp.timestamp / 1000),
+            detected_at=_legacy_detected_at(legacy_opp.timestamp),
             metadata=legacy_opp.metadata
         )
 
@@ -232,18 +450,11 @@ class StrategyBridge(Strategy):
 
     async def execute_opportunity(self, opportunity: Opportunity) -> ExecutionResult:
         """Execute opportunity using legacy strategy"""
-        # Convert generic Opportunity back to legacy
-        legacy_opp = LegacyOpportunity(
-            strategy_name=opportunity.strategy_name,
-            timestamp=int(opportunity.detected_at.timestamp() * 1000),
-            confidence=opportunity.confidence,
-            expected_profit=opportunity.expected_profit,
-            metadata=opportunity.metadata
+        # Execute using legacy strategy, through a legacy view of the opportunity
+        legacy_result = await self.legacy_strategy.execute(
+            _LegacyOpportunityView(opportunity)
         )
 
-        # Execute using legacy strategy
-        legacy_result = await self.legacy_strategy.execute(legacy_opp)
-
         # Convert legacy TradeResult to generic ExecutionResult
         return self._convert_legacy_result(opportunity, legacy_result)
 
@@ -273,23 +484,26 @@ class OpportunityConverter:
     @staticmethod
     def to_generic(legacy_opp: LegacyOpportunity) -> Opportunity:
         """Convert legacy Opportunity to generic Opportunity"""
-        # Infer opportunity type from metadata
-        opp_type = OpportunityType.CUSTOM
-        if "arbitrage" in legacy_opp.metadata:
-            opp_type = OpportunityType.ARBITRAGE
-        elif "spread" in legacy_opp.metadata:
-            opp_type = OpportunityType.MARKET_MAKING
+        metadata = legacy_opp.metadata
+        opp_type = _OPP_TYPE_MAP.get(metadata.get("_opp_type"))
+        if opp_type is None:
+            # Untagged opportunity: infer the type from metadata keys
+            opp_type = OpportunityType.CUSTOM
+            if "arbitrage" in metadata:
+                opp_type = OpportunityType.ARBITRAGE
+            elif "spread" in metadata:
+                opp_type = OpportunityType.MARKET_MAKING
 
         return Opportunity(
             opportunity_id=f"{legacy_opp.strategy_name}_{legacy_opp.timestamp}",
             opportunity_type=opp_type,
             strategy_name=legacy_opp.strategy_name,
-            strategy_version="1.0.0",
+            strategy_version=LEGACY_STRATEGY_VERSION,
             confidence=legacy_opp.confidence,
             expected_profit=legacy_opp.expected_profit,
             expected_cost=0.0,
             expected_roi=0.0,
-            detected_at=datetime.fromtimestamp(legacy_opp.timestamp / 1000),
+            detected_at=_legacy_detected_at(legacy_opp.timestamp),
             metadata=legacy_opp.metadata
         )
 
@@ -298,7 +512,7 @@ class OpportunityConverter:
         """Convert generic Opportunity to legacy Opportunity"""
         return LegacyOpportunity(
             strategy_name=generic_opp.strategy_name,
-            timestamp=int(generic_opp.detected_at.timestamp() * 1000),
+            timestamp=_legacy_timestamp_ms(generic_opp),
             confidence=generic_opp.confidence,
             expected_profit=generic_opp.expected_profit,
             metadata=generic_opp.metadata
@@ -36,6 +36,7 @@ from .config import (
     ResilienceConfig,
     EmergencyConfig,
     get_config,
+    clear_config_cache,
     Environment
 )
 
@@ -47,5 +48,6 @@ __all__ = [
     "ResilienceConfig",
     "EmergencyConfig",
     "get_config",
+    "clear_config_cache",
     "Environment",
 ]
@@ -2,12 +2,17 @@
 Configuration Models
 
 Type-safe configuration using Pydantic.
+
+Configuration objects are immutable. get_config() and the environment
+presets return one shared, cached instance per environment; call
+clear_config_cache() to rebuild them.
 """
 
 from enum import Enum
+from functools import lru_cache
 from typing import Literal, Optional
-from pydantic import BaseModel, Field
-from pydantic_settings import BaseSettings
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Environment(str, Enum):
@@ -19,6 +24,8 @@ class Environment(str, Enum):
 
 class StateConfig(BaseModel):
     """State management configuration"""
+    model_config = ConfigDict(frozen=True)
+
     backend: Literal["memory", "redis"] = Field(
         default="memory",
         description="State backend to use"
@@ -27,6 +34,11 @@ class StateConfig(BaseModel):
         default="redis://localhost:6379",
         description="Redis connection URL"
     )
+    redis_max_connections: int = Field(
+        default=32,
+        ge=1,
+        description="Maximum pooled Redis connections"
+    )
     key_prefix: str = Field(
         default="bot",
         description="Prefix for all state keys"
@@ -35,6 +47,8 @@ class StateConfig(BaseModel):
 
 class EventsConfig(BaseModel):
     """Event bus configuration"""
+    model_config = ConfigDict(frozen=True)
+
     backend: Literal["memory", "redis"] = Field(
         default="memory",
         description="Event bus backend to use"
@@ -47,6 +61,8 @@ class EventsConfig(BaseModel):
 
 class LoggingConfig(BaseModel):
     """Logging configuration"""
+    model_config = ConfigDict(frozen=True)
+
     level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(
         default="INFO",
         description="Log level"
@@ -67,6 +83,7 @@ class LoggingConfig(BaseModel):
 
 class ResilienceConfig(BaseModel):
     """Resilience patterns configuration"""
+    model_config = ConfigDict(frozen=True)
 
     # Retry configuration
     retry_max_attempts: int = Field(
@@ -132,6 +149,7 @@ class ResilienceConfig(BaseModel):
 
 class EmergencyConfig(BaseModel):
     """Emergency controls configuration"""
+    model_config = ConfigDict(frozen=True)
 
     # Risk limits
     daily_loss_limit: float = Field(
@@ -163,6 +181,7 @@ class EmergencyConfig(BaseModel):
 
 class VersioningConfig(BaseModel):
     """Versioning configuration"""
+    model_config = ConfigDict(frozen=True)
 
     backend: Literal["memory", "redis"] = Field(
         default="memory",
@@ -274,12 +293,15 @@ class Config(BaseSettings):
         description="Versioning configuration"
     )
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        env_nested_delimiter = "__"  # e.g., STATE__BACKEND=redis
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        env_nested_delimiter="__",  # e.g., STATE__BACKEND=redis
+        frozen=True
+    )
 
 
+@lru_cache(maxsize=None)
 def get_development_config() -> Config:
     """
     Get development configuration.
@@ -321,6 +343,7 @@ def get_development_config() -> Config:
     )
 
 
+@lru_cache(maxsize=None)
 def get_staging_config() -> Config:
     """
     Get staging configuration.
@@ -362,6 +385,7 @@ def get_staging_config() -> Config:
     )
 
 
+@lru_cache(maxsize=None)
 def get_production_config() -> Config:
     """
     Get production configuration.
@@ -410,6 +434,7 @@ def get_production_config() -> Config:
     )
 
 
+@lru_cache(maxsize=None)
 def get_config(env: Optional[str] = None) -> Config:
     """
     Get configuration for specified environment.
@@ -419,7 +444,9 @@ def get_config(env: Optional[str] = None) -> Config:
              If None, loads from ENV environment variable
 
     Returns:
-        Configuration instance
+        Configuration instance, shared by all callers asking for the same
+        environment. Use clear_config_cache() to pick up changes to
+        environment variables or .env.
 
     Usage:
         # Load from environment variable
@@ -447,3 +474,15 @@ def get_config(env: Optional[str] = None) -> Config:
             f"Unknown environment: {env}. "
             f"Use 'development', 'staging', or 'production'"
         )
+
+
+def clear_config_cache():
+    """
+    Drop cached configurations.
+
+    The next get_config() call (and each preset) builds a fresh instance.
+    """
+    get_config.cache_clear()
+    get_development_config.cache_clear()
+    get_staging_config.cache_clear()
+    get_production_config.cache_clear()
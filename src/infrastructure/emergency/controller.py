@@ -7,8 +7,9 @@ Provides emergency halt and control mechanisms for trading bots.
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Optional, Callable, Awaitable, Dict, Any
+from typing import Optional, Callable, Awaitable, Dict, Any, Union
 import asyncio
+import inspect
 from src.infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
@@ -56,7 +57,7 @@ class EmergencyEvent:
     metadata: Dict[str, Any]
 
 
-EventHandler = Callable[[EmergencyEvent], Awaitable[None]]
+EventHandler = Callable[[EmergencyEvent], Union[Awaitable[None], None]]
 
 
 class EmergencyController:
@@ -293,6 +294,44 @@ class EmergencyController:
         """
         await self.set_state(EmergencyState.NORMAL, reason, **metadata)
 
+    async def reset(self, reason: str = "Reset"):
+        """
+        Reset controller to initial state.
+
+        Transitions to NORMAL and clears halt details, metadata and tracked
+        risk limits in one step, then notifies handlers if the state
+        changed. Subscribed handlers are kept.
+
+        Args:
+            reason: Reason for reset
+        """
+        async with self._lock:
+            previous_state = self._state
+
+            self._state = EmergencyState.NORMAL
+            self._halt_reason = None
+            self._halt_timestamp = None
+            self._metadata = {}
+            self._risk_limits.clear()
+
+            logger.info(
+                "emergency_controller_reset",
+                controller_id=self.controller_id,
+                previous_state=previous_state.value,
+                reason=reason
+            )
+
+            # Notify only once the controller is fully reset
+            if previous_state != EmergencyState.NORMAL:
+                await self._notify_handlers(EmergencyEvent(
+                    controller_id=self.controller_id,
+                    previous_state=previous_state,
+                    new_state=EmergencyState.NORMAL,
+                    reason=reason,
+                    timestamp=datetime.utcnow(),
+                    metadata={}
+                ))
+
     async def check_risk_limit(
         self,
         limit_type: str,
@@ -345,17 +384,17 @@ class EmergencyController:
 
             raise RiskLimitExceeded(limit_type, current_value, limit_value)
 
-        # Warn if approaching limit (80% threshold)
+        # Warn if approaching limit (80% threshold); compare magnitudes so the
+        # common well-within-limit case does no division
         threshold = 0.8
-        utilization = abs(current_value / limit_value) if limit_value != 0 else 0
-        if utilization >= threshold:
+        if limit_value != 0 and abs(current_value) >= threshold * abs(limit_value):
             logger.warning(
                 "risk_limit_approaching",
                 controller_id=self.controller_id,
                 limit_type=limit_type,
                 current=current_value,
                 limit=limit_value,
-                utilization=utilization
+                utilization=abs(current_value / limit_value)
             )
 
     async def subscribe(self, handler: EventHandler):
@@ -363,7 +402,8 @@ class EmergencyController:
         Subscribe to emergency state changes.
 
         Args:
-            handler: Async function to call on state changes
+            handler: Function to call on state changes (async functions run
+                     on the event loop, plain functions in the default executor)
         """
         async with self._lock:
             self._handlers.append(handler)
@@ -392,19 +432,33 @@ class EmergencyController:
         )
 
     async def _notify_handlers(self, event: EmergencyEvent):
-        """Notify all subscribed handlers of state change"""
+        """Notify all subscribed handlers of state change (concurrently)"""
         handlers = self._handlers.copy()
 
-        for handler in handlers:
-            try:
+        # A slow handler must not delay the others from seeing a halt
+        await asyncio.gather(
+            *(self._safe_call_handler(handler, event) for handler in handlers)
+        )
+
+    async def _safe_call_handler(self, handler: EventHandler, event: EmergencyEvent):
+        """Call one handler, logging instead of raising its errors"""
+        try:
+            if asyncio.iscoroutinefunction(handler):
                 await handler(event)
-            except Exception as e:
-                logger.error(
-                    "emergency_handler_error",
-                    controller_id=self.controller_id,
-                    error=str(e),
-                    error_type=type(e).__name__
-                )
+            else:
+                # Plain callables may block (disk, network), so run them in
+                # the default executor instead of on the event loop
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(None, handler, event)
+                if inspect.isawaitable(result):
+                    await result
+        except Exception as e:
+            logger.error(
+                "emergency_handler_error",
+                controller_id=self.controller_id,
+                error=str(e),
+                error_type=type(e).__name__
+            )
 
     def get_status(self) -> Dict[str, Any]:
         """
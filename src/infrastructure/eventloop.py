@@ -0,0 +1,44 @@
+"""
+Event Loop Selection
+
+Optional uvloop support for async entry points.
+
+uvloop is a libuv-backed drop-in replacement for the default asyncio event
+loop with lower per-callback overhead. It is not available on Windows and is
+not a hard dependency, so entry points fall back to the stock loop when it
+cannot be used.
+
+Usage:
+    from src.infrastructure.eventloop import install_uvloop
+
+    if __name__ == "__main__":
+        install_uvloop()
+        asyncio.run(main())
+"""
+
+import asyncio
+import sys
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    uvloop = None
+    UVLOOP_AVAILABLE = False
+
+
+def install_uvloop() -> bool:
+    """
+    Use uvloop for event loops created after this call.
+
+    Must be called before asyncio.run() (or any other loop creation).
+    Does nothing on Windows or when uvloop is not installed.
+
+    Returns:
+        True if uvloop was installed, False if the default loop is kept
+    """
+    if not UVLOOP_AVAILABLE or sys.platform == "win32":
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
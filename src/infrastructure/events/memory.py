@@ -5,7 +5,7 @@ Fast, simple event bus for local development and testing.
 Events are delivered synchronously within the same process.
 """
 
-from typing import Dict, Set
+from typing import Dict, Set, FrozenSet
 import asyncio
 from .base import EventBus, EventHandler
 
@@ -32,8 +32,9 @@ class InMemoryEventBus(EventBus):
     """
 
     def __init__(self):
-        # Map of channel -> set of handlers
-        self._handlers: Dict[str, Set[EventHandler]] = {}
+        # Map of channel -> handlers. The sets are immutable and replaced on
+        # (un)subscribe, so publish can iterate them without locking or copying
+        self._handlers: Dict[str, FrozenSet[EventHandler]] = {}
         self._lock = asyncio.Lock()
         self._running = False
 
@@ -44,10 +45,9 @@ class InMemoryEventBus(EventBus):
         Note: In-memory implementation calls all handlers synchronously.
         If a handler is slow, it will block other handlers on the same channel.
         """
-        async with self._lock:
-            handlers = self._handlers.get(channel, set()).copy()
+        # Snapshot of subscribers at publish time (never mutated in place)
+        handlers = self._handlers.get(channel, ())
 
-        # Call handlers outside lock to avoid blocking
         for handler in handlers:
             try:
                 await handler(event)
@@ -58,18 +58,13 @@ class InMemoryEventBus(EventBus):
     async def subscribe(self, channel: str, handler: EventHandler):
         """Subscribe handler to channel"""
         async with self._lock:
-            if channel not in self._handlers:
-                self._handlers[channel] = set()
-            self._handlers[channel].add(handler)
+            self._handlers[channel] = self._handlers.get(channel, frozenset()) | {handler}
 
     async def unsubscribe(self, channel: str, handler: EventHandler):
         """Unsubscribe handler from channel"""
         async with self._lock:
             if channel in self._handlers:
-                self._handlers[channel].discard(handler)
-                # Clean up empty channel
-                if not self._handlers[channel]:
-                    del self._handlers[channel]
+                self._remove_handler(channel, handler)
 
     async def start_listening(self):
         """Start listening (no-op for in-memory)"""
@@ -91,10 +86,16 @@ class InMemoryEventBus(EventBus):
         """Unsubscribe handler from all channels"""
         async with self._lock:
             for channel in list(self._handlers.keys()):
-                self._handlers[channel].discard(handler)
-                # Clean up empty channels
-                if not self._handlers[channel]:
-                    del self._handlers[channel]
+                self._remove_handler(channel, handler)
+
+    def _remove_handler(self, channel: str, handler: EventHandler):
+        """Replace channel's handler set without handler. Caller holds the lock."""
+        remaining = self._handlers[channel] - {handler}
+        if remaining:
+            self._handlers[channel] = remaining
+        else:
+            # Clean up empty channel
+            del self._handlers[channel]
 
     async def get_channels(self) -> list[str]:
         """Get list of active channels"""
@@ -116,6 +117,6 @@ class InMemoryEventBus(EventBus):
         """Get all handlers (useful for debugging)"""
         async with self._lock:
             return {
-                channel: handlers.copy()
+                channel: set(handlers)
                 for channel, handlers in self._handlers.items()
             }
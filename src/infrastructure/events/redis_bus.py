@@ -10,6 +10,9 @@ import json
 import asyncio
 from .base import EventBus, EventHandler, PublishError, SubscribeError
 
+# Undelivered events held per handler before new ones are dropped
+_MAX_PENDING_EVENTS = 1000
+
 
 class RedisEventBus(EventBus):
     """
@@ -19,6 +22,7 @@ class RedisEventBus(EventBus):
     - Multi-process (shared across workers)
     - Persistent connections
     - Background listener task
+    - One bounded delivery queue and drain task per handler
     - Pattern matching support
     - High throughput
 
@@ -31,7 +35,11 @@ class RedisEventBus(EventBus):
     Limitations:
     - No message persistence (events are fire-and-forget)
     - No guaranteed delivery (if subscriber is down, event is lost)
-    - No message ordering guarantees across channels
+    - No message ordering guarantees across channels (each handler sees
+      events in arrival order, one at a time)
+    - Deliveries to a handler are serialized: a slow handler delays its own
+      later events (not other handlers'). Once it falls _MAX_PENDING_EVENTS
+      behind, new events for it are dropped with a warning.
 
     For guaranteed delivery, use Redis Streams or a message queue (Kafka, RabbitMQ).
 
@@ -62,6 +70,11 @@ class RedisEventBus(EventBus):
         self._listen_task: Optional[asyncio.Task] = None
         self._lock = asyncio.Lock()
 
+        # Per-handler delivery: the listener enqueues, a long-lived task drains
+        self._queues: Dict[EventHandler, asyncio.Queue] = {}
+        self._drain_tasks: Dict[EventHandler, asyncio.Task] = {}
+        self._dropped: Dict[EventHandler, int] = {}
+
     async def _ensure_connected(self):
         """Lazy connection initialization"""
         if self._redis is None:
@@ -149,6 +162,8 @@ class RedisEventBus(EventBus):
                     await self._pubsub.unsubscribe(channel)
                     del self._handlers[channel]
 
+                self._release_handler(handler)
+
     async def start_listening(self):
         """
         Start background task to listen for events.
@@ -182,9 +197,9 @@ class RedisEventBus(EventBus):
                         async with self._lock:
                             handlers = self._handlers.get(channel, set()).copy()
 
-                        # Dispatch to all handlers (in background tasks)
+                        # Hand off to each handler's drain task
                         for handler in handlers:
-                            asyncio.create_task(self._safe_call_handler(handler, event, channel))
+                            self._enqueue(handler, channel, event)
 
                     except json.JSONDecodeError as e:
                         print(f"Error decoding event on channel '{channel}': {e}")
@@ -197,6 +212,70 @@ class RedisEventBus(EventBus):
         except Exception as e:
             print(f"Error in event listener: {e}")
 
+    def _enqueue(self, handler: EventHandler, channel: str, event: dict):
+        """
+        Queue event for a handler, starting its drain task on first use.
+
+        Avoids creating a task per event per handler under load. If the
+        handler's queue is full the event is dropped.
+        """
+        queue = self._queues.get(handler)
+        if queue is None:
+            queue = self._queues[handler] = asyncio.Queue(maxsize=_MAX_PENDING_EVENTS)
+            self._drain_tasks[handler] = asyncio.create_task(self._drain(handler, queue))
+
+        try:
+            queue.put_nowait((channel, event))
+        except asyncio.QueueFull:
+            dropped = self._dropped[handler] = self._dropped.get(handler, 0) + 1
+            # Warn on the first drop and then every queue's worth
+            if dropped % _MAX_PENDING_EVENTS == 1:
+                print(
+                    f"Handler for channel '{channel}' is {_MAX_PENDING_EVENTS} events "
+                    f"behind, dropped {dropped} event(s)"
+                )
+
+    async def _drain(self, handler: EventHandler, queue: asyncio.Queue):
+        """
+        Deliver queued events to a handler until it is unsubscribed and idle.
+
+        The task stays registered while it runs, so a handler re-subscribed
+        during its backlog keeps this one task and stays serialized.
+        """
+        try:
+            while True:
+                item = await queue.get()
+                if item is not None:
+                    channel, event = item
+                    await self._safe_call_handler(handler, event, channel)
+
+                if queue.empty() and not self._is_subscribed(handler):
+                    return
+        finally:
+            if self._queues.get(handler) is queue:
+                del self._queues[handler]
+                self._drain_tasks.pop(handler, None)
+                self._dropped.pop(handler, None)
+
+    def _is_subscribed(self, handler: EventHandler) -> bool:
+        """Whether handler is still registered on any channel or pattern"""
+        return any(handler in handlers for handlers in self._handlers.values())
+
+    def _release_handler(self, handler: EventHandler):
+        """
+        Let a handler's drain task finish once it has no subscriptions left.
+
+        Events already queued are still delivered. Must hold self._lock.
+        """
+        if self._is_subscribed(handler):
+            return
+
+        queue = self._queues.get(handler)
+        if queue is not None and queue.empty():
+            # Wake the idle drain task so it notices; a busy one checks
+            # after each event
+            queue.put_nowait(None)
+
     async def _safe_call_handler(self, handler: EventHandler, event: dict, channel: str):
         """
         Call handler with error handling.
@@ -234,8 +313,16 @@ class RedisEventBus(EventBus):
                 await self._redis.close()
                 self._redis = None
 
-            # Clear handlers
+            # Clear handlers and drop undelivered events
             self._handlers.clear()
+            self._queues.clear()
+            self._dropped.clear()
+            drain_tasks = list(self._drain_tasks.values())
+            self._drain_tasks.clear()
+
+        for task in drain_tasks:
+            task.cancel()
+        await asyncio.gather(*drain_tasks, return_exceptions=True)
 
     # Helper methods
 
@@ -259,6 +346,8 @@ class RedisEventBus(EventBus):
             for channel in channels_to_remove:
                 del self._handlers[channel]
 
+            self._release_handler(handler)
+
     async def get_channels(self) -> list[str]:
         """Get list of active channels"""
         async with self._lock:
@@ -326,6 +415,8 @@ class RedisEventBus(EventBus):
                     await self._pubsub.punsubscribe(pattern)
                     del self._handlers[pattern_key]
 
+                self._release_handler(handler)
+
     async def publish_many(self, channel: str, events: list[dict]):
         """
         Publish multiple events to a channel efficiently.
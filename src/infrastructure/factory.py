@@ -5,7 +5,7 @@ Unified factory for creating infrastructure components with configuration.
 """
 
 from datetime import timedelta
-from typing import Optional
+from typing import Callable, Optional
 
 from .config import Config, get_config
 from .state import StateStore, create_state_store
@@ -161,7 +161,8 @@ class Infrastructure:
         # Create state store
         state = create_state_store(
             backend=config.state.backend,
-            url=config.state.redis_url if config.state.backend == "redis" else None
+            url=config.state.redis_url if config.state.backend == "redis" else None,
+            max_connections=config.state.redis_max_connections
         )
 
         # Create event bus
@@ -270,7 +271,8 @@ class Infrastructure:
         self,
         name: str,
         failure_threshold: Optional[int] = None,
-        timeout_seconds: Optional[float] = None
+        timeout_seconds: Optional[float] = None,
+        clock: Optional[Callable[[], float]] = None
     ) -> CircuitBreaker:
         """
         Create a circuit breaker with configuration defaults.
@@ -279,6 +281,7 @@ class Infrastructure:
             name: Circuit breaker name
             failure_threshold: Override default failure threshold
             timeout_seconds: Override default timeout
+            clock: Optional monotonic clock (e.g. loop.time)
 
         Returns:
             CircuitBreaker instance
@@ -292,7 +295,8 @@ class Infrastructure:
             failure_threshold=failure_threshold or self.config.resilience.circuit_failure_threshold,
             success_threshold=self.config.resilience.circuit_success_threshold,
             timeout_seconds=timeout_seconds or self.config.resilience.circuit_timeout_seconds,
-            window_seconds=self.config.resilience.circuit_window_seconds
+            window_seconds=self.config.resilience.circuit_window_seconds,
+            clock=clock
         )
 
     async def health_check(self) -> dict:
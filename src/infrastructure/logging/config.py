@@ -137,9 +137,10 @@ def configure_logging(
         structlog.processors.UnicodeDecoder(),
     ]
 
-    # Add correlation ID processor if enabled
+    # Add correlation ID processor if enabled (after the level filter, so
+    # records that are dropped never pay for the context lookup)
     if add_correlation_id:
-        processors.insert(0, add_correlation_id_processor)
+        processors.insert(1, add_correlation_id_processor)
 
     # Add output renderer
     if format == "json":
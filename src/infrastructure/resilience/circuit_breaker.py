@@ -4,11 +4,13 @@ Circuit Breaker Pattern
 Prevents cascading failures by failing fast when a service is unhealthy.
 """
 
+from collections import deque
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime
 from enum import Enum
 from typing import Callable, Optional, Any
 import asyncio
+import time
 from src.infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
@@ -112,7 +114,8 @@ class CircuitBreaker:
         failure_threshold: int = 5,
         success_threshold: int = 2,
         timeout_seconds: float = 60.0,
-        window_seconds: float = 120.0
+        window_seconds: float = 120.0,
+        clock: Optional[Callable[[], float]] = None
     ):
         """
         Initialize circuit breaker.
@@ -123,6 +126,8 @@ class CircuitBreaker:
             success_threshold: Successes in half-open before closing (default: 2)
             timeout_seconds: Seconds before trying half-open (default: 60)
             window_seconds: Time window for failure counting (default: 120)
+            clock: Monotonic clock in seconds used for timeout math
+                   (default: time.monotonic, e.g. pass loop.time)
         """
         self.name = name
         self.config = CircuitBreakerConfig(
@@ -137,14 +142,18 @@ class CircuitBreaker:
         self._success_count = 0
         self._last_failure_time: Optional[datetime] = None
         self._opened_at: Optional[datetime] = None
+        self._opened_at_clock: Optional[float] = None
+        self._clock = clock or time.monotonic
         self._lock = asyncio.Lock()
 
-        # Track failures in time window
-        self._recent_failures: list[datetime] = []
+        # Track failures in time window (clock timestamps, oldest first)
+        self._recent_failures: deque[float] = deque()
 
-        logger.info(
+        # Logger with the breaker name bound once, reused by every log call
+        self._log = logger.bind(name=name)
+
+        self._log.info(
             "circuit_breaker_created",
-            name=name,
             failure_threshold=failure_threshold,
             timeout_seconds=timeout_seconds
         )
@@ -188,18 +197,20 @@ class CircuitBreaker:
         Usage:
             result = await breaker.call(exchange.get_price, "BTC-USDT")
         """
-        async with self._lock:
-            # Check if we should transition to half-open
-            await self._maybe_attempt_reset()
-
-            # If open, fail fast
-            if self._state == CircuitBreakerState.OPEN:
-                logger.warning(
-                    "circuit_breaker_open",
-                    name=self.name,
-                    failures=self._failure_count
-                )
-                raise CircuitBreakerOpen(self.name, self._failure_count, self._state)
+        # Closed is the common case and needs no transition, so skip the lock
+        # (state is only changed by this event loop, never mid-statement)
+        if self._state != CircuitBreakerState.CLOSED:
+            async with self._lock:
+                # Check if we should transition to half-open
+                await self._maybe_attempt_reset()
+
+                # If open, fail fast
+                if self._state == CircuitBreakerState.OPEN:
+                    self._log.warning(
+                        "circuit_breaker_open",
+                        failures=self._failure_count
+                    )
+                    raise CircuitBreakerOpen(self.name, self._failure_count, self._state)
 
         # Try the call
         try:
@@ -212,12 +223,15 @@ class CircuitBreaker:
 
     async def _on_success(self):
         """Handle successful call"""
+        # Successes only matter while half-open; avoid the lock otherwise
+        if self._state != CircuitBreakerState.HALF_OPEN:
+            return
+
         async with self._lock:
             if self._state == CircuitBreakerState.HALF_OPEN:
                 self._success_count += 1
-                logger.info(
+                self._log.info(
                     "circuit_breaker_success",
-                    name=self.name,
                     successes=self._success_count,
                     threshold=self.config.success_threshold
                 )
@@ -229,19 +243,18 @@ class CircuitBreaker:
     async def _on_failure(self, exception: Exception):
         """Handle failed call"""
         async with self._lock:
+            now = self._clock()
             self._failure_count += 1
             self._last_failure_time = datetime.utcnow()
-            self._recent_failures.append(datetime.utcnow())
+            self._recent_failures.append(now)
 
-            # Clean old failures outside window
-            cutoff = datetime.utcnow() - timedelta(seconds=self.config.window_seconds)
-            self._recent_failures = [
-                f for f in self._recent_failures if f > cutoff
-            ]
+            # Evict old failures outside window (amortized O(1))
+            cutoff = now - self.config.window_seconds
+            while self._recent_failures and self._recent_failures[0] <= cutoff:
+                self._recent_failures.popleft()
 
-            logger.warning(
+            self._log.warning(
                 "circuit_breaker_failure",
-                name=self.name,
                 failures=self._failure_count,
                 recent_failures=len(self._recent_failures),
                 threshold=self.config.failure_threshold,
@@ -263,11 +276,11 @@ class CircuitBreaker:
         if self._state != CircuitBreakerState.OPEN:
             return
 
-        if not self._opened_at:
+        if self._opened_at_clock is None:
             return
 
         # Check if timeout has elapsed
-        elapsed = (datetime.utcnow() - self._opened_at).total_seconds()
+        elapsed = self._clock() - self._opened_at_clock
         if elapsed >= self.config.timeout_seconds:
             await self._half_open()
 
@@ -276,12 +289,12 @@ class CircuitBreaker:
         self._state = CircuitBreakerState.CLOSED
         self._failure_count = 0
         self._success_count = 0
-        self._recent_failures = []
+        self._recent_failures.clear()
         self._opened_at = None
+        self._opened_at_clock = None
 
-        logger.info(
+        self._log.info(
             "circuit_breaker_closed",
-            name=self.name,
             message="Circuit breaker closed - normal operation resumed"
         )
 
@@ -289,11 +302,11 @@ class CircuitBreaker:
         """Transition to OPEN state"""
         self._state = CircuitBreakerState.OPEN
         self._opened_at = datetime.utcnow()
+        self._opened_at_clock = self._clock()
         self._success_count = 0
 
-        logger.error(
+        self._log.error(
             "circuit_breaker_opened",
-            name=self.name,
             failures=self._failure_count,
             recent_failures=len(self._recent_failures),
             timeout_seconds=self.config.timeout_seconds,
@@ -305,9 +318,8 @@ class CircuitBreaker:
         self._state = CircuitBreakerState.HALF_OPEN
         self._success_count = 0
 
-        logger.info(
+        self._log.info(
             "circuit_breaker_half_open",
-            name=self.name,
             message="Circuit breaker half-open - testing recovery"
         )
 
@@ -322,9 +334,8 @@ class CircuitBreaker:
         """
         async with self._lock:
             await self._open()
-            logger.warning(
+            self._log.warning(
                 "circuit_breaker_forced_open",
-                name=self.name,
                 message="Circuit breaker manually opened"
             )
 
@@ -339,9 +350,8 @@ class CircuitBreaker:
         """
         async with self._lock:
             await self._close()
-            logger.info(
+            self._log.info(
                 "circuit_breaker_forced_close",
-                name=self.name,
                 message="Circuit breaker manually closed"
             )
 
@@ -356,9 +366,8 @@ class CircuitBreaker:
         """
         async with self._lock:
             await self._close()
-            logger.info(
+            self._log.info(
                 "circuit_breaker_reset",
-                name=self.name,
                 message="Circuit breaker reset"
             )
 
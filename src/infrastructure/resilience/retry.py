@@ -127,8 +127,8 @@ def with_retry(
     """
 
     def decorator(func: Callable) -> Callable:
-        # Create tenacity retry decorator
-        retry_decorator = retry(
+        # Create tenacity retry wrapper once per decorated function (not per call)
+        retrying_func = retry(
             stop=stop_after_attempt(max_attempts),
             wait=wait_exponential(
                 min=min_wait_seconds,
@@ -137,39 +137,27 @@ def with_retry(
             ),
             retry=retry_if_exception_type(retry_on),
             reraise=True
-        )
+        )(func)
 
         @wraps(func)
         async def wrapper(*args, **kwargs) -> Any:
-            last_exception = None
-
             try:
                 # Apply tenacity retry
-                retrying_func = retry_decorator(func)
-                result = await retrying_func(*args, **kwargs)
-                return result
-            except Exception as e:
-                # Check if this is an exception we should have retried
-                if isinstance(e, retry_on):
-                    # This is a retryable exception that exhausted retries
-                    last_exception = e
-
-                    # Log final failure
-                    logger.error(
-                        "retry_exhausted",
-                        function=func.__name__,
-                        max_attempts=max_attempts,
-                        error=str(e),
-                        error_type=type(e).__name__
-                    )
-
-                    if raise_on_exhausted:
-                        raise RetryExhausted(max_attempts, last_exception) from e
-                    else:
-                        raise
-                else:
-                    # This is not a retryable exception, pass through
-                    raise
+                return await retrying_func(*args, **kwargs)
+            except retry_on as e:
+                # Retryable exception that exhausted retries (anything else
+                # is not caught here and passes through unchanged)
+                logger.error(
+                    "retry_exhausted",
+                    function=func.__name__,
+                    max_attempts=max_attempts,
+                    error=str(e),
+                    error_type=type(e).__name__
+                )
+
+                if raise_on_exhausted:
+                    raise RetryExhausted(max_attempts, e) from e
+                raise
 
         return wrapper
 
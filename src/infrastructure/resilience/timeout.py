@@ -11,6 +11,18 @@ from src.infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
 
+# asyncio.timeout() (Python 3.11+) cancels the awaiting task directly instead
+# of wrapping the coroutine in a new task the way asyncio.wait_for() does
+_HAS_ASYNCIO_TIMEOUT = hasattr(asyncio, "timeout")
+
+
+async def _await_with_timeout(coro, seconds: Optional[float]) -> Any:
+    """Await coro, raising asyncio.TimeoutError after `seconds`."""
+    if _HAS_ASYNCIO_TIMEOUT:
+        async with asyncio.timeout(seconds):
+            return await coro
+    return await asyncio.wait_for(coro, timeout=seconds)
+
 
 class TimeoutError(Exception):
     """Raised when an operation exceeds its timeout"""
@@ -62,12 +74,7 @@ def with_timeout(seconds: float, operation_name: Optional[str] = None):
             op_name = operation_name or func.__name__
 
             try:
-                # Use asyncio.wait_for for timeout
-                result = await asyncio.wait_for(
-                    func(*args, **kwargs),
-                    timeout=seconds
-                )
-                return result
+                return await _await_with_timeout(func(*args, **kwargs), seconds)
 
             except asyncio.TimeoutError as e:
                 # Log timeout
@@ -132,11 +139,7 @@ async def with_timeout_async(
     op_name = operation_name or func.__name__
 
     try:
-        result = await asyncio.wait_for(
-            func(*args, **kwargs),
-            timeout=timeout_seconds
-        )
-        return result
+        return await _await_with_timeout(func(*args, **kwargs), timeout_seconds)
 
     except asyncio.TimeoutError as e:
         logger.warning(
@@ -181,32 +184,43 @@ class TimeoutContext:
         """
         self.seconds = seconds
         self.operation_name = operation_name
-        self._task: Optional[asyncio.Task] = None
+        self._scope = None  # asyncio.timeout() scope (Python 3.11+)
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._expired = False
 
     async def __aenter__(self):
-        """Enter context"""
-        # Create task for timeout
-        self._task = asyncio.create_task(asyncio.sleep(self.seconds))
+        """Enter context (arm a timer that cancels the block when it fires)"""
+        if _HAS_ASYNCIO_TIMEOUT:
+            self._scope = asyncio.timeout(self.seconds)
+            await self._scope.__aenter__()
+        else:
+            task = asyncio.current_task()
+            self._handle = asyncio.get_running_loop().call_later(
+                self.seconds, self._expire, task
+            )
         return self
 
+    def _expire(self, task: asyncio.Task):
+        self._expired = True
+        task.cancel()
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Exit context"""
-        # Cancel timeout task
-        if self._task and not self._task.done():
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
-
-        # If task completed (timeout occurred), raise TimeoutError
-        if self._task and self._task.done() and not self._task.cancelled():
+        try:
+            if self._scope is not None:
+                await self._scope.__aexit__(exc_type, exc_val, exc_tb)
+            else:
+                self._handle.cancel()
+                if self._expired and exc_type is asyncio.CancelledError:
+                    raise asyncio.TimeoutError()
+
+        except asyncio.TimeoutError as e:
             logger.warning(
                 "operation_timeout",
                 operation=self.operation_name,
                 timeout_seconds=self.seconds
             )
-            raise TimeoutError(self.seconds, self.operation_name)
+            raise TimeoutError(self.seconds, self.operation_name) from e
 
         return False
 
@@ -264,8 +278,8 @@ async def wait_for_any(
             )
             raise TimeoutError(timeout_seconds, operation_name)
 
-        # Get first completed result
-        completed_task = list(done)[0]
+        # Get first completed result (no need to copy the done set)
+        completed_task = next(iter(done))
         result = completed_task.result()
 
         return result, list(pending)
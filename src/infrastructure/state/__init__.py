@@ -66,7 +66,8 @@ def create_state_store(backend: str, **kwargs) -> StateStore:
 
     elif backend == "redis":
         url = kwargs.get("url", "redis://localhost:6379")
-        return RedisStateStore(url=url)
+        max_connections = kwargs.get("max_connections") or 32
+        return RedisStateStore(url=url, max_connections=max_connections)
 
     else:
         raise ValueError(
@@ -6,10 +6,18 @@ All data is stored in memory and lost on restart.
 """
 
 from typing import Any, Optional, Dict
-from datetime import datetime, timedelta
+from datetime import timedelta
 import asyncio
+import heapq
+import time
 from .base import StateStore
 
+# Sentinel for "no live value", so stored None values are not mistaken for misses
+_MISSING = object()
+
+# Expiry heap size below which stale entries are not worth compacting
+_MIN_EXPIRY_HEAP = 64
+
 
 class InMemoryStateStore(StateStore):
     """
@@ -33,32 +41,72 @@ class InMemoryStateStore(StateStore):
     """
 
     def __init__(self):
-        self._data: Dict[str, tuple[Any, Optional[datetime]]] = {}
+        # key → value, and key → expiry (time.monotonic() seconds) for the
+        # keys that have a TTL only; keys without a TTL carry no expiry
+        # bookkeeping at all
+        self._data: Dict[str, Any] = {}
+        self._expires_at: Dict[str, float] = {}
+        # (expiry, key) min-heap used to purge expired keys that are never read
+        self._expiries: list[tuple[float, str]] = []
         self._lock = asyncio.Lock()
 
+    def _remove(self, key: str):
+        """Drop a key and its expiry. Caller holds the lock."""
+        del self._data[key]
+        self._expires_at.pop(key, None)
+
+    def _get_value(self, key: str) -> Any:
+        """Return the value of a live key or _MISSING, dropping it if expired. Caller holds the lock."""
+        value = self._data.get(key, _MISSING)
+        if value is _MISSING:
+            return _MISSING
+
+        # Check if expired
+        expiry = self._expires_at.get(key)
+        if expiry is not None and time.monotonic() > expiry:
+            self._remove(key)
+            return _MISSING
+
+        return value
+
+    def _store(self, key: str, value: Any, ttl: Optional[timedelta]):
+        """Write a value, replacing any previous TTL. Caller holds the lock."""
+        self._data[key] = value
+        if ttl:
+            expiry = time.monotonic() + ttl.total_seconds()
+            self._expires_at[key] = expiry
+            heapq.heappush(self._expiries, (expiry, key))
+            # Rewrites leave stale entries behind; rebuild before refreshed
+            # long-TTL keys let the heap outgrow the live expiries
+            if len(self._expiries) > 2 * len(self._expires_at) + _MIN_EXPIRY_HEAP:
+                self._expiries = [(exp, k) for k, exp in self._expires_at.items()]
+                heapq.heapify(self._expiries)
+        else:
+            self._expires_at.pop(key, None)
+
+    def _purge_expired(self):
+        """Drop keys whose TTL has passed (amortized over writes). Caller holds the lock."""
+        now = time.monotonic()
+        while self._expiries and self._expiries[0][0] < now:
+            expiry, key = heapq.heappop(self._expiries)
+            # Skip heap entries made stale by a later write to the same key
+            if self._expires_at.get(key) == expiry:
+                self._remove(key)
+
     async def get(self, key: str) -> Optional[Any]:
         async with self._lock:
-            if key not in self._data:
-                return None
-
-            value, expiry = self._data[key]
-
-            # Check if expired
-            if expiry and datetime.utcnow() > expiry:
-                del self._data[key]
-                return None
-
-            return value
+            value = self._get_value(key)
+            return None if value is _MISSING else value
 
     async def set(self, key: str, value: Any, ttl: Optional[timedelta] = None):
         async with self._lock:
-            expiry = datetime.utcnow() + ttl if ttl else None
-            self._data[key] = (value, expiry)
+            self._purge_expired()
+            self._store(key, value, ttl)
 
     async def delete(self, key: str) -> bool:
         async with self._lock:
             if key in self._data:
-                del self._data[key]
+                self._remove(key)
                 return True
             return False
 
@@ -76,29 +124,49 @@ class InMemoryStateStore(StateStore):
 
     async def set_many(self, items: Dict[str, Any], ttl: Optional[timedelta] = None):
         async with self._lock:
-            expiry = datetime.utcnow() + ttl if ttl else None
+            self._purge_expired()
             for key, value in items.items():
-                self._data[key] = (value, expiry)
+                self._store(key, value, ttl)
 
     async def increment(self, key: str, amount: int = 1) -> int:
+        # Read-modify-write in one critical section; like Redis INCRBY, an
+        # expired counter restarts at 0 and a live one keeps its TTL
         async with self._lock:
             current = 0
-            if key in self._data:
-                current_value, _ = self._data[key]
-                if isinstance(current_value, (int, float)):
-                    current = int(current_value)
+            current_value = self._get_value(key)
+            if isinstance(current_value, (int, float)):
+                current = int(current_value)
 
             new_value = current + amount
-            self._data[key] = (new_value, None)
+            self._data[key] = new_value
             return new_value
 
     async def decrement(self, key: str, amount: int = 1) -> int:
         return await self.increment(key, -amount)
 
+    async def set_if_not_exists(self, key: str, value: Any, ttl: Optional[timedelta] = None) -> bool:
+        """Set key only if it doesn't exist (single critical section, like SET NX)."""
+        async with self._lock:
+            if self._get_value(key) is not _MISSING:
+                return False
+            self._store(key, value, ttl)
+            return True
+
+    async def get_and_delete(self, key: str) -> Optional[Any]:
+        """Get value and delete key atomically (single critical section, like GETDEL)."""
+        async with self._lock:
+            value = self._get_value(key)
+            if value is _MISSING:
+                return None
+            self._remove(key)
+            return value
+
     async def close(self):
         """Clear all data"""
         async with self._lock:
             self._data.clear()
+            self._expires_at.clear()
+            self._expiries.clear()
 
     # Additional helper for testing
 
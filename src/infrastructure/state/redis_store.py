@@ -10,6 +10,59 @@ from datetime import timedelta
 import json
 from .base import StateStore
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+# With orjson, values it would encode differently from stdlib json (datetimes,
+# dataclasses, str/int/dict subclasses) are handed to _reject_for_json,
+# so they fall back to json.dumps below. Ints wider than 64 bits are also
+# rejected by orjson and fall back the same way.
+#
+# Remaining differences when orjson is installed:
+# - NaN and +/-Infinity are stored as null (json writes NaN/Infinity)
+# - UUIDs and plain Enum members are encoded (json raises TypeError)
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_PASSTHROUGH_SUBCLASS
+) if ORJSON_AVAILABLE else 0
+
+
+def _reject_for_json(value: Any):
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _dumps(value: Any):
+    """Serialize value as JSON (orjson when installed, else stdlib json)."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(value, default=_reject_for_json, option=_ORJSON_OPTIONS)
+        except TypeError:
+            pass
+    return json.dumps(value)
+
+
+def _loads(value: Any) -> Any:
+    """
+    Parse a stored JSON value.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+    keep catching the stdlib exception with either parser.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity literals stdlib json writes
+            pass
+    return json.loads(value)
+
 
 class RedisStateStore(StateStore):
     """
@@ -42,16 +95,23 @@ class RedisStateStore(StateStore):
         user = await store.get("user:123")
     """
 
-    def __init__(self, url: str = "redis://localhost:6379"):
+    # Maximum keys per MGET command in get_many()
+    BATCH_SIZE = 1000
+
+    def __init__(self, url: str = "redis://localhost:6379", max_connections: int = 32):
         """
         Initialize Redis state store.
 
         Args:
             url: Redis connection URL
                 Format: redis://[username]:[password]@[host]:[port]/[db]
+            max_connections: Maximum connections in the shared pool
         """
         self.url = url
-        self._redis = None  # Lazy initialization
+        self.max_connections = max_connections
+        self._pool = None  # Lazy initialization
+        self._redis = None
+        self._getdel_supported = True
 
     async def _ensure_connected(self):
         """Lazy connection initialization"""
@@ -63,13 +123,16 @@ class RedisStateStore(StateStore):
                     "redis package not installed. Install with: pip install redis"
                 )
 
-            self._redis = await redis.from_url(
+            # One long-lived client over a bounded pool, reused by every call
+            self._pool = redis.ConnectionPool.from_url(
                 self.url,
+                max_connections=self.max_connections,
                 encoding="utf-8",
                 decode_responses=True,
                 socket_connect_timeout=5,
                 socket_keepalive=True
             )
+            self._redis = redis.Redis(connection_pool=self._pool)
 
             # Test connection
             await self._redis.ping()
@@ -81,7 +144,7 @@ class RedisStateStore(StateStore):
             return None
 
         try:
-            return json.loads(value)
+            return _loads(value)
         except json.JSONDecodeError:
             # Return raw string if not JSON
             return value
@@ -89,19 +152,12 @@ class RedisStateStore(StateStore):
     async def set(self, key: str, value: Any, ttl: Optional[timedelta] = None):
         await self._ensure_connected()
 
-        # Serialize value as JSON
-        serialized = json.dumps(value)
-
-        if ttl:
-            # Set with expiration
-            await self._redis.setex(
-                key,
-                int(ttl.total_seconds()),
-                serialized
-            )
-        else:
-            # Set without expiration
-            await self._redis.set(key, serialized)
+        # Serialize value as JSON; expiry is enforced server-side (SET ... EX)
+        await self._redis.set(
+            key,
+            _dumps(value),
+            ex=int(ttl.total_seconds()) if ttl else None
+        )
 
     async def delete(self, key: str) -> bool:
         await self._ensure_connected()
@@ -119,13 +175,21 @@ class RedisStateStore(StateStore):
         if not keys:
             return {}
 
-        values = await self._redis.mget(keys)
+        if len(keys) <= self.BATCH_SIZE:
+            values = await self._redis.mget(keys)
+        else:
+            # Bounded MGETs, still sent in a single round trip
+            pipe = self._redis.pipeline(transaction=False)
+            for i in range(0, len(keys), self.BATCH_SIZE):
+                pipe.mget(keys[i:i + self.BATCH_SIZE])
+            values = [value for chunk in await pipe.execute() for value in chunk]
+
         result = {}
 
         for key, value in zip(keys, values):
             if value is not None:
                 try:
-                    result[key] = json.loads(value)
+                    result[key] = _loads(value)
                 except json.JSONDecodeError:
                     result[key] = value
 
@@ -137,16 +201,12 @@ class RedisStateStore(StateStore):
         if not items:
             return
 
-        # Use pipeline for atomic operation
+        # Use pipeline for atomic operation (MULTI/EXEC, one round trip)
         pipe = self._redis.pipeline()
+        expire_seconds = int(ttl.total_seconds()) if ttl else None
 
         for key, value in items.items():
-            serialized = json.dumps(value)
-
-            if ttl:
-                pipe.setex(key, int(ttl.total_seconds()), serialized)
-            else:
-                pipe.set(key, serialized)
+            pipe.set(key, _dumps(value), ex=expire_seconds)
 
         await pipe.execute()
 
@@ -164,7 +224,9 @@ class RedisStateStore(StateStore):
         """Close Redis connection"""
         if self._redis:
             await self._redis.close()
+            await self._pool.disconnect()
             self._redis = None
+            self._pool = None
 
     # Redis-specific optimizations
 
@@ -175,20 +237,13 @@ class RedisStateStore(StateStore):
         """
         await self._ensure_connected()
 
-        serialized = json.dumps(value)
-
-        if ttl:
-            # SET key value EX seconds NX
-            result = await self._redis.set(
-                key,
-                serialized,
-                ex=int(ttl.total_seconds()),
-                nx=True
-            )
-        else:
-            # SET key value NX
-            result = await self._redis.set(key, serialized, nx=True)
-
+        # SET key value [EX seconds] NX - one round trip, atomic on the server
+        result = await self._redis.set(
+            key,
+            _dumps(value),
+            ex=int(ttl.total_seconds()) if ttl else None,
+            nx=True
+        )
         return result is not None
 
     async def get_and_delete(self, key: str) -> Optional[Any]:
@@ -198,22 +253,31 @@ class RedisStateStore(StateStore):
         """
         await self._ensure_connected()
 
-        # Use GETDEL command (Redis 6.2+)
-        try:
-            value = await self._redis.getdel(key)
-            if value is None:
-                return None
-
+        value = None
+        if self._getdel_supported:
+            # Use GETDEL command (Redis 6.2+)
+            from redis.exceptions import ResponseError
             try:
-                return json.loads(value)
-            except json.JSONDecodeError:
-                return value
+                value = await self._redis.getdel(key)
+            except ResponseError as e:
+                if "unknown command" not in str(e).lower():
+                    raise
+                # Older server without GETDEL; don't try it again
+                self._getdel_supported = False
+
+        if not self._getdel_supported:
+            # Fallback for older Redis versions: GET + DEL in one MULTI/EXEC
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.get(key)
+                pipe.delete(key)
+                value, _ = await pipe.execute()
 
-        except Exception:
-            # Fallback for older Redis versions
-            value = await self.get(key)
-            if value is not None:
-                await self.delete(key)
+        if value is None:
+            return None
+
+        try:
+            return _loads(value)
+        except json.JSONDecodeError:
             return value
 
     async def expire(self, key: str, ttl: timedelta) -> bool:
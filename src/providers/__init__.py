@@ -5,10 +5,24 @@ Supports both prediction markets (Polymarket) and traditional exchanges (Luno).
 """
 
 from .base import BaseProvider, OrderSide, OrderType, OrderStatus, Balance, Order, Orderbook
-from .polymarket import PolymarketProvider
-from .luno import LunoProvider
 from .factory import create_provider
 
+# Concrete providers pull in their exchange SDKs, so they are only imported
+# on first attribute access (e.g. `from src.providers import LunoProvider`).
+_LAZY_PROVIDERS = {
+    "PolymarketProvider": ".polymarket",
+    "LunoProvider": ".luno",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_PROVIDERS:
+        import importlib
+        module = importlib.import_module(_LAZY_PROVIDERS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "BaseProvider",
     "OrderSide",
@@ -8,14 +8,9 @@ import logging
 from typing import Dict, Any
 
 from .base import BaseProvider
-from .polymarket import PolymarketProvider
-from .luno import LunoProvider
-from .kalshi import KalshiProvider
-from .binance import BinanceProvider
-from .coinbase import CoinbaseProvider
-from .bybit import BybitProvider
-from .kraken import KrakenProvider
-from .dydx import DydxProvider
+
+# Provider modules are imported inside create_provider() so that only the
+# requested provider (and its SDK) is loaded.
 
 logger = logging.getLogger(__name__)
 
@@ -54,34 +49,42 @@ def create_provider(provider_name: str, config: Dict[str, Any]) -> BaseProvider:
     provider_name_lower = provider_name.lower().strip()
 
     if provider_name_lower == "polymarket":
+        from .polymarket import PolymarketProvider
         logger.info("🎯 Creating Polymarket provider")
         return PolymarketProvider(config)
 
     elif provider_name_lower == "luno":
+        from .luno import LunoProvider
         logger.info("🚀 Creating Luno provider")
         return LunoProvider(config)
 
     elif provider_name_lower == "kalshi":
+        from .kalshi import KalshiProvider
         logger.info("🎲 Creating Kalshi provider")
         return KalshiProvider(config)
 
     elif provider_name_lower == "binance":
+        from .binance import BinanceProvider
         logger.info("🌐 Creating Binance provider")
         return BinanceProvider(config)
 
     elif provider_name_lower == "coinbase":
+        from .coinbase import CoinbaseProvider
         logger.info("🇺🇸 Creating Coinbase provider")
         return CoinbaseProvider(config)
 
     elif provider_name_lower == "bybit":
+        from .bybit import BybitProvider
         logger.info("📊 Creating Bybit provider")
         return BybitProvider(config)
 
     elif provider_name_lower == "kraken":
+        from .kraken import KrakenProvider
         logger.info("🐙 Creating Kraken provider")
         return KrakenProvider(config)
 
     elif provider_name_lower == "dydx":
+        from .dydx import DydxProvider
         logger.info("⚡ Creating dYdX provider")
         return DydxProvider(config)
 
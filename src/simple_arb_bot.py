@@ -16,6 +16,7 @@ import httpx
 
 from .config import load_settings, apply_profile_to_settings
 from .config_validator import ConfigValidator
+from .infrastructure.eventloop import install_uvloop
 from .logger import setup_logging, print_header, print_success, print_error
 from .lookup import fetch_market_from_slug
 from .risk_manager import RiskManager, RiskLimits
@@ -1139,4 +1140,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
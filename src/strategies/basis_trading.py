@@ -187,6 +187,7 @@ class BasisTradingStrategy(PollingStrategy):
                 size=self.position_size,
                 expected_profit=total_apy / 365,  # Daily profit
                 metadata={
+                    "_opp_type": "arbitrage",
                     "opportunity": opportunity_data,
                     "strategy": "basis_trading"
                 }
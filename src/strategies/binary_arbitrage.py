@@ -131,6 +131,7 @@ class BinaryArbitrageStrategy(PollingStrategy):
                 confidence=1.0,  # Arbitrage is guaranteed (if fills execute)
                 expected_profit=expected_profit,
                 metadata={
+                    "_opp_type": "arbitrage",
                     "price_yes": price_yes,
                     "price_no": price_no,
                     "total_cost": total_cost,
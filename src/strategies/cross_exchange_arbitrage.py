@@ -172,6 +172,7 @@ class CrossExchangeArbitrageStrategy(PollingStrategy):
                     size=min(self.order_size, best_opportunity.max_volume),
                     expected_profit=best_opportunity.profit_pct,
                     metadata={
+                        "_opp_type": "arbitrage",
                         "opportunity": best_opportunity,
                         "strategy": "cross_exchange_arbitrage"
                     }
@@ -195,6 +195,7 @@ class CrossPlatformArbitrageStrategy(PollingStrategy):
                 confidence=0.85,  # Lower confidence due to execution risk
                 expected_profit=expected_profit,
                 metadata={
+                    "_opp_type": "arbitrage",
                     "pair": self.pair,
                     "buy_platform": buy_platform,
                     "sell_platform": sell_platform,
@@ -188,6 +188,7 @@ class FundingRateArbitrageStrategy(PollingStrategy):
                 size=self.position_size,
                 expected_profit=daily_profit_pct,
                 metadata={
+                    "_opp_type": "arbitrage",
                     "opportunity": opportunity_data,
                     "strategy": "funding_rate_arbitrage"
                 }
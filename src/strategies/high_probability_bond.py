@@ -207,6 +207,7 @@ class HighProbabilityBondStrategy(PollingStrategy):
                 confidence=probability,
                 expected_profit=expected_profit,
                 metadata={
+                    "_opp_type": "yield_optimization",
                     "market_id": market.get("id"),
                     "market_name": market.get("name"),
                     "token_id": token_id,
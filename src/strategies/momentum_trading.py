@@ -222,6 +222,7 @@ class MomentumTradingStrategy(EventDrivenStrategy):
                 confidence=confidence,
                 expected_profit=expected_profit,
                 metadata={
+                    "_opp_type": "momentum",
                     "market_pair": self.market_pair,
                     "direction": direction,
                     "entry_price": current_price,
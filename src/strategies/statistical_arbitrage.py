@@ -173,6 +173,7 @@ class StatisticalArbitrageStrategy(PollingStrategy):
                             size=self.position_size,
                             expected_profit=abs(dev.deviation_pct),
                             metadata={
+                                "_opp_type": "mean_reversion",
                                 "deviation": dev,
                                 "strategy": "statistical_arbitrage",
                                 "action": "short"
@@ -193,6 +194,7 @@ class StatisticalArbitrageStrategy(PollingStrategy):
                             size=self.position_size,
                             expected_profit=abs(dev.deviation_pct),
                             metadata={
+                                "_opp_type": "mean_reversion",
                                 "deviation": dev,
                                 "strategy": "statistical_arbitrage",
                                 "action": "long"
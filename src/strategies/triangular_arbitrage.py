@@ -145,6 +145,7 @@ class TriangularArbitrageStrategy(PollingStrategy):
                     size=self.order_size,
                     expected_profit=best_path.profit_pct,
                     metadata={
+                        "_opp_type": "arbitrage",
                         "path": best_path,
                         "strategy": "triangular_arbitrage"
                     }
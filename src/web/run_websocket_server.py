@@ -18,6 +18,7 @@ import asyncio
 import argparse
 import os
 from src.infrastructure.factory import create_infrastructure
+from src.infrastructure.eventloop import install_uvloop
 from src.web.websocket_server import WorkflowWebSocketServer
 from src.infrastructure.logging import get_logger
 
@@ -99,4 +100,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
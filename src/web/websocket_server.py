@@ -4,17 +4,51 @@ WebSocket Server for Real-Time Workflow Events
 Broadcasts workflow execution events to connected UI clients using Socket.IO.
 """
 import asyncio
+from collections import deque
 
 import socketio
 from aiohttp import web
-from typing import Optional, Dict, Set
+from typing import Optional, Dict, Set, Deque, List, Tuple
 import time
 from datetime import datetime
 from src.infrastructure.factory import Infrastructure
 from src.infrastructure.logging import get_logger
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 logger = get_logger(__name__)
 
+# Event fields that clients can subscribe by (and that recent events are indexed by)
+_SUBSCRIPTION_FIELDS = ('workflow_id', 'bot_id', 'strategy_id')
+
+# Event types also emitted under their own name for frontend compatibility
+_TYPED_EVENTS = frozenset({'node_execution', 'bot_metrics', 'strategy_metrics', 'risk_limit_update'})
+
+# Upper bound on memoized broadcast recipient lists before the cache is dropped
+_MAX_CACHED_TARGETS = 1024
+
+
+class _OrjsonCodec:
+    """
+    json-module shim so Socket.IO encodes packets with orjson.
+
+    Socket.IO calls dumps(data, separators=...); orjson always emits compact
+    output, so formatting arguments are accepted and ignored.
+    """
+
+    @staticmethod
+    def dumps(obj, *args, **kwargs) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    @staticmethod
+    def loads(s, *args, **kwargs):
+        return orjson.loads(s)
+
 
 class WorkflowWebSocketServer:
     """
@@ -43,7 +77,8 @@ class WorkflowWebSocketServer:
         self,
         infra: Infrastructure,
         auth_token: Optional[str] = None,
-        require_auth: bool = False
+        require_auth: bool = False,
+        max_recent_events: int = 100
     ):
         """
         Initialize WebSocket server.
@@ -52,17 +87,20 @@ class WorkflowWebSocketServer:
             infra: Infrastructure instance
             auth_token: Optional authentication token for client connections
             require_auth: Whether to require authentication
+            max_recent_events: Size of the replay buffer for new clients
         """
         self.infra = infra
         self.auth_token = auth_token
         self.require_auth = require_auth
 
-        # Create Socket.IO server
+        # Create Socket.IO server (packets encoded with orjson when installed)
+        sio_options = {'json': _OrjsonCodec} if ORJSON_AVAILABLE else {}
         self.sio = socketio.AsyncServer(
             async_mode='aiohttp',
             cors_allowed_origins='*',  # Allow all origins for development
             logger=False,
-            engineio_logger=False
+            engineio_logger=False,
+            **sio_options
         )
 
         # Create aiohttp web app
@@ -72,10 +110,19 @@ class WorkflowWebSocketServer:
         # Track client subscriptions
         # sid -> {'workflow_ids': set(), 'bot_ids': set(), 'strategy_ids': set(), 'authenticated': bool}
         self.client_subscriptions: Dict[str, Dict[str, any]] = {}
+        # Reverse indexes: (field, id) -> subscribed sids, and all-bots sids,
+        # kept in lockstep with client_subscriptions
+        self._sids_by_key: Dict[Tuple[str, str], Set[str]] = {}
+        self._all_bots_sids: Set[str] = set()
+        # Memoized recipients per (workflow_id, bot_id, strategy_id); any
+        # subscription change clears it
+        self._targets_cache: Dict[Tuple[Optional[str], ...], List[str]] = {}
 
         # Recent events buffer (for replay to new clients)
-        self.recent_events: list = []
-        self.max_recent_events = 100
+        self.recent_events: Deque[dict] = deque(maxlen=max_recent_events)
+        # The same events indexed by (field, id), oldest first, so replay
+        # doesn't scan the whole buffer
+        self._recent_by_key: Dict[Tuple[str, str], Deque[dict]] = {}
 
         # Server metrics
         self.start_time = time.time()
@@ -103,13 +150,7 @@ class WorkflowWebSocketServer:
             logger.info("client_connected", sid=sid, total_connections=self.total_connections)
 
             # Initialize subscription tracking
-            self.client_subscriptions[sid] = {
-                'workflow_ids': set(),
-                'bot_ids': set(),
-                'strategy_ids': set(),
-                'authenticated': not self.require_auth,  # Auto-auth if not required
-                'connected_at': time.time()
-            }
+            self.register_client(sid)
 
             # Send connection confirmation
             await self.sio.emit('connected', {
@@ -157,8 +198,7 @@ class WorkflowWebSocketServer:
             logger.info("client_disconnected", sid=sid)
 
             # Clean up subscriptions
-            if sid in self.client_subscriptions:
-                del self.client_subscriptions[sid]
+            self.unregister_client(sid)
 
         @self.sio.event
         async def subscribe_workflow(sid, data):
@@ -183,7 +223,7 @@ class WorkflowWebSocketServer:
                 return
 
             # Add to subscriptions
-            self.client_subscriptions[sid]['workflow_ids'].add(workflow_id)
+            self.add_subscription(sid, 'workflow_id', workflow_id)
 
             logger.info(
                 "client_subscribed_workflow",
@@ -223,7 +263,7 @@ class WorkflowWebSocketServer:
                 return
 
             # Add to subscriptions
-            self.client_subscriptions[sid]['bot_ids'].add(bot_id)
+            self.add_subscription(sid, 'bot_id', bot_id)
 
             logger.info("client_subscribed_bot", sid=sid, bot_id=bot_id)
 
@@ -259,7 +299,7 @@ class WorkflowWebSocketServer:
                 return
 
             # Add to subscriptions
-            self.client_subscriptions[sid]['strategy_ids'].add(strategy_id)
+            self.add_subscription(sid, 'strategy_id', strategy_id)
 
             logger.info(
                 "client_subscribed_strategy",
@@ -290,9 +330,7 @@ class WorkflowWebSocketServer:
                 return
 
             # Remove from subscriptions
-            subs = self.client_subscriptions.get(sid, {})
-            sub_set = subs.get(f'{sub_type}_ids', set())
-            sub_set.discard(sub_id)
+            self.remove_subscription(sid, f'{sub_type}_id', sub_id)
 
             logger.info(
                 "client_unsubscribed",
@@ -317,7 +355,7 @@ class WorkflowWebSocketServer:
             strategy_id = data.get('strategyId') or data.get('strategy_id')
 
             if strategy_id and sid in self.client_subscriptions:
-                self.client_subscriptions[sid]['strategy_ids'].discard(strategy_id)
+                self.remove_subscription(sid, 'strategy_id', strategy_id)
                 logger.info("client_unsubscribed_strategy", sid=sid, strategy_id=strategy_id)
 
             await self.sio.emit('unsubscribed', {
@@ -335,7 +373,7 @@ class WorkflowWebSocketServer:
             bot_id = data.get('botId') or data.get('bot_id')
 
             if bot_id and sid in self.client_subscriptions:
-                self.client_subscriptions[sid]['bot_ids'].discard(bot_id)
+                self.remove_subscription(sid, 'bot_id', bot_id)
                 logger.info("client_unsubscribed_bot", sid=sid, bot_id=bot_id)
 
             await self.sio.emit('unsubscribed', {
@@ -359,6 +397,8 @@ class WorkflowWebSocketServer:
 
             # Mark client as subscribed to all bots
             self.client_subscriptions[sid]['all_bots'] = True
+            self._all_bots_sids.add(sid)
+            self._targets_cache.clear()
 
             logger.info("client_subscribed_all_bots", sid=sid)
 
@@ -404,6 +444,83 @@ class WorkflowWebSocketServer:
             stats = self.get_stats()
             await self.sio.emit('stats_update', stats, to=sid)
 
+    def register_client(self, sid: str) -> dict:
+        """
+        Start tracking subscriptions for a client.
+
+        Args:
+            sid: Client session ID
+
+        Returns:
+            The client's subscription record
+        """
+        subs = {
+            'workflow_ids': set(),
+            'bot_ids': set(),
+            'strategy_ids': set(),
+            'authenticated': not self.require_auth,  # Auto-auth if not required
+            'connected_at': time.time()
+        }
+        self.client_subscriptions[sid] = subs
+        return subs
+
+    def unregister_client(self, sid: str):
+        """
+        Stop tracking a client and drop all of its subscriptions.
+
+        Args:
+            sid: Client session ID
+        """
+        subs = self.client_subscriptions.pop(sid, None)
+        if subs is None:
+            return
+
+        for field in _SUBSCRIPTION_FIELDS:
+            for value in subs[f'{field}s']:
+                self._unindex_subscription(sid, field, value)
+        self._all_bots_sids.discard(sid)
+        self._targets_cache.clear()
+
+    def add_subscription(self, sid: str, field: str, value: str):
+        """
+        Subscribe a client to events whose `field` equals `value`.
+
+        Args:
+            sid: Client session ID
+            field: 'workflow_id', 'bot_id' or 'strategy_id'
+            value: ID to match
+        """
+        self.client_subscriptions[sid][f'{field}s'].add(value)
+        self._sids_by_key.setdefault((field, value), set()).add(sid)
+        self._targets_cache.clear()
+
+    def remove_subscription(self, sid: str, field: str, value: str):
+        """
+        Unsubscribe a client from events whose `field` equals `value`.
+
+        Unknown clients and fields are ignored.
+
+        Args:
+            sid: Client session ID
+            field: 'workflow_id', 'bot_id' or 'strategy_id'
+            value: ID to stop matching
+        """
+        subs = self.client_subscriptions.get(sid)
+        if subs is None or field not in _SUBSCRIPTION_FIELDS:
+            return
+
+        subs[f'{field}s'].discard(value)
+        self._unindex_subscription(sid, field, value)
+        self._targets_cache.clear()
+
+    def _unindex_subscription(self, sid: str, field: str, value: str):
+        """Remove sid from the reverse index for (field, value)."""
+        sids = self._sids_by_key.get((field, value))
+        if sids is not None:
+            sids.discard(sid)
+            if not sids:
+                del self._sids_by_key[(field, value)]
+
     def _register_http_routes(self):
         """Register HTTP routes for health checks and metrics."""
 
@@ -501,9 +618,7 @@ class WorkflowWebSocketServer:
         self.total_events_received += 1
 
         # Store in recent events buffer
-        self.recent_events.append(event)
-        if len(self.recent_events) > self.max_recent_events:
-            self.recent_events.pop(0)
+        self._remember_event(event)
 
         # Log event
         logger.debug(
@@ -516,6 +631,62 @@ class WorkflowWebSocketServer:
         # Broadcast to subscribed clients
         await self._broadcast_event(event)
 
+    def _remember_event(self, event: dict):
+        """
+        Add event to the recent events buffer and its indexes.
+
+        Args:
+            event: Workflow event
+        """
+        if len(self.recent_events) == self.recent_events.maxlen:
+            # Oldest event is about to be evicted; drop it from the indexes too
+            evicted = self.recent_events[0]
+            for field in _SUBSCRIPTION_FIELDS:
+                key = (field, evicted.get(field))
+                events = self._recent_by_key.get(key)
+                if events and events[0] is evicted:
+                    events.popleft()
+                    if not events:
+                        del self._recent_by_key[key]
+
+        self.recent_events.append(event)
+
+        for field in _SUBSCRIPTION_FIELDS:
+            value = event.get(field)
+            if value:
+                self._recent_by_key.setdefault((field, value), deque()).append(event)
+
+    def get_recent_events(
+        self,
+        workflow_id: Optional[str] = None,
+        bot_id: Optional[str] = None,
+        strategy_id: Optional[str] = None
+    ) -> List[dict]:
+        """
+        Get buffered events matching any of the given IDs, oldest first.
+
+        Args:
+            workflow_id: Optional workflow filter
+            bot_id: Optional bot filter
+            strategy_id: Optional strategy filter
+
+        Returns:
+            List of matching events
+        """
+        filters = [
+            (field, value)
+            for field, value in zip(_SUBSCRIPTION_FIELDS, (workflow_id, bot_id, strategy_id))
+            if value
+        ]
+
+        if len(filters) == 1:
+            return list(self._recent_by_key.get(filters[0], ()))
+
+        return [
+            event for event in self.recent_events
+            if any(event.get(field) == value for field, value in filters)
+        ]
+
     async def _broadcast_event(self, event: dict):
         """
         Broadcast event to subscribed clients.
@@ -523,39 +694,45 @@ class WorkflowWebSocketServer:
         Args:
             event: Event to broadcast
         """
-        workflow_id = event.get('workflow_id')
-        bot_id = event.get('bot_id')
-        strategy_id = event.get('strategy_id')
         event_type = event.get('type', 'workflow_event')
 
-        # Find matching clients
-        for sid, subs in self.client_subscriptions.items():
-            should_send = False
-
-            # Check if client is subscribed to all bots
-            if subs.get('all_bots'):
-                should_send = True
-
-            # Check if client is subscribed to this workflow
-            if workflow_id and workflow_id in subs['workflow_ids']:
-                should_send = True
+        recipients = self._get_recipients(event)
+        if not recipients:
+            return
 
-            # Check if client is subscribed to this bot
-            if bot_id and bot_id in subs['bot_ids']:
-                should_send = True
+        # One emit addressed to every matching sid: Socket.IO encodes the
+        # packet once and fans it out, instead of one emit per client
+        await self.sio.emit('workflow_event', event, to=recipients)
+        self.total_events_sent += len(recipients)
 
-            # Check if client is subscribed to this strategy
-            if strategy_id and strategy_id in subs['strategy_ids']:
-                should_send = True
+        # Also emit specific event types for frontend compatibility
+        if event_type in _TYPED_EVENTS:
+            await self.sio.emit(event_type, event, to=recipients)
 
-            # Send event to client
-            if should_send:
-                await self.sio.emit('workflow_event', event, to=sid)
-                self.total_events_sent += 1
+    def _get_recipients(self, event: dict) -> List[str]:
+        """
+        Get the sids subscribed to an event.
 
-                # Also emit specific event types for frontend compatibility
-                if event_type in ['node_execution', 'bot_metrics', 'strategy_metrics', 'risk_limit_update']:
-                    await self.sio.emit(event_type, event, to=sid)
+        Events for the same workflow/bot/strategy repeat far more often than
+        subscriptions change, so the union is memoized per ID triple.
+        """
+        key = tuple(event.get(field) for field in _SUBSCRIPTION_FIELDS)
+        recipients = self._targets_cache.get(key)
+        if recipients is not None:
+            return recipients
+
+        # Find matching clients via the reverse indexes (no per-client scan)
+        targets = set(self._all_bots_sids)
+        for field, value in zip(_SUBSCRIPTION_FIELDS, key):
+            if value:
+                sids = self._sids_by_key.get((field, value))
+                if sids:
+                    targets |= sids
+
+        if len(self._targets_cache) >= _MAX_CACHED_TARGETS:
+            self._targets_cache.clear()
+        recipients = self._targets_cache[key] = list(targets)
+        return recipients
 
     async def _send_recent_events(
         self,
@@ -573,20 +750,11 @@ class WorkflowWebSocketServer:
             bot_id: Optional bot filter
             strategy_id: Optional strategy filter
         """
-        filtered_events = []
-
-        for event in self.recent_events:
-            match = False
-
-            if workflow_id and event.get('workflow_id') == workflow_id:
-                match = True
-            if bot_id and event.get('bot_id') == bot_id:
-                match = True
-            if strategy_id and event.get('strategy_id') == strategy_id:
-                match = True
-
-            if match:
-                filtered_events.append(event)
+        filtered_events = self.get_recent_events(
+            workflow_id=workflow_id,
+            bot_id=bot_id,
+            strategy_id=strategy_id
+        )
 
         # Send events
         if filtered_events:
@@ -5,6 +5,6 @@ Direct workflow execution without code generation.
 Executes visual workflow graphs created in the strategy builder.
 """
 
-from .executor import WorkflowExecutor
+from .executor import CompiledWorkflow, WorkflowExecutor
 
-__all__ = ['WorkflowExecutor']
+__all__ = ['CompiledWorkflow', 'WorkflowExecutor']
@@ -13,10 +13,10 @@ Extends the base WorkflowExecutor with Week 2 infrastructure:
 import asyncio
 import time
 import uuid
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Union
 from datetime import datetime
 
-from .executor import WorkflowExecutor as BaseWorkflowExecutor
+from .executor import CompiledWorkflow, WorkflowExecutor as BaseWorkflowExecutor
 from src.infrastructure.factory import Infrastructure
 from src.infrastructure.logging import get_logger, set_correlation_id, get_correlation_id
 from src.infrastructure.resilience import with_retry, with_timeout
@@ -62,7 +62,7 @@ class EnhancedWorkflowExecutor(BaseWorkflowExecutor):
 
     def __init__(
         self,
-        workflow: Dict[str, Any],
+        workflow: Union[Dict[str, Any], CompiledWorkflow],
         infra: Infrastructure,
         workflow_id: str,
         bot_id: Optional[str] = None,
@@ -72,7 +72,7 @@ class EnhancedWorkflowExecutor(BaseWorkflowExecutor):
         Initialize enhanced workflow executor.
 
         Args:
-            workflow: Workflow definition
+            workflow: Workflow definition or CompiledWorkflow
             infra: Infrastructure instance
             workflow_id: Unique workflow identifier
             bot_id: Optional bot identifier
@@ -86,6 +86,11 @@ class EnhancedWorkflowExecutor(BaseWorkflowExecutor):
         self.strategy_id = strategy_id
         self.execution_id: Optional[str] = None
 
+        # State key prefixes, built once instead of per write
+        self._workflow_key = f"workflow:{workflow_id}"
+        self._execution_key: Optional[str] = None
+        self._node_runners: Dict[str, Callable] = {}  # node_id → resilient runner
+
         # Create circuit breaker for external API calls
         self.api_breaker = infra.create_circuit_breaker(
             f"workflow_{workflow_id}_api",
@@ -97,7 +102,7 @@ class EnhancedWorkflowExecutor(BaseWorkflowExecutor):
             workflow_id=workflow_id,
             bot_id=bot_id,
             strategy_id=strategy_id,
-            node_count=len(workflow.get('blocks', []))
+            node_count=len(self.workflow.get('blocks', []))
         )
 
     async def initialize(self):
@@ -131,6 +136,7 @@ class EnhancedWorkflowExecutor(BaseWorkflowExecutor):
         """
         # Generate execution ID for correlation tracking
         self.execution_id = f"exec_{self.workflow_id}_{uuid.uuid4().hex[:8]}"
+        self._execution_key = f"{self._workflow_key}:execution:{self.execution_id}"
         set_correlation_id(self.execution_id)
 
         # Bind logging context
@@ -185,8 +191,7 @@ class EnhancedWorkflowExecutor(BaseWorkflowExecutor):
             )
 
             # Save final state
-            await self._persist_execution_state(result['status'])
-            await self._persist_execution_result(result)
+            await self._persist_execution_state(result['status'], result)
 
             return result
 
@@ -342,6 +347,19 @@ class EnhancedWorkflowExecutor(BaseWorkflowExecutor):
         - Retry logic for transient failures
         - Circuit breaker for external calls
         """
+        runner = self._node_runners.get(node['id'])
+        if runner is None:
+            runner = self._node_runners[node['id']] = self._build_node_runner(node)
+
+        return await runner(node, inputs)
+
+    def _build_node_runner(self, node: Dict[str, Any]) -> Callable:
+        """
+        Build the resilience-wrapped callable for a node.
+
+        The wrapping depends only on the node definition and config, so it is
+        built once per node and reused by every execution.
+        """
         category = node['category']
         node_timeout = node.get('timeout', 30.0)
 
@@ -353,21 +371,21 @@ class EnhancedWorkflowExecutor(BaseWorkflowExecutor):
                 retry_on=(ConnectionError, TimeoutError)
             )
             @with_timeout(node_timeout)
-            async def execute_provider():
+            async def execute_provider(node, inputs):
                 return await self.api_breaker.call(
                     super(EnhancedWorkflowExecutor, self)._execute_provider_node,
                     node,
                     inputs
                 )
 
-            return await execute_provider()
+            return execute_provider
 
         # For other nodes, just add timeout
         @with_timeout(node_timeout)
-        async def execute_regular():
+        async def execute_regular(node, inputs):
             return await super(EnhancedWorkflowExecutor, self)._execute_node(node, inputs)
 
-        return await execute_regular()
+        return execute_regular
 
     async def _emit_event(self, event: Dict[str, Any]):
         """
@@ -415,23 +433,27 @@ class EnhancedWorkflowExecutor(BaseWorkflowExecutor):
 
         await self._emit_event(event)
 
-    async def _persist_execution_state(self, status: str):
+    async def _persist_execution_state(
+        self,
+        status: str,
+        result: Optional[Dict[str, Any]] = None
+    ):
         """
-        Persist current execution state.
+        Persist current execution state (and result, if given) in one write.
 
         Args:
             status: Execution status (running, completed, failed, halted)
+            result: Optional execution result
         """
-        try:
-            await self.infra.state.set(
-                f"workflow:{self.workflow_id}:execution:{self.execution_id}:status",
-                status
-            )
+        items = {
+            f"{self._execution_key}:status": status,
+            f"{self._workflow_key}:latest_execution": self.execution_id
+        }
+        if result is not None:
+            items[f"{self._execution_key}:result"] = result
 
-            await self.infra.state.set(
-                f"workflow:{self.workflow_id}:latest_execution",
-                self.execution_id
-            )
+        try:
+            await self.infra.state.set_many(items)
 
         except Exception as e:
             logger.error(
@@ -440,25 +462,6 @@ class EnhancedWorkflowExecutor(BaseWorkflowExecutor):
                 error=str(e)
             )
 
-    async def _persist_execution_result(self, result: Dict[str, Any]):
-        """
-        Persist execution result.
-
-        Args:
-            result: Execution result
-        """
-        try:
-            await self.infra.state.set(
-                f"workflow:{self.workflow_id}:execution:{self.execution_id}:result",
-                result
-            )
-        except Exception as e:
-            logger.error(
-                "result_persistence_failed",
-                execution_id=self.execution_id,
-                error=str(e)
-            )
-
     async def get_execution_history(self, limit: int = 10) -> list:
         """
         Get execution history for this workflow.
@@ -472,14 +475,14 @@ class EnhancedWorkflowExecutor(BaseWorkflowExecutor):
         # TODO: Implement pagination
         # For now, just return the latest execution
         latest_execution_id = await self.infra.state.get(
-            f"workflow:{self.workflow_id}:latest_execution"
+            f"{self._workflow_key}:latest_execution"
         )
 
         if not latest_execution_id:
             return []
 
         status = await self.infra.state.get(
-            f"workflow:{self.workflow_id}:execution:{latest_execution_id}:status"
+            f"{self._workflow_key}:execution:{latest_execution_id}:status"
         )
 
         return [{
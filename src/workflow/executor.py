@@ -8,16 +8,39 @@ Uses topological sort to determine execution order and executes nodes sequential
 import asyncio
 import logging
 import time
-from typing import Any, Dict, List, Optional, Set
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple, Union
 from collections import defaultdict, deque
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class CompiledWorkflow:
+    """
+    Pre-parsed workflow definition.
+
+    Built once with WorkflowExecutor.compile() and shared by any number of
+    executors, so the node index, input wiring and execution order are not
+    recomputed for every executor or node execution.
+
+    Attributes:
+        workflow: Original workflow definition
+        nodes: Node ID → block definition
+        inputs: Node ID → ((from_node_id, output_name, input_name), ...)
+        execution_order: Topologically sorted node IDs
+    """
+    workflow: Dict[str, Any]
+    nodes: Mapping[str, Dict[str, Any]]
+    inputs: Mapping[str, Tuple[Tuple[str, str, str], ...]]
+    execution_order: Tuple[str, ...]
+
+
 class WorkflowExecutor:
     """Executes workflow-based bots in real-time."""
 
-    def __init__(self, workflow: Dict[str, Any]):
+    def __init__(self, workflow: Union[Dict[str, Any], CompiledWorkflow]):
         """
         Initialize workflow executor.
 
@@ -27,14 +50,83 @@ class WorkflowExecutor:
                     'blocks': [...],
                     'connections': [...]
                 }
+                or a CompiledWorkflow returned by WorkflowExecutor.compile()
         """
-        self.workflow = workflow
+        if isinstance(workflow, CompiledWorkflow):
+            self.compiled: Optional[CompiledWorkflow] = workflow
+            self.workflow = workflow.workflow
+            self._nodes = workflow.nodes
+        else:
+            self.compiled = None
+            self.workflow = workflow
+            self._nodes = self._index_nodes(workflow)
+
         self.providers = {}  # provider_id → provider instance
         self.node_outputs = {}  # node_id → output values
         self.execution_order = []  # Topologically sorted node IDs
         self.start_time = 0
         self.is_running = False
 
+    @classmethod
+    def compile(cls, workflow: Dict[str, Any]) -> CompiledWorkflow:
+        """
+        Pre-parse a workflow definition for repeated execution.
+
+        Walks blocks and connections once, resolving each connection to
+        (from_node_id, output_name, input_name) and computing the execution
+        order. Pass the result to the executor in place of the workflow dict.
+
+        Args:
+            workflow: Workflow definition with blocks and connections
+
+        Returns:
+            CompiledWorkflow
+
+        Raises:
+            ValueError: If the workflow contains cycles or a connection
+                references a missing output/input index
+
+        Usage:
+            COMPILED = WorkflowExecutor.compile(WORKFLOW)
+            executor = WorkflowExecutor(COMPILED)
+        """
+        nodes = cls._index_nodes(workflow)
+        inputs: Dict[str, List[Tuple[str, str, str]]] = defaultdict(list)
+
+        for conn in workflow.get('connections', []):
+            from_node = nodes.get(conn['from']['blockId'])
+            to_node = nodes.get(conn['to']['blockId'])
+            if not from_node or not to_node or not to_node.get('inputs'):
+                continue
+
+            try:
+                output_name = from_node['outputs'][conn['from']['index']]['name']
+                input_name = to_node['inputs'][conn['to']['index']]['name']
+            except (IndexError, KeyError, TypeError) as e:
+                raise ValueError(
+                    f"Invalid connection {conn['from']['blockId']} → "
+                    f"{conn['to']['blockId']}: {e}"
+                ) from e
+
+            inputs[to_node['id']].append((from_node['id'], output_name, input_name))
+
+        return CompiledWorkflow(
+            workflow=workflow,
+            nodes=MappingProxyType(nodes),
+            inputs=MappingProxyType({
+                node_id: tuple(bindings) for node_id, bindings in inputs.items()
+            }),
+            execution_order=tuple(cls._sort_nodes(workflow))
+        )
+
+    @staticmethod
+    def _index_nodes(workflow: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Map node IDs to block definitions (first block wins on duplicates)."""
+        nodes: Dict[str, Dict[str, Any]] = {}
+        for block in workflow['blocks']:
+            nodes.setdefault(block['id'], block)
+        return nodes
+
     async def initialize(self):
         """Initialize all provider nodes and compute execution order."""
         logger.info("Initializing workflow executor")
@@ -45,7 +137,10 @@ class WorkflowExecutor:
                 await self._initialize_provider(block)
 
         # 2. Compute topological execution order
-        self.execution_order = self._topological_sort()
+        if self.compiled is not None:
+            self.execution_order = list(self.compiled.execution_order)
+        else:
+            self.execution_order = self._topological_sort()
         logger.info(f"Execution order: {self.execution_order}")
 
     async def _initialize_provider(self, block: Dict[str, Any]):
@@ -99,19 +194,24 @@ class WorkflowExecutor:
         Returns:
             List of node IDs in execution order
         """
+        return self._sort_nodes(self.workflow)
+
+    @staticmethod
+    def _sort_nodes(workflow: Dict[str, Any]) -> List[str]:
+        """Kahn's algorithm over a workflow definition (see _topological_sort)."""
         # Build dependency graph
         graph = defaultdict(list)  # node -> [dependent_nodes]
         in_degree = defaultdict(int)  # node -> number of dependencies
 
         # Get all node IDs
-        all_nodes = {block['id'] for block in self.workflow['blocks']}
+        all_nodes = {block['id'] for block in workflow['blocks']}
 
         # Initialize in_degree for all nodes
         for node_id in all_nodes:
             in_degree[node_id] = 0
 
         # Build graph from connections
-        for conn in self.workflow.get('connections', []):
+        for conn in workflow.get('connections', []):
             from_node = conn['from']['blockId']
             to_node = conn['to']['blockId']
 
@@ -430,6 +530,12 @@ class WorkflowExecutor:
         """
         inputs = {}
 
+        if self.compiled is not None:
+            for from_node_id, output_name, input_name in self.compiled.inputs.get(node_id, ()):
+                if from_node_id in self.node_outputs:
+                    inputs[input_name] = self.node_outputs[from_node_id].get(output_name)
+            return inputs
+
         for conn in self.workflow.get('connections', []):
             to_node_id = conn['to']['blockId']
 
@@ -467,10 +573,7 @@ class WorkflowExecutor:
         Returns:
             Node definition or None if not found
         """
-        for block in self.workflow['blocks']:
-            if block['id'] == node_id:
-                return block
-        return None
+        return self._nodes.get(node_id)
 
     def stop(self):
         """Stop workflow execution."""
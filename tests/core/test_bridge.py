@@ -8,6 +8,8 @@ from unittest.mock import Mock, AsyncMock, MagicMock
 from datetime import datetime
 
 from src.core.bridge import (
+    _LegacyOpportunityView,
+    LegacyProviderWrapper,
     StrategyBridge,
     OpportunityConverter,
     wrap_legacy_strategy,
@@ -136,6 +138,20 @@ class TestOpportunityConverter:
         assert generic_opp.opportunity_type == OpportunityType.ARBITRAGE
         assert generic_opp.metadata["arbitrage"] is True
 
+    def test_to_generic_uses_opp_type_tag(self):
+        """Test an explicit _opp_type tag wins over key-based inference"""
+        legacy_opp = LegacyOpportunity(
+            strategy_name="test_strategy",
+            timestamp=1700000000000,
+            confidence=0.85,
+            expected_profit=50.0,
+            metadata={"_opp_type": "mean_reversion", "arbitrage": True}
+        )
+
+        generic_opp = OpportunityConverter.to_generic(legacy_opp)
+
+        assert generic_opp.opportunity_type == OpportunityType.MEAN_REVERSION
+
     def test_to_legacy(self):
         """Test converting generic to legacy opportunity"""
         from src.core.strategy import Opportunity
@@ -158,6 +174,62 @@ class TestOpportunityConverter:
         assert legacy_opp.expected_profit == 75.0
         assert legacy_opp.metadata["spread"] == 1.0
 
+    def test_round_trip_keeps_timestamp(self):
+        """Test legacy -> generic -> legacy preserves the millisecond timestamp"""
+        legacy_opp = LegacyOpportunity(
+            strategy_name="test_strategy",
+            timestamp=1700000000123,
+            confidence=0.85,
+            expected_profit=50.0,
+            metadata={}
+        )
+
+        generic_opp = OpportunityConverter.to_generic(legacy_opp)
+
+        assert generic_opp.detected_at == datetime(2023, 11, 14, 22, 13, 20, 123000)
+        assert OpportunityConverter.to_legacy(generic_opp).timestamp == 1700000000123
+
+
+    def test_to_legacy_aware_detected_at(self):
+        """Test timezone-aware detected_at converts to the same UTC timestamp"""
+        from datetime import timedelta, timezone
+        from src.core.strategy import Opportunity
+
+        generic_opp = Opportunity(
+            opportunity_id="test_123",
+            opportunity_type=OpportunityType.ARBITRAGE,
+            strategy_name="test_strategy",
+            confidence=0.9,
+            expected_profit=75.0,
+            expected_cost=10.0,
+            expected_roi=650.0,
+            detected_at=datetime(2023, 11, 15, 0, 13, 20, 123000,
+                                 tzinfo=timezone(timedelta(hours=2)))
+        )
+
+        assert OpportunityConverter.to_legacy(generic_opp).timestamp == 1700000000123
+        assert _LegacyOpportunityView(generic_opp).timestamp == 1700000000123
+
+    def test_legacy_view(self):
+        """Test the legacy view exposes generic opportunity fields"""
+        legacy_opp = LegacyOpportunity(
+            strategy_name="test_strategy",
+            timestamp=1700000000123,
+            confidence=0.85,
+            expected_profit=50.0,
+            metadata={"spread": 0.5}
+        )
+        generic_opp = OpportunityConverter.to_generic(legacy_opp)
+
+        view = _LegacyOpportunityView(generic_opp)
+
+        assert view.strategy_name == "test_strategy"
+        assert view.timestamp == 1700000000123
+        assert view.confidence == 0.85
+        assert view.expected_profit == 50.0
+        assert view.metadata is generic_opp.metadata
+        assert str(view) == str(legacy_opp)
+
 
 class TestStrategyBridge:
     """Test StrategyBridge for wrapping legacy strategies"""
@@ -195,6 +267,23 @@ class TestStrategyBridge:
         assert opportunities[0].expected_profit == 100.0
         assert opportunities[0].confidence == 0.8
 
+    @pytest.mark.asyncio
+    async def test_find_opportunities_across(self):
+        """Test scanning several bridges at once skips failing strategies"""
+        provider = MockProvider()
+        bridges = [
+            StrategyBridge(MockLegacyStrategy(provider=provider, config={}))
+            for _ in range(3)
+        ]
+        bridges[1].legacy_strategy.find_opportunity = AsyncMock(
+            side_effect=RuntimeError("scan failed")
+        )
+
+        opportunities = await StrategyBridge.find_opportunities_across(bridges)
+
+        assert len(opportunities) == 2
+        assert all(opp.expected_profit == 100.0 for opp in opportunities)
+
     @pytest.mark.asyncio
     async def test_execute_opportunity(self):
         """Test executing opportunity through bridge"""
@@ -242,6 +331,70 @@ class TestProviderWrapper:
         await venue.disconnect()
         assert venue.is_connected is False
 
+    def test_legacy_wrapper_reuses_loop(self):
+        """Test sync wrapper calls share one background loop until close()"""
+        venue = wrap_provider_as_venue(MockProvider())
+        venue.list_assets = AsyncMock(return_value=[Mock(symbol="BTC-USDT")])
+        wrapper = LegacyProviderWrapper(venue)
+
+        wrapper.connect()
+        loop = wrapper._loop
+        assert wrapper.get_markets() == ["BTC-USDT"]
+        assert wrapper._loop is loop
+
+        wrapper.close()
+        assert loop.is_closed()
+        assert wrapper._loop is None
+
+    def test_legacy_wrapper_rejects_reentrant_sync_calls(self):
+        """Test sync calls from the wrapper's own loop fail instead of deadlocking"""
+        venue = wrap_provider_as_venue(MockProvider())
+        wrapper = LegacyProviderWrapper(venue)
+
+        async def reenter():
+            return wrapper.get_markets()
+
+        venue.list_assets = reenter
+
+        with pytest.raises(RuntimeError):
+            wrapper.get_markets()
+
+        wrapper.close()
+
+    def test_legacy_wrapper_caches_assets(self):
+        """Test asset lookups are cached per pair until invalidated"""
+        venue = wrap_provider_as_venue(MockProvider())
+        venue.get_asset = AsyncMock(return_value=Mock())
+        venue.get_orderbook = AsyncMock(return_value=Mock())
+        wrapper = LegacyProviderWrapper(venue)
+
+        wrapper.get_orderbook("BTC-USDT")
+        wrapper.get_orderbook("BTC-USDT")
+        assert venue.get_asset.await_count == 1
+        assert venue.get_orderbook.await_count == 2
+
+        wrapper.invalidate_asset("BTC-USDT")
+        wrapper.get_orderbook("BTC-USDT")
+        assert venue.get_asset.await_count == 2
+
+        wrapper.close()
+
+    @pytest.mark.asyncio
+    async def test_legacy_wrapper_async_methods(self):
+        """Test async callers await the venue directly, without the shim loop"""
+        venue = wrap_provider_as_venue(MockProvider())
+        venue.list_assets = AsyncMock(return_value=[Mock(symbol="BTC-USDT")])
+        wrapper = LegacyProviderWrapper(venue)
+
+        await wrapper.aconnect()
+        assert await wrapper.aget_markets() == ["BTC-USDT"]
+        assert wrapper._loop is None
+        assert (await wrapper.aget_balance())["BTC"].available == 1.0
+        assert wrapper.get_balance()["USDT"].total == 10000.0
+        await wrapper.adisconnect()
+
+        wrapper.close()
+
 
 def test_wrap_legacy_strategy_convenience():
     """Test convenience function for wrapping"""
@@ -0,0 +1,77 @@
+"""
+Tests for the base workflow executor.
+"""
+
+import pytest
+
+from src.workflow.executor import CompiledWorkflow, WorkflowExecutor
+
+
+WORKFLOW = {
+    'blocks': [
+        {
+            'id': 'trigger_1',
+            'name': 'Manual Trigger',
+            'category': 'triggers',
+            'type': 'trigger_manual',
+            'outputs': [{'name': 'signal'}],
+        },
+        {
+            'id': 'condition_1',
+            'name': 'Threshold',
+            'category': 'conditions',
+            'type': 'threshold',
+            'inputs': [{'name': 'value'}],
+            'outputs': [{'name': 'pass'}, {'name': 'fail'}],
+        },
+    ],
+    'connections': [
+        {
+            'from': {'blockId': 'trigger_1', 'index': 0},
+            'to': {'blockId': 'condition_1', 'index': 0},
+        }
+    ],
+}
+
+
+class TestCompiledWorkflow:
+    """Test WorkflowExecutor.compile()"""
+
+    def test_compile(self):
+        """Test node index, input wiring and execution order"""
+        compiled = WorkflowExecutor.compile(WORKFLOW)
+
+        assert isinstance(compiled, CompiledWorkflow)
+        assert compiled.workflow is WORKFLOW
+        assert compiled.execution_order == ('trigger_1', 'condition_1')
+        assert compiled.nodes['condition_1'] is WORKFLOW['blocks'][1]
+        assert compiled.inputs['condition_1'] == (('trigger_1', 'signal', 'value'),)
+
+    def test_compile_rejects_cycles(self):
+        """Test compile raises on cyclic workflows"""
+        cyclic = dict(WORKFLOW, connections=WORKFLOW['connections'] + [{
+            'from': {'blockId': 'condition_1', 'index': 0},
+            'to': {'blockId': 'trigger_1', 'index': 0},
+        }])
+        cyclic['blocks'] = [dict(WORKFLOW['blocks'][0], inputs=[{'name': 'in'}]),
+                            WORKFLOW['blocks'][1]]
+
+        with pytest.raises(ValueError):
+            WorkflowExecutor.compile(cyclic)
+
+    @pytest.mark.asyncio
+    async def test_compiled_matches_uncompiled(self):
+        """Test executing a compiled workflow gives the same outputs"""
+        plain = WorkflowExecutor(WORKFLOW)
+        compiled = WorkflowExecutor(WorkflowExecutor.compile(WORKFLOW))
+
+        await plain.initialize()
+        await compiled.initialize()
+
+        plain_result = await plain.execute()
+        compiled_result = await compiled.execute()
+
+        assert compiled.execution_order == plain.execution_order
+        assert compiled_result['status'] == plain_result['status'] == 'completed'
+        assert compiled.node_outputs == plain.node_outputs
+        assert compiled.node_outputs['condition_1'] == {'pass': True}
@@ -13,6 +13,7 @@ from src.infrastructure.config import (
     ResilienceConfig,
     EmergencyConfig,
     get_config,
+    clear_config_cache,
     Environment
 )
 
@@ -209,3 +210,17 @@ def test_config_case_insensitive():
     config3 = get_config("Development")
 
     assert config1.env == config2.env == config3.env
+
+
+def test_get_config_cached_and_frozen():
+    """Test get_config returns one shared, immutable instance per environment"""
+    config = get_config("production")
+
+    assert get_config("production") is config
+    with pytest.raises(Exception):  # Pydantic ValidationError
+        config.emergency.auto_halt_on_limit = False
+
+    env_config = get_config()
+    clear_config_cache()
+    assert get_config("production") is not config
+    assert get_config() is not env_config
@@ -83,6 +83,36 @@ async def test_emergency_resume():
     assert controller.can_trade()
 
 
+@pytest.mark.asyncio
+async def test_emergency_reset():
+    """Test reset clears halt details, metadata and risk limits"""
+    controller = EmergencyController("test_bot")
+
+    with pytest.raises(RiskLimitExceeded):
+        await controller.check_risk_limit("daily_loss", -600.0, -500.0)
+    assert controller.is_halted
+    halted_metadata = controller.get_status()["metadata"]
+    assert halted_metadata
+
+    seen = []
+
+    def handler(event: EmergencyEvent):
+        # Handlers see the fully reset controller
+        seen.append((event.new_state, controller.get_status()["halt_reason"]))
+
+    await controller.subscribe(handler)
+    await controller.reset()
+
+    assert seen == [(EmergencyState.NORMAL, None)]
+    status = controller.get_status()
+    assert controller.is_normal
+    assert status["halt_reason"] is None
+    assert status["metadata"] == {}
+    assert status["risk_limits"] == {}
+    # Earlier snapshots are left alone
+    assert halted_metadata
+
+
 @pytest.mark.asyncio
 async def test_assert_can_trade():
     """Test assert_can_trade raises when halted"""
@@ -339,3 +369,33 @@ async def test_state_change_metadata():
     assert event.metadata["current_loss"] == -520.0
     assert event.metadata["limit"] == -500.0
     assert event.metadata["triggered_by"] == "automatic"
+
+
+@pytest.mark.asyncio
+async def test_handlers_notified_concurrently():
+    """Test a slow handler doesn't delay the others, and sync handlers run"""
+    controller = EmergencyController("test_bot")
+
+    fast_received = asyncio.Event()
+    slow_completed = []
+    sync_received = []
+
+    async def slow_handler(event: EmergencyEvent):
+        # Only finishes if fast_handler runs while this one is still waiting
+        await asyncio.wait_for(fast_received.wait(), timeout=1.0)
+        slow_completed.append(True)
+
+    async def fast_handler(event: EmergencyEvent):
+        fast_received.set()
+
+    def sync_handler(event: EmergencyEvent):
+        sync_received.append(event.new_state)
+
+    await controller.subscribe(slow_handler)
+    await controller.subscribe(fast_handler)
+    await controller.subscribe(sync_handler)
+
+    await controller.halt("Test halt")
+
+    assert slow_completed == [True]
+    assert sync_received == [EmergencyState.HALT]
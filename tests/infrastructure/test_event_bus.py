@@ -6,6 +6,7 @@ Tests both in-memory and Redis backends to ensure interface compliance.
 
 import pytest
 import asyncio
+import json
 from src.infrastructure.events import create_event_bus, EventBus
 
 
@@ -467,6 +468,112 @@ async def test_price_update_stream(bus: EventBus):
     assert prices["ETH-USDT"] == 3012.34
 
 
+class _FakePubSub:
+    """In-process stand-in for a Redis pub/sub connection"""
+
+    def __init__(self):
+        self.messages = asyncio.Queue()
+
+    async def subscribe(self, *channels):
+        pass
+
+    async def unsubscribe(self, *channels):
+        pass
+
+    async def close(self):
+        pass
+
+    def push(self, channel, event):
+        self.messages.put_nowait(
+            {"type": "message", "channel": channel, "data": json.dumps(event)}
+        )
+
+    async def listen(self):
+        while True:
+            yield await self.messages.get()
+
+
+async def _fake_redis_bus():
+    """Redis bus wired to a _FakePubSub, listening"""
+    bus = create_event_bus("redis", url="redis://localhost:6379/15")
+    pubsub = _FakePubSub()
+
+    async def connected():
+        bus._pubsub = pubsub
+
+    bus._ensure_connected = connected
+    await bus.start_listening()
+    return bus, pubsub
+
+
+@pytest.mark.asyncio
+async def test_redis_handler_queue_is_bounded(monkeypatch, capsys):
+    """Test a slow handler's backlog is capped and excess events dropped"""
+    from src.infrastructure.events import redis_bus
+
+    monkeypatch.setattr(redis_bus, "_MAX_PENDING_EVENTS", 2)
+    bus, pubsub = await _fake_redis_bus()
+
+    release = asyncio.Event()
+    received = []
+
+    async def slow_handler(event):
+        await release.wait()
+        received.append(event["n"])
+
+    await bus.subscribe("prices", slow_handler)
+    for n in range(5):
+        pubsub.push("prices", {"n": n})
+    await asyncio.sleep(0.01)
+
+    release.set()
+    await asyncio.sleep(0.01)
+
+    # The listener outruns the drain task: two queued, three dropped
+    assert received == [0, 1]
+    assert "dropped 1 event(s)" in capsys.readouterr().out
+
+    await bus.close()
+
+
+@pytest.mark.asyncio
+async def test_redis_resubscribe_during_backlog_stays_serialized():
+    """Test re-subscribing while a backlog drains reuses the one drain task"""
+    bus, pubsub = await _fake_redis_bus()
+
+    release = asyncio.Event()
+    received = []
+    active = 0
+    max_active = 0
+
+    async def slow_handler(event):
+        nonlocal active, max_active
+        active += 1
+        max_active = max(max_active, active)
+        await release.wait()
+        received.append(event["n"])
+        active -= 1
+
+    await bus.subscribe("prices", slow_handler)
+    pubsub.push("prices", {"n": 0})
+    pubsub.push("prices", {"n": 1})
+    await asyncio.sleep(0.01)
+
+    # Backlog still draining when the handler comes back
+    await bus.unsubscribe("prices", slow_handler)
+    await bus.subscribe("prices", slow_handler)
+    pubsub.push("prices", {"n": 2})
+    await asyncio.sleep(0.01)
+
+    release.set()
+    await asyncio.sleep(0.01)
+
+    assert received == [0, 1, 2]
+    assert max_active == 1
+
+    await bus.close()
+
+
 # Fixture for test suite (needs to be at module level)
 @pytest.fixture
 async def bus():
@@ -295,6 +295,84 @@ async def test_circuit_breaker_half_open_reopens():
     assert breaker.is_open
 
 
+@pytest.mark.asyncio
+async def test_circuit_breaker_custom_clock():
+    """Test circuit breaker timeout uses the injected clock"""
+    now = 100.0
+    breaker = CircuitBreaker(
+        "test",
+        failure_threshold=1,
+        timeout_seconds=30.0,
+        clock=lambda: now
+    )
+
+    async def always_fail():
+        raise ConnectionError("Fail")
+
+    with pytest.raises(ConnectionError):
+        await breaker.call(always_fail)
+
+    assert breaker.is_open
+
+    # Timeout not yet elapsed on the injected clock
+    now = 129.0
+    with pytest.raises(CircuitBreakerOpen):
+        await breaker.call(always_fail)
+
+    # Timeout elapsed: half-open attempt goes through
+    now = 130.0
+    with pytest.raises(ConnectionError):
+        await breaker.call(always_fail)
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_failure_window():
+    """Test failures older than the window do not count toward opening"""
+    now = 0.0
+    breaker = CircuitBreaker(
+        "test",
+        failure_threshold=2,
+        window_seconds=10.0,
+        clock=lambda: now
+    )
+
+    async def always_fail():
+        raise ConnectionError("Fail")
+
+    with pytest.raises(ConnectionError):
+        await breaker.call(always_fail)
+
+    # First failure has left the window
+    now = 11.0
+    with pytest.raises(ConnectionError):
+        await breaker.call(always_fail)
+
+    assert breaker.is_closed
+    assert breaker.get_stats()["recent_failures"] == 1
+
+    # Second failure inside the window opens the circuit
+    now = 12.0
+    with pytest.raises(ConnectionError):
+        await breaker.call(always_fail)
+
+    assert breaker.is_open
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_closed_call_skips_lock():
+    """Test successful calls on a closed circuit don't wait on the lock"""
+    breaker = CircuitBreaker("test", failure_threshold=2)
+
+    async def success_func():
+        return "success"
+
+    async with breaker._lock:
+        result = await asyncio.wait_for(breaker.call(success_func), timeout=1.0)
+
+    assert result == "success"
+    assert breaker.is_closed
+
+
 @pytest.mark.asyncio
 async def test_circuit_breaker_force_open():
     """Test manually forcing circuit breaker open"""
@@ -4,6 +4,7 @@ Tests for State Store implementations
 Tests both in-memory and Redis backends to ensure interface compliance.
 """
 
+import asyncio
 import pytest
 from datetime import timedelta
 from src.infrastructure.state import create_state_store, StateStore
@@ -169,6 +170,14 @@ class StateStoreTestSuite:
         assert result is False
         assert await store.get("unique") == "value1"  # Unchanged
 
+    @pytest.mark.asyncio
+    async def test_set_if_not_exists_concurrent(self, store: StateStore):
+        """Test only one of several concurrent conditional sets wins"""
+        results = await asyncio.gather(*(
+            store.set_if_not_exists("lock", f"owner_{i}") for i in range(10)
+        ))
+        assert results.count(True) == 1
+
     @pytest.mark.asyncio
     async def test_get_and_delete(self, store: StateStore):
         """Test atomic get-and-delete"""
@@ -197,6 +206,34 @@ class TestInMemoryStateStore(StateStoreTestSuite):
         yield store
         await store.close()
 
+    @pytest.mark.asyncio
+    async def test_expired_keys_purged_on_write(self, store):
+        """Test expired keys are dropped even if never read again"""
+        await store.set("stale", "value", ttl=timedelta(milliseconds=10))
+        await asyncio.sleep(0.05)
+
+        await store.set("fresh", "value")
+        assert await store.keys() == ["fresh"]
+
+    @pytest.mark.asyncio
+    async def test_overwrite_without_ttl_persists(self, store):
+        """Test a plain set clears the TTL of a previous write"""
+        await store.set("key", "old", ttl=timedelta(milliseconds=10))
+        await store.set("key", "new")
+        await asyncio.sleep(0.05)
+
+        await store.set("other", "value")
+        assert await store.get("key") == "new"
+
+
+    @pytest.mark.asyncio
+    async def test_refreshed_ttl_keys_keep_expiry_heap_bounded(self, store):
+        """Test rewriting a TTL key does not grow the expiry heap without bound"""
+        for n in range(1000):
+            await store.set("session", n, ttl=timedelta(minutes=5))
+
+        assert len(store._expiries) <= 2 + 64
+        assert await store.get("session") == 999
 
 # Test suite for Redis backend (requires Redis running)
 class TestRedisStateStore(StateStoreTestSuite):
@@ -292,3 +329,32 @@ def test_factory_invalid_backend():
     """Test factory raises error for invalid backend"""
     with pytest.raises(ValueError, match="Unknown state backend"):
         create_state_store("invalid_backend")
+
+
+@pytest.fixture(params=["orjson", "json"])
+def redis_codec(request, monkeypatch):
+    """Redis store (de)serializers, with and without orjson"""
+    from src.infrastructure.state import redis_store
+
+    if request.param == "orjson":
+        if not redis_store.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(redis_store, "ORJSON_AVAILABLE", False)
+    return redis_store
+
+
+def test_redis_codec_round_trip(redis_codec):
+    """Test both serializers store the same values the same way"""
+    import math
+    from datetime import datetime
+
+    value = {"name": "Alice", "scores": [95, 87.5], "big": 2 ** 70, "nested": {"ok": True}}
+    assert redis_codec._loads(redis_codec._dumps(value)) == value
+    assert redis_codec._loads(redis_codec._dumps({1: "a"})) == {"1": "a"}
+
+    # stdlib json's NaN literal stays readable
+    assert math.isnan(redis_codec._loads('{"x": NaN}')["x"])
+
+    with pytest.raises(TypeError):
+        redis_codec._dumps({"at": datetime(2024, 1, 1)})